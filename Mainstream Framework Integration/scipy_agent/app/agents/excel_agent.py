@@ -1,6 +1,12 @@
+import asyncio
+from functools import partial
+
 from pipeline.routing_pipeline import RoutingPipeline
 from pipeline.execution_pipeline import ExecutionPipeline
 from pipeline.report_pipeline import ReportPipeline
+from excel.session import WorkbookSession
+from telemetry.profiler import Profiler
+from config import TRACE_PATH
 
 
 class ExcelAgent:
@@ -10,20 +16,140 @@ class ExcelAgent:
         self.executor = ExecutionPipeline()
         self.reporter = ReportPipeline()
 
-    def run(self, file_path, output_file, user_request):
+    def run(self, file_path, output_file, user_request, chunk_rows=None):
+
+        if chunk_rows:
+            return self.run_chunked(
+                file_path, output_file, user_request, chunk_rows
+            )
 
         print("Reading and planning...")
 
-        plan = self.router.route(
-            file_path=file_path,
-            request=user_request
-        )
+        profiler = Profiler()
+
+        # Parsed once, shared by every stage, saved once at the end
+        session = WorkbookSession(file_path)
+
+        with profiler.span("plan"):
+            plan = self.router.route(
+                request=user_request,
+                session=session
+            )
 
         print(plan)
 
         results = self.executor.execute(
-            file_path=file_path,
-            plan=plan
+            plan=plan,
+            session=session,
+            profiler=profiler
+        )
+
+        with profiler.span("report"):
+            self.reporter.generate(results,output_file)
+
+        with profiler.span("save"):
+            session.save()
+
+        return self.finish_trace(results, profiler)
+
+    async def arun(self, file_path, output_file, user_request):
+
+        # Same stages as run(), but the LLM planning request overlaps with
+        # workbook parsing and column profiling. Blocking Aspose, SciPy and
+        # network work runs in the loop's default executor.
+        loop = asyncio.get_running_loop()
+
+        profiler = Profiler()
+
+        session = WorkbookSession(file_path)
+
+        def timed(name, func, *args, **kwargs):
+            with profiler.span(name):
+                return func(*args, **kwargs)
+
+        plan, _ = await asyncio.gather(
+            loop.run_in_executor(
+                None,
+                partial(timed, "plan", self.router.route,
+                        request=user_request, session=session)
+            ),
+            loop.run_in_executor(
+                None,
+                partial(timed, "load", session.numeric_frame)
+            )
         )
 
-        self.reporter.generate(results,output_file)
\ No newline at end of file
+        print(plan)
+
+        results = await loop.run_in_executor(
+            None,
+            partial(self.executor.execute, plan=plan, session=session,
+                    profiler=profiler)
+        )
+
+        await loop.run_in_executor(
+            None,
+            partial(timed, "report", self.reporter.generate, results, output_file)
+        )
+
+        await loop.run_in_executor(None, partial(timed, "save", session.save))
+
+        return self.finish_trace(results, profiler)
+
+    async def arun_batch(self, jobs, concurrency=4):
+
+        # jobs: iterable of (file_path, output_file, user_request).
+        # Returns results in job order; a failed job yields its exception.
+        limit = asyncio.Semaphore(concurrency)
+
+        async def run_one(file_path, output_file, user_request):
+            async with limit:
+                return await self.arun(file_path, output_file, user_request)
+
+        return await asyncio.gather(
+            *(run_one(*job) for job in jobs),
+            return_exceptions=True
+        )
+
+    def run_batch(self, jobs, concurrency=4):
+        return asyncio.run(self.arun_batch(jobs, concurrency))
+
+    def run_chunked(self, file_path, output_file, user_request, chunk_rows):
+
+        # Bounded-memory mode: the sheet is streamed, never loaded whole,
+        # so anomalies are reported but not highlighted in the source file
+        from pipeline.streaming_pipeline import StreamingExecutionPipeline
+
+        print("Planning (chunked mode)...")
+
+        profiler = Profiler()
+
+        with profiler.span("plan"):
+            plan = self.router.route(request=user_request)
+
+        print(plan)
+
+        with profiler.span("stream"):
+            results = StreamingExecutionPipeline(chunk_rows=chunk_rows).execute(
+                plan=plan,
+                file_path=file_path
+            )
+
+        with profiler.span("report"):
+            self.reporter.generate(results,output_file)
+
+        return self.finish_trace(results, profiler)
+
+    @staticmethod
+    def finish_trace(results, profiler, trace_path=None):
+
+        # Final summary (report and save included) replaces the one the
+        # execution pipeline attached; the span log goes to the trace file
+        results["telemetry"] = profiler.summary()
+
+        trace_path = trace_path or TRACE_PATH
+
+        if trace_path:
+            profiler.export(trace_path)
+
+        return results
\ No newline at end of file
@@ -11,14 +11,54 @@ class AnomalyAnalysis:
 
         z_scores = np.abs(stats.zscore(arr))
 
-        anomalies = []
+        flagged = np.flatnonzero(z_scores > threshold)
 
-        for i, z in enumerate(z_scores):
-            if z > threshold:
-                anomalies.append({
-                    "index": i,
-                    "value": arr[i],
-                    "zscore": float(z)
-                })
+        return [
+            {
+                "index": int(i),
+                "value": arr[i],
+                "zscore": float(z_scores[i])
+            }
+            for i in flagged
+        ]
 
-        return anomalies
\ No newline at end of file
+    @staticmethod
+    def detect_zscore_batch(matrix, threshold=3, as_records=False):
+
+        # matrix: rows x columns, NaN for missing cells. Each column's
+        # values are moved up past its missing cells first, so indices
+        # count non-missing values as detect_zscore on the dropped column
+        arr = np.asarray(matrix, dtype=float)
+        arr = np.take_along_axis(
+            arr, np.argsort(np.isnan(arr), axis=0, kind="stable"), axis=0
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z_scores = np.abs(
+                (arr - np.nanmean(arr, axis=0)) / np.nanstd(arr, axis=0)
+            )
+
+        mask = z_scores > threshold
+
+        rows, cols = np.nonzero(mask)
+
+        result = {
+            "mask": mask,
+            "rows": rows,
+            "columns": cols
+        }
+
+        if as_records:
+            result["records"] = [
+                [
+                    {
+                        "index": int(i),
+                        "value": arr[i, c],
+                        "zscore": float(z_scores[i, c])
+                    }
+                    for i in np.flatnonzero(mask[:, c])
+                ]
+                for c in range(arr.shape[1])
+            ]
+
+        return result
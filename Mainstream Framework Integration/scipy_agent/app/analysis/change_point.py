@@ -12,13 +12,53 @@ class ChangePointAnalysis:
 
         threshold = np.std(diffs) * 2
 
-        result = []
+        flagged = np.flatnonzero(np.abs(diffs) > threshold)
 
-        for i, d in enumerate(diffs):
-            if abs(d) > threshold:
-                result.append({
-                    "position": i,
-                    "change": float(d)
-                })
+        return [
+            {
+                "position": int(i),
+                "change": float(diffs[i])
+            }
+            for i in flagged
+        ]
 
-        return result
\ No newline at end of file
+    @staticmethod
+    def detect_batch(matrix, as_records=False):
+
+        # matrix: rows x columns, NaN for missing cells. Each column's
+        # values are moved up past its missing cells first, so changes
+        # are taken between consecutive non-missing values, as detect on
+        # the dropped column (no diff spans a gap)
+        arr = np.asarray(matrix, dtype=float)
+        arr = np.take_along_axis(
+            arr, np.argsort(np.isnan(arr), axis=0, kind="stable"), axis=0
+        )
+
+        diffs = np.diff(arr, axis=0)
+
+        threshold = np.nanstd(diffs, axis=0) * 2
+
+        mask = np.abs(diffs) > threshold
+
+        positions, cols = np.nonzero(mask)
+
+        result = {
+            "mask": mask,
+            "positions": positions,
+            "columns": cols,
+            "threshold": threshold
+        }
+
+        if as_records:
+            result["records"] = [
+                [
+                    {
+                        "position": int(i),
+                        "change": float(diffs[i, c])
+                    }
+                    for i in np.flatnonzero(mask[:, c])
+                ]
+                for c in range(arr.shape[1])
+            ]
+
+        return result
@@ -1,15 +1,61 @@
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 
 
 class ClusteringAnalysis:
 
     @staticmethod
-    def cluster(values, k=3):
+    def cluster(values, k=3, large_rows=None):
 
-        arr = np.array(values).reshape(-1, 1)
+        arr = np.array(values, dtype=float).reshape(-1, 1)
 
-        model = KMeans(n_clusters=k, n_init=10)
+        model = ClusteringAnalysis._model(len(arr), k, large_rows)
         labels = model.fit_predict(arr)
 
-        return labels.tolist()
\ No newline at end of file
+        return labels
+
+    @staticmethod
+    def cluster_frame(df, k=3, large_rows=None):
+
+        # Clusters rows on all numeric columns together. Columns are
+        # standardised so no single scale dominates; rows with a missing
+        # value get label -1. Centers are reported in original units.
+        numeric = df.select_dtypes(include=['number'])
+
+        arr = numeric.to_numpy(dtype=float)
+        complete = ~np.isnan(arr).any(axis=1)
+
+        data = arr[complete]
+
+        mean = data.mean(axis=0)
+        scale = data.std(axis=0)
+        scale[scale == 0] = 1.0
+
+        model = ClusteringAnalysis._model(len(data), k, large_rows)
+        fitted = model.fit_predict((data - mean) / scale)
+
+        labels = np.full(len(arr), -1, dtype=np.int32)
+        labels[complete] = fitted
+
+        return {
+            "labels": labels,
+            "centers": model.cluster_centers_ * scale + mean,
+            "sizes": np.bincount(fitted, minlength=model.n_clusters)
+        }
+
+    @staticmethod
+    def _model(rows, k, large_rows):
+
+        k = max(min(k, rows), 1)
+
+        # Mini-batch updates keep the cost per iteration independent of
+        # the row count once the data is large
+        if large_rows is not None and rows > large_rows:
+            return MiniBatchKMeans(
+                n_clusters=k,
+                batch_size=4096,
+                n_init=3,
+                random_state=0
+            )
+
+        return KMeans(n_clusters=k, n_init=10, random_state=0)
@@ -1,11 +1,287 @@
-import pandas as pd
+import numpy as np
+from scipy.stats import kendalltau
+
+METHODS = ("pearson", "spearman", "kendall")
+
+# Longer frames compute Kendall pair by pair with scipy's O(n log n)
+# kendalltau; the matrix form costs O(n^2) per column pair
+KENDALL_MATRIX_ROWS = 2000
+
+# Row pairs x columns held at once by the Kendall matrix form
+KENDALL_CHUNK = 1 << 22
 
 
 class CorrelationAnalysis:
 
     @staticmethod
-    def correlation_matrix(df):
+    def correlation_matrix(df, method="pearson", top_k=20, dense=True,
+                           block_size=256, dtype=np.float64):
+
+        # Pairwise-complete correlation of every numeric column pair,
+        # computed block by block so only block_size x block_size partial
+        # sums are alive at once. Spearman is Pearson over the column
+        # ranks (ties averaged), each column ranked once over its own
+        # values; where gaps differ between two columns this is not
+        # re-ranked on their shared rows as pandas does, and can differ
+        # slightly from it. Kendall's tau-b is summed over row pairs with
+        # the same masked products.
+        #
+        # Returns the top_k strongest pairs and, when dense is set, the
+        # full matrix as an array. Without dense only the running top_k
+        # pairs are kept between blocks.
+        if method not in METHODS:
+            raise ValueError(f"Unknown correlation method: {method}")
+
+        numeric = df.select_dtypes(include=['number'])
+        columns = [str(c) for c in numeric.columns]
+
+        if method == "kendall":
+            matrix, counts = CorrelationAnalysis._kendall(numeric)
+
+            return CorrelationAnalysis.summarize(
+                matrix, columns, counts, method, top_k, dense
+            )
+
+        if method == "spearman":
+            numeric = numeric.rank()
+
+        arr = numeric.to_numpy(dtype=dtype)
+
+        # Correlation is shift invariant; centring first keeps the
+        # one-pass sums below well conditioned
+        arr = arr - np.nanmean(arr, axis=0)
+
+        width = arr.shape[1]
+
+        if dense:
+            matrix = np.empty((width, width), dtype=dtype)
+            counts = np.empty((width, width), dtype=np.int64)
+        else:
+            best = CorrelationAnalysis._no_pairs(dtype)
+
+        for start_i in range(0, width, block_size):
+
+            i = slice(start_i, start_i + block_size)
+            values_i, squares_i, mask_i = CorrelationAnalysis._block(
+                arr[:, i], dtype
+            )
+
+            for start_j in range(start_i, width, block_size):
+
+                j = slice(start_j, start_j + block_size)
+                values_j, squares_j, mask_j = CorrelationAnalysis._block(
+                    arr[:, j], dtype
+                )
+
+                n = mask_i.T @ mask_j
+                sx = values_i.T @ mask_j
+                sy = mask_i.T @ values_j
+                sxx = squares_i.T @ mask_j
+                syy = mask_i.T @ squares_j
+                sxy = values_i.T @ values_j
+
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    block = (n * sxy - sx * sy) / np.sqrt(
+                        (n * sxx - sx ** 2) * (n * syy - sy ** 2)
+                    )
+
+                block = np.clip(block, -1, 1)
+                block[n < 2] = np.nan
+
+                if dense:
+                    matrix[i, j] = block
+                    matrix[j, i] = block.T
+                    counts[i, j] = n
+                    counts[j, i] = n.T
+                    continue
+
+                # Upper triangle of the block in global indices
+                rows, cols = np.nonzero(
+                    np.arange(start_i, start_i + block.shape[0])[:, None]
+                    < np.arange(start_j, start_j + block.shape[1])[None, :]
+                )
+
+                best = CorrelationAnalysis._top(
+                    [
+                        best,
+                        (
+                            rows + start_i,
+                            cols + start_j,
+                            block[rows, cols],
+                            n[rows, cols].astype(np.int64)
+                        )
+                    ],
+                    top_k
+                )
+
+        if dense:
+            return CorrelationAnalysis.summarize(
+                matrix, columns, counts, method, top_k, dense
+            )
+
+        return CorrelationAnalysis._result(method, columns, *best)
+
+    @staticmethod
+    def summarize(matrix, columns, counts=None, method="pearson", top_k=20,
+                  dense=True):
+
+        # Strongest pairs of a symmetric correlation matrix by |r|,
+        # upper triangle only
+        rows, cols = np.triu_indices(len(columns), k=1)
+
+        pairs = CorrelationAnalysis._top(
+            [(
+                rows,
+                cols,
+                matrix[rows, cols],
+                (
+                    counts[rows, cols]
+                    if counts is not None
+                    else np.full(len(rows), np.nan)
+                )
+            )],
+            top_k
+        )
+
+        result = CorrelationAnalysis._result(method, columns, *pairs)
+
+        if dense:
+            result["matrix"] = matrix
+
+        return result
+
+    @staticmethod
+    def _block(arr, dtype):
+
+        # Zero-filled values, their squares and the validity mask of a
+        # column block
+        valid = ~np.isnan(arr)
+        values = np.where(valid, arr, 0)
+
+        return values, values ** 2, valid.astype(dtype)
+
+    @staticmethod
+    def _no_pairs(dtype):
+
+        return (
+            np.empty(0, dtype=np.intp),
+            np.empty(0, dtype=np.intp),
+            np.empty(0, dtype=dtype),
+            np.empty(0, dtype=np.int64)
+        )
+
+    @staticmethod
+    def _top(candidates, top_k):
+
+        # The top_k (row, col, r, n) pairs by |r| among the candidate
+        # groups, strongest first; NaN correlations are dropped
+        rows, cols, corr, counts = (
+            np.concatenate(parts) for parts in zip(*candidates)
+        )
+
+        strength = np.abs(corr)
+        strength = np.where(np.isnan(strength), -1.0, strength)
+
+        k = min(top_k, len(strength))
+
+        if k < len(strength):
+            best = np.argpartition(strength, -k)[-k:]
+        else:
+            best = np.arange(len(strength))
+
+        best = best[np.argsort(strength[best])[::-1]]
+        best = best[strength[best] >= 0]
+
+        return rows[best], cols[best], corr[best], counts[best]
+
+    @staticmethod
+    def _result(method, columns, rows, cols, corr, counts):
+
+        names = np.array(columns, dtype=object)
+
+        return {
+            "method": method,
+            "columns": list(columns),
+            "pairs": {
+                "x": names[rows],
+                "y": names[cols],
+                "correlation": corr,
+                "observations": counts
+            }
+        }
+
+    @staticmethod
+    def _kendall(numeric):
+
+        arr = numeric.to_numpy(dtype=float)
+        valid = ~np.isnan(arr)
+
+        length, width = arr.shape
+
+        counts = valid.T.astype(np.int64) @ valid.astype(np.int64)
+
+        if length > KENDALL_MATRIX_ROWS:
+            return CorrelationAnalysis._kendall_pairwise(arr, valid), counts
+
+        # For every row pair (a, b), a < b: the sign of each column's
+        # difference, whether both rows are present, and whether they
+        # tie. Summed over row pairs, S = D'D is concordant minus
+        # discordant, N = V'V the pairs present in both columns and
+        # T'V the pairs of those tied in the first column.
+        score = np.zeros((width, width))
+        pairs = np.zeros((width, width))
+        ties = np.zeros((width, width))
+
+        step = max(KENDALL_CHUNK // max(length * width, 1), 1)
+
+        for start in range(0, length, step):
+
+            a = np.arange(start, min(start + step, length))
+            later = np.arange(length)[None, :] > a[:, None]
+
+            ai, bi = np.nonzero(later)
+            ai = a[ai]
+
+            # Per-chunk sums are exact in float32 (chunks hold far fewer
+            # than 2^24 row pairs) and BLAS runs twice as fast on them
+            present = (valid[ai] & valid[bi]).astype(np.float32)
+
+            with np.errstate(invalid="ignore"):
+                sign = np.sign(arr[bi] - arr[ai]).astype(np.float32)
+
+            sign = np.where(present > 0, sign, np.float32(0))
+            tied = present * (sign == 0)
+
+            score += sign.T @ sign
+            pairs += present.T @ present
+            ties += tied.T @ present
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            matrix = score / np.sqrt((pairs - ties) * (pairs - ties.T))
+
+        matrix = np.clip(matrix, -1, 1)
+        matrix[counts < 2] = np.nan
+        np.fill_diagonal(matrix, 1.0)
+
+        return matrix, counts
+
+    @staticmethod
+    def _kendall_pairwise(arr, valid):
+
+        width = arr.shape[1]
+
+        matrix = np.eye(width)
+
+        for i in range(width):
+            for j in range(i + 1, width):
+
+                both = valid[:, i] & valid[:, j]
+
+                if both.sum() < 2:
+                    tau = np.nan
+                else:
+                    tau = kendalltau(arr[both, i], arr[both, j]).statistic
 
-        numeric_df = df.select_dtypes(include=['number'])
+                matrix[i, j] = matrix[j, i] = tau
 
-        return numeric_df.corr().to_dict()
\ No newline at end of file
+        return matrix
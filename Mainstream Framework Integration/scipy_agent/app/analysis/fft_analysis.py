@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.fft import fft
+from scipy.fft import rfft
 
 
 class FFTAnalysis:
@@ -9,8 +9,9 @@ class FFTAnalysis:
 
         arr = np.array(values, dtype=float)
 
-        spectrum = fft(arr)
+        # Input is real, so the upper half of the full spectrum mirrors
+        # the lower half; keep only the non-redundant bins
+        spectrum = rfft(arr)
 
-        magnitude = np.abs(spectrum)
+        return np.abs(spectrum)
 
-        return magnitude.tolist()
\ No newline at end of file
@@ -2,6 +2,10 @@ import numpy as np
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
 
+# Coarse grid points a warm start is checked against
+WARM_CHECK_POINTS = 7
+
+
 class ForecastingAnalysis:
 
     @staticmethod
@@ -14,4 +18,215 @@ class ForecastingAnalysis:
 
         forecast = fit.forecast(steps)
 
-        return forecast.tolist()
\ No newline at end of file
+        return forecast.tolist()
+
+    @staticmethod
+    def forecast_batch(matrix, steps=5, trend=False, known_params=None,
+                       grid_size=25):
+
+        # Fits simple (or Holt linear-trend) exponential smoothing to every
+        # column of a (time x series) matrix at once. NaN cells are
+        # skipped, so ragged columns can be NaN-padded at the end.
+        #
+        # The smoothing recursions are linear in the initial level/trend,
+        # so for each candidate alpha (and beta) the optimal initial state
+        # and its SSE come from a 1x1 / 2x2 least-squares solve; the
+        # parameter grid itself is searched for all series together, then
+        # refined per series around the best point.
+        #
+        # known_params: {column index: {"alpha": .., "beta": ..}} from a
+        # previous fit, used as warm starts instead of the coarse search.
+        # A warm start is checked against a sparse slice of the coarse
+        # grid; a column where any checked point fits better is searched
+        # again from scratch.
+        #
+        # Returns (forecasts, params): a (steps x series) array and one
+        # dict of fitted parameters per column.
+        y = np.asarray(matrix, dtype=float)
+
+        if y.ndim == 1:
+            y = y[:, None]
+
+        n_series = y.shape[1]
+        known_params = known_params or {}
+
+        step = 1.0 / grid_size
+        coarse = np.linspace(step / 2, 1 - step / 2, grid_size)
+
+        if trend:
+            betas = np.linspace(step / 2, 1 - step / 2, max(grid_size // 3, 2))
+            alpha_grid = np.repeat(coarse, len(betas))
+            beta_grid = np.tile(betas, len(coarse))
+        else:
+            alpha_grid = coarse
+            beta_grid = np.zeros_like(coarse)
+
+        # -------------------------
+        # Coarse search, shared grid
+        # -------------------------
+        # Warm-started columns skip it and only get the narrower fine
+        # search around their previous parameters
+        center_alpha = np.zeros(n_series)
+        center_beta = np.zeros(n_series)
+        width = np.full(n_series, step)
+
+        for c, params in known_params.items():
+            center_alpha[c] = params["alpha"]
+            center_beta[c] = params.get("beta", 0.0)
+            width[c] = step / 4
+
+        search = np.setdiff1d(np.arange(n_series), list(known_params))
+
+        if len(search):
+            shape = (len(alpha_grid), len(search))
+            alpha = np.broadcast_to(alpha_grid[:, None], shape)
+            beta = np.broadcast_to(beta_grid[:, None], shape)
+
+            sse, _, _ = ForecastingAnalysis._fit_grid(
+                y[:, search], alpha, beta, trend
+            )
+
+            best = np.argmin(np.where(np.isnan(sse), np.inf, sse), axis=0)
+
+            center_alpha[search] = alpha_grid[best]
+            center_beta[search] = beta_grid[best]
+
+        # -------------------------
+        # Fine search, per series
+        # -------------------------
+        offsets = np.linspace(-1, 1, 9)
+
+        if trend:
+            alpha = np.repeat(offsets, len(offsets))[:, None] * width + center_alpha
+            beta = np.tile(offsets, len(offsets))[:, None] * width + center_beta
+        else:
+            alpha = offsets[:, None] * width + center_alpha
+            beta = np.zeros_like(alpha)
+
+        alpha = np.clip(alpha, 1e-4, 1 - 1e-4)
+        beta = np.clip(beta, 0.0 if not trend else 1e-4, 1 - 1e-4)
+
+        sse, level, slope = ForecastingAnalysis._fit_grid(y, alpha, beta, trend)
+
+        best = np.argmin(np.where(np.isnan(sse), np.inf, sse), axis=0)
+        cols = np.arange(n_series)
+
+        horizon = np.arange(1, steps + 1)[:, None]
+        forecasts = level[best, cols] + horizon * slope[best, cols]
+
+        params = [
+            {
+                "alpha": float(alpha[best[c], c]),
+                "beta": float(beta[best[c], c]),
+                "sse": float(sse[best[c], c])
+            }
+            for c in range(n_series)
+        ]
+
+        # -------------------------
+        # Warm start check
+        # -------------------------
+        warm = np.array(sorted(known_params), dtype=np.intp)
+
+        if len(warm):
+            picks = np.linspace(0, len(alpha_grid) - 1, WARM_CHECK_POINTS)
+            picks = np.unique(picks.round().astype(np.intp))
+
+            shape = (len(picks), len(warm))
+
+            check, _, _ = ForecastingAnalysis._fit_grid(
+                y[:, warm],
+                np.broadcast_to(alpha_grid[picks][:, None], shape),
+                np.broadcast_to(beta_grid[picks][:, None], shape),
+                trend
+            )
+
+            check = np.where(np.isnan(check), np.inf, check).min(axis=0)
+            fitted = sse[best[warm], warm]
+
+            stale = warm[check < fitted]
+
+            if len(stale):
+                redo, redo_params = ForecastingAnalysis.forecast_batch(
+                    y[:, stale], steps=steps, trend=trend, grid_size=grid_size
+                )
+
+                forecasts[:, stale] = redo
+
+                for c, fit in zip(stale, redo_params):
+                    params[c] = fit
+
+        return forecasts, params
+
+    @staticmethod
+    def _fit_grid(y, alpha, beta, trend):
+
+        # Runs the recursion for every (parameter, series) pair with three
+        # initial states: zero, unit level and unit trend. The forecast
+        # error for any initial state (l0, b0) is then
+        #     e = e_zero - l0 * g_level - b0 * g_trend
+        # which is minimised in closed form.
+        n_params, n_series = alpha.shape
+        variants = 3 if trend else 2
+
+        level = np.zeros((variants, n_params, n_series))
+        slope = np.zeros((variants, n_params, n_series))
+
+        level[1] = 1.0
+        if trend:
+            slope[2] = 1.0
+
+        # Normal-equation sums
+        s_ee = np.zeros((n_params, n_series))
+        s_ge = np.zeros((variants - 1, n_params, n_series))
+        s_gg = np.zeros((variants - 1, variants - 1, n_params, n_series))
+
+        for t in range(y.shape[0]):
+
+            obs = y[t]
+            valid = ~np.isnan(obs)
+
+            if not valid.any():
+                continue
+
+            value = np.where(valid, obs, 0.0)
+
+            prediction = level + slope
+
+            error = value - prediction[0]
+            gains = prediction[1:]
+
+            s_ee += np.where(valid, error ** 2, 0.0)
+            s_ge += np.where(valid, gains * error, 0.0)
+            s_gg += np.where(valid, gains[:, None] * gains[None, :], 0.0)
+
+            # Zero variant sees the data, the unit variants only carry
+            # the homogeneous part of the recursion
+            observed = np.zeros_like(level)
+            observed[0] = value
+
+            new_level = alpha * observed + (1 - alpha) * prediction
+            new_slope = beta * (new_level - level) + (1 - beta) * slope
+
+            level = np.where(valid, new_level, level)
+            slope = np.where(valid, new_slope, slope) if trend else slope
+
+        # Solve for the optimal initial state per (parameter, series)
+        gram = np.moveaxis(s_gg, (0, 1), (-2, -1))
+        rhs = np.moveaxis(s_ge, 0, -1)[..., None]
+
+        ridge = 1e-9 * np.eye(variants - 1)
+        init = np.linalg.solve(gram + ridge, rhs)[..., 0]
+
+        sse = s_ee - 2 * (init * rhs[..., 0]).sum(axis=-1) \
+            + np.einsum("...i,...ij,...j->...", init, gram, init)
+
+        init = np.moveaxis(init, -1, 0)
+
+        final_level = level[0] + np.einsum("k...,k...->...", init, level[1:])
+        final_slope = slope[0] + np.einsum("k...,k...->...", init, slope[1:])
+
+        count = (~np.isnan(y)).sum(axis=0)
+        sse = np.where(count >= 2, sse, np.nan)
+
+        return sse, final_level, final_slope
@@ -15,13 +15,56 @@ class OutlierAnalysis:
         lower = q1 - 1.5 * iqr
         upper = q3 + 1.5 * iqr
 
-        result = []
+        flagged = np.flatnonzero((arr < lower) | (arr > upper))
 
-        for i, v in enumerate(arr):
-            if v < lower or v > upper:
-                result.append({
-                    "index": i,
-                    "value": float(v)
-                })
+        return [
+            {
+                "index": int(i),
+                "value": float(arr[i])
+            }
+            for i in flagged
+        ]
 
-        return result
\ No newline at end of file
+    @staticmethod
+    def iqr_outliers_batch(matrix, as_records=False):
+
+        # matrix: rows x columns, NaN for missing cells. Each column's
+        # values are moved up past its missing cells first, so indices
+        # count non-missing values as iqr_outliers on the dropped column
+        arr = np.asarray(matrix, dtype=float)
+        arr = np.take_along_axis(
+            arr, np.argsort(np.isnan(arr), axis=0, kind="stable"), axis=0
+        )
+
+        q1, q3 = np.nanpercentile(arr, [25, 75], axis=0)
+
+        iqr = q3 - q1
+
+        lower = q1 - 1.5 * iqr
+        upper = q3 + 1.5 * iqr
+
+        mask = (arr < lower) | (arr > upper)
+
+        rows, cols = np.nonzero(mask)
+
+        result = {
+            "mask": mask,
+            "rows": rows,
+            "columns": cols,
+            "lower": lower,
+            "upper": upper
+        }
+
+        if as_records:
+            result["records"] = [
+                [
+                    {
+                        "index": int(i),
+                        "value": float(arr[i, c])
+                    }
+                    for i in np.flatnonzero(mask[:, c])
+                ]
+                for c in range(arr.shape[1])
+            ]
+
+        return result
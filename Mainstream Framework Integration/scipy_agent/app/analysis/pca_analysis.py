@@ -1,18 +1,45 @@
-from sklearn.decomposition import PCA
+import numpy as np
+from sklearn.decomposition import PCA, IncrementalPCA
 import pandas as pd
 
 class PCAAnalysis:
 
     @staticmethod
-    def analyze(df):
+    def analyze(df, n_components=2, large_rows=None, preview_rows=1000,
+                batch_size=50_000):
 
-        numeric = df.select_dtypes(include=['number'])
+        # Exact PCA for small frames; above large_rows the fit streams
+        # through IncrementalPCA in batch_size slices, and very wide
+        # frames use the randomized SVD solver.
+        #
+        # Projected rows are returned as an array only up to preview_rows;
+        # larger frames get an evenly spaced preview plus the row
+        # positions it was taken from.
+        numeric = df.select_dtypes(include=['number']).dropna()
 
-        pca = PCA(n_components=2)
+        arr = numeric.to_numpy(dtype=float)
+        rows, cols = arr.shape
 
-        components = pca.fit_transform(numeric)
+        n_components = min(n_components, rows, cols)
+
+        if large_rows is not None and rows > large_rows:
+            pca = IncrementalPCA(
+                n_components=n_components,
+                batch_size=max(batch_size, 5 * cols)
+            )
+            pca.fit(arr)
+        else:
+            solver = "randomized" if cols > 10 * n_components and cols > 50 else "full"
+            pca = PCA(n_components=n_components, svd_solver=solver, random_state=0)
+            pca.fit(arr)
+
+        if rows > preview_rows:
+            index = np.linspace(0, rows - 1, preview_rows).astype(np.int64)
+        else:
+            index = np.arange(rows)
 
         return {
-            "explained_variance": pca.explained_variance_ratio_.tolist(),
-            "components": components.tolist()
-        }
\ No newline at end of file
+            "explained_variance": pca.explained_variance_ratio_,
+            "components": pca.transform(arr[index]),
+            "rows": numeric.index.to_numpy()[index]
+        }
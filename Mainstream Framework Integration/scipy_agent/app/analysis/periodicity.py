@@ -0,0 +1,78 @@
+import numpy as np
+from scipy.fft import rfft
+
+
+class PeriodicityAnalysis:
+
+    @staticmethod
+    def detect(matrix, top_k=3, min_strength=0.2):
+
+        # Dominant periods for every column of a (time x series) matrix
+        # in one real-FFT pass. Columns are linearly detrended over their
+        # non-NaN cells (NaN then counts as zero), the spectrum's local
+        # maxima are ranked by power and the top_k kept.
+        #
+        # strength is the share of non-DC spectral power in the top peak;
+        # a column is significant when that share reaches min_strength
+        # and the period fits at least twice in the series.
+        #
+        # Returns compact arrays: periods and powers (series x top_k,
+        # NaN-padded), strength and significant (series,).
+        y = np.asarray(matrix, dtype=float)
+
+        if y.ndim == 1:
+            y = y[:, None]
+
+        length, n_series = y.shape
+
+        valid = ~np.isnan(y)
+        count = valid.sum(axis=0)
+
+        # -------------------------
+        # Vectorised linear detrend
+        # -------------------------
+        t = np.arange(length, dtype=float)[:, None]
+        values = np.where(valid, y, 0.0)
+        tv = np.where(valid, t, 0.0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sum_t, sum_y = tv.sum(axis=0), values.sum(axis=0)
+            sum_tt, sum_ty = (tv ** 2).sum(axis=0), (tv * values).sum(axis=0)
+
+            slope = (count * sum_ty - sum_t * sum_y) / (count * sum_tt - sum_t ** 2)
+            slope = np.nan_to_num(slope)
+            intercept = np.nan_to_num((sum_y - slope * sum_t) / count)
+
+        residual = np.where(valid, y - (intercept + slope * t), 0.0)
+
+        # -------------------------
+        # Spectrum and peaks
+        # -------------------------
+        power = np.abs(rfft(residual, axis=0)) ** 2
+        power[0] = 0.0
+
+        # Local maxima only, so one broad peak isn't counted k times
+        peaks = power.copy()
+        peaks[1:-1][(power[1:-1] < power[:-2]) | (power[1:-1] < power[2:])] = 0.0
+
+        k = min(top_k, max(len(power) - 1, 1))
+        top = np.argsort(peaks, axis=0)[::-1][:k]
+
+        top_power = np.take_along_axis(peaks, top, axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            periods = np.where(top_power > 0, length / top, np.nan)
+            strength = np.nan_to_num(top_power[0] / power.sum(axis=0))
+
+        significant = (
+            (strength >= min_strength)
+            & (periods[0] >= 2)
+            & (count >= 2 * np.nan_to_num(periods[0], nan=np.inf))
+        )
+
+        return {
+            "periods": periods.T,
+            "powers": np.where(top_power > 0, top_power, np.nan).T,
+            "strength": strength,
+            "significant": significant
+        }
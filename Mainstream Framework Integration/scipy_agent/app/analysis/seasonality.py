@@ -1,18 +1,85 @@
 from statsmodels.tsa.seasonal import seasonal_decompose
+import numpy as np
 import pandas as pd
 
+from analysis.periodicity import PeriodicityAnalysis
+
 
 class SeasonalityAnalysis:
 
     @staticmethod
-    def analyze(values):
+    def analyze(values, period=None):
+
+        # With no explicit period the dominant one is taken from the
+        # spectrum, and a series without significant seasonality is
+        # reported as such instead of being decomposed.
+        arr = np.asarray(values, dtype=float)
+
+        if period is None:
+            detected = PeriodicityAnalysis.detect(arr)
+
+            if not detected["significant"][0]:
+                return {
+                    "period": None,
+                    "strength": float(detected["strength"][0])
+                }
+
+            period = int(round(detected["periods"][0, 0]))
+            strength = float(detected["strength"][0])
+        else:
+            strength = None
+
+        return SeasonalityAnalysis.decompose(arr, period, strength)
+
+    @staticmethod
+    def analyze_batch(matrix):
+
+        # One spectrum pass over a (time x series) matrix picks the period
+        # of every column; only significant columns are decomposed.
+        # Returns one result per column, in column order.
+        y = np.asarray(matrix, dtype=float)
+
+        if y.ndim == 1:
+            y = y[:, None]
 
-        series = pd.Series(values)
+        detected = PeriodicityAnalysis.detect(y)
+
+        results = []
+
+        for c in range(y.shape[1]):
+
+            strength = float(detected["strength"][c])
+
+            if not detected["significant"][c]:
+                results.append({"period": None, "strength": strength})
+                continue
+
+            column = y[:, c]
+            column = column[~np.isnan(column)]
+
+            period = int(round(detected["periods"][c, 0]))
+
+            results.append(
+                SeasonalityAnalysis.decompose(column, period, strength)
+            )
+
+        return results
+
+    @staticmethod
+    def decompose(values, period, strength=None):
 
-        result = seasonal_decompose(series, period=4, model='additive')
+        result = seasonal_decompose(
+            pd.Series(values),
+            period=period,
+            model='additive'
+        )
 
+        # The seasonal component repeats every period, so one cycle of it
+        # is returned rather than a full-length copy
         return {
-            "trend": result.trend.tolist(),
-            "seasonal": result.seasonal.tolist(),
-            "residual": result.resid.tolist()
-        }
\ No newline at end of file
+            "period": period,
+            "strength": strength,
+            "trend": result.trend.to_numpy(),
+            "seasonal": result.seasonal.to_numpy()[:period],
+            "residual": result.resid.to_numpy()
+        }
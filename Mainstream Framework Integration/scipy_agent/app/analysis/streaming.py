@@ -0,0 +1,246 @@
+import numpy as np
+
+
+# Online, mergeable accumulators for chunked analysis. Every accumulator
+# works on a (rows x columns) float64 block with NaN for missing cells,
+# keeps O(columns) or O(columns^2) state, and can be combined with
+# another accumulator of the same width via merge().
+
+
+class RunningMoments:
+
+    def __init__(self, n_columns):
+
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.m3 = np.zeros(n_columns)
+        self.m4 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, block):
+
+        block = np.asarray(block, dtype=float)
+        valid = ~np.isnan(block)
+
+        count = valid.sum(axis=0).astype(float)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(block, axis=0) / count
+
+        delta = np.where(valid, block - mean, 0.0)
+
+        other = RunningMoments(block.shape[1])
+        other.count = count
+        other.mean = np.nan_to_num(mean)
+        other.m2 = (delta ** 2).sum(axis=0)
+        other.m3 = (delta ** 3).sum(axis=0)
+        other.m4 = (delta ** 4).sum(axis=0)
+        other.min = np.where(valid, block, np.inf).min(axis=0)
+        other.max = np.where(valid, block, -np.inf).max(axis=0)
+
+        self.merge(other)
+
+    def merge(self, other):
+
+        # Chan / Pebay pairwise combination of central moments
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean
+            delta_n = np.where(n > 0, delta / n, 0.0)
+
+        m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+
+        m3 = (
+            self.m3 + other.m3
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3 * delta_n * (n_a * other.m2 - n_b * self.m2)
+        )
+
+        m4 = (
+            self.m4 + other.m4
+            + delta * delta_n ** 3 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2)
+            + 6 * delta_n ** 2 * (n_a ** 2 * other.m2 + n_b ** 2 * self.m2)
+            + 4 * delta_n * (n_a * other.m3 - n_b * self.m3)
+        )
+
+        self.mean = self.mean + delta_n * n_b
+        self.count = n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+        return self
+
+    def variance(self):
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.m2 / self.count
+
+    def std(self):
+        return np.sqrt(self.variance())
+
+    def skewness(self):
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self):
+
+        # Fisher (excess) kurtosis, matching scipy.stats.kurtosis
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.count * self.m4 / self.m2 ** 2 - 3.0
+
+
+class QuantileSketch:
+
+    # KLL-style compactor sketch: each level holds at most `k` items of
+    # weight 2**level; a full level is sorted and every other item is
+    # promoted. Memory is O(k log n) per column and sketches merge by
+    # concatenating levels.
+
+    def __init__(self, n_columns, k=256, seed=0):
+
+        self.k = k
+        self.levels = [[] for _ in range(n_columns)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, block):
+
+        block = np.asarray(block, dtype=float)
+
+        for c in range(block.shape[1]):
+            values = block[:, c]
+            self._push(c, 0, values[~np.isnan(values)])
+
+    def merge(self, other):
+
+        for c, levels in enumerate(other.levels):
+            for level, items in enumerate(levels):
+                self._push(c, level, items)
+
+        return self
+
+    def _push(self, c, level, items):
+
+        levels = self.levels[c]
+
+        while len(items):
+
+            if level == len(levels):
+                levels.append(np.empty(0))
+
+            merged = np.concatenate([levels[level], items])
+
+            if len(merged) <= self.k:
+                levels[level] = merged
+                return
+
+            merged.sort()
+            offset = self._rng.integers(2)
+
+            levels[level] = np.empty(0)
+            items = merged[offset::2]
+            level += 1
+
+    def quantile(self, q):
+
+        result = np.full(len(self.levels), np.nan)
+
+        for c, levels in enumerate(self.levels):
+
+            values = np.concatenate(levels) if levels else np.empty(0)
+
+            if not len(values):
+                continue
+
+            weights = np.concatenate([
+                np.full(len(items), 2.0 ** level)
+                for level, items in enumerate(levels)
+            ])
+
+            order = np.argsort(values)
+            cumulative = np.cumsum(weights[order])
+
+            position = np.searchsorted(cumulative, q * cumulative[-1])
+            result[c] = values[order][min(position, len(values) - 1)]
+
+        return result
+
+
+class RunningCovariance:
+
+    # Pairwise-complete co-moments kept as shifted raw sums, so merging is
+    # plain addition. The shift (first block's column means) keeps the
+    # sums well conditioned.
+
+    def __init__(self, n_columns):
+
+        shape = (n_columns, n_columns)
+
+        self.shift = None
+        self.n = np.zeros(shape)
+        self.sx = np.zeros(shape)
+        self.sxx = np.zeros(shape)
+        self.sxy = np.zeros(shape)
+
+    def update(self, block):
+
+        block = np.asarray(block, dtype=float)
+
+        if self.shift is None:
+            with np.errstate(invalid="ignore"):
+                self.shift = np.nan_to_num(np.nanmean(block, axis=0))
+
+        valid = (~np.isnan(block)).astype(float)
+        x = np.where(valid > 0, block - self.shift, 0.0)
+
+        self.n += valid.T @ valid
+        self.sx += x.T @ valid
+        self.sxx += (x ** 2).T @ valid
+        self.sxy += x.T @ x
+
+    def merge(self, other):
+
+        if other.shift is None:
+            return self
+
+        if self.shift is None:
+            self.shift = other.shift
+            self.n, self.sx = other.n.copy(), other.sx.copy()
+            self.sxx, self.sxy = other.sxx.copy(), other.sxy.copy()
+            return self
+
+        # Re-express the other sums around this accumulator's shift
+        d = other.shift - self.shift
+        d_i, d_j = d[:, None], d[None, :]
+
+        self.sxy += other.sxy + d_j * other.sx + d_i * other.sx.T + d_i * d_j * other.n
+        self.sxx += other.sxx + 2 * d_i * other.sx + d_i ** 2 * other.n
+        self.sx += other.sx + d_i * other.n
+        self.n += other.n
+
+        return self
+
+    def covariance(self):
+
+        sy = self.sx.T
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self.sxy - self.sx * sy / self.n) / (self.n - 1)
+
+    def correlation(self):
+
+        sy, syy = self.sx.T, self.sxx.T
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            numerator = self.n * self.sxy - self.sx * sy
+            denominator = np.sqrt(
+                (self.n * self.sxx - self.sx ** 2)
+                * (self.n * syy - sy ** 2)
+            )
+
+            return numerator / denominator
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+
+# Version of the key and payload format. Tool code and settings changes
+# need no bump: they are part of each key's params (see cache_params).
+CACHE_VERSION = 5
+
+# Access times of cache hits are written in batches of this size (and
+# with the next put) instead of one UPDATE per hit
+ACCESS_FLUSH_SIZE = 256
+
+# Returned by get() for a missing key; None is a valid cached result
+MISS = object()
+
+
+class ResultCache:
+
+    # Persistent (tool, parameters, input hash) -> result store in SQLite.
+    # Entries carry a last-access time; once the stored payload exceeds
+    # max_bytes the least recently used entries are evicted. The folder
+    # and database are only created when the cache is first used.
+
+    def __init__(self, path, max_bytes=512 * 1024 * 1024):
+
+        self.path = path
+        self.max_bytes = max_bytes
+
+        # One connection shared by concurrent agent runs, serialised by
+        # a lock
+        self._lock = threading.RLock()
+        self._db = None
+        self._accessed = {}
+
+    def _connect(self):
+
+        if self._db is not None:
+            return self._db
+
+        directory = os.path.dirname(self.path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " tool TEXT,"
+            " payload BLOB,"
+            " size INTEGER,"
+            " accessed REAL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed"
+            " ON results (accessed)"
+        )
+        self._db.commit()
+
+        return self._db
+
+    @staticmethod
+    def make_key(tool_name, data, params=None):
+
+        digest = hashlib.sha256()
+
+        digest.update(f"{CACHE_VERSION}:{tool_name}:".encode())
+        digest.update(
+            json.dumps(params or {}, sort_keys=True, default=str).encode()
+        )
+
+        if isinstance(data, np.ndarray):
+            array = np.ascontiguousarray(data, dtype=np.float64)
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+
+        else:
+            # DataFrame input: column names and the float64 matrix
+            digest.update(
+                json.dumps([str(c) for c in data.columns]).encode()
+            )
+            array = np.ascontiguousarray(
+                data.to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+
+        return digest.hexdigest()
+
+    def get(self, key):
+
+        # The cached result, or MISS
+        with self._lock:
+            self._connect()
+            return self._get(key)
+
+    def put(self, key, tool_name, result):
+
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            self._connect()
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, tool_name, payload, len(payload), time.time())
+            )
+            self._flush_access()
+            self._evict()
+            self._db.commit()
+
+    def clear(self):
+
+        with self._lock:
+            self._connect()
+            self._accessed.clear()
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+
+    def close(self):
+
+        with self._lock:
+            if self._db is not None:
+                self._flush_access()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def __getstate__(self):
+
+        # Worker processes reopen the database from its path
+        return {"path": self.path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._db = None
+        self._accessed = {}
+
+    def _get(self, key):
+
+        row = self._db.execute(
+            "SELECT payload FROM results WHERE key = ?",
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            return MISS
+
+        self._accessed[key] = time.time()
+
+        if len(self._accessed) >= ACCESS_FLUSH_SIZE:
+            self._flush_access()
+            self._db.commit()
+
+        return pickle.loads(row[0])
+
+    def _flush_access(self):
+
+        if not self._accessed:
+            return
+
+        self._db.executemany(
+            "UPDATE results SET accessed = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._accessed.items()]
+        )
+        self._accessed.clear()
+
+    def _evict(self):
+
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute(
+            "SELECT key, size FROM results ORDER BY accessed"
+        ).fetchall()
+
+        stale = []
+
+        for key, size in rows:
+
+            if total <= self.max_bytes:
+                break
+
+            stale.append((key,))
+            total -= size
+
+        self._db.executemany("DELETE FROM results WHERE key = ?", stale)
@@ -5,4 +5,63 @@ load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
-MODEL = "gpt-oss"
\ No newline at end of file
+MODEL = "gpt-oss"
+
+# Tool execution
+MAX_WORKERS = int(os.getenv("AGENT_MAX_WORKERS", os.cpu_count() or 1))
+# Seconds a tool task may run once started; 0 disables the limit
+TASK_TIMEOUT = float(os.getenv("AGENT_TASK_TIMEOUT", "300"))
+# Fewest columns in one chunk of a batch-capable tool's columns
+BATCH_MIN_COLUMNS = int(os.getenv("AGENT_BATCH_MIN_COLUMNS", "8"))
+EXECUTOR = os.getenv("AGENT_EXECUTOR", "thread")
+
+# Chunked (streaming) analysis
+CHUNK_ROWS = int(os.getenv("AGENT_CHUNK_ROWS", "50000"))
+
+# PCA and clustering switch to incremental / mini-batch fits above this
+# many rows; projected rows in results are down-sampled to PREVIEW_ROWS
+LARGE_FIT_ROWS = int(os.getenv("AGENT_LARGE_FIT_ROWS", "100000"))
+PREVIEW_ROWS = int(os.getenv("AGENT_PREVIEW_ROWS", "1000"))
+
+# Correlation: method, number of strongest pairs reported and the widest
+# frame for which the full matrix (and heatmap sheet) is returned
+CORRELATION_METHOD = os.getenv("AGENT_CORRELATION_METHOD", "pearson")
+CORRELATION_TOP_K = int(os.getenv("AGENT_CORRELATION_TOP_K", "20"))
+CORRELATION_MATRIX_MAX_COLUMNS = int(os.getenv("AGENT_CORRELATION_MATRIX_MAX_COLUMNS", "200"))
+
+# Run telemetry: when set, every agent run exports its timing spans here
+# (*.jsonl appends JSON lines, any other name writes a Chrome trace)
+TRACE_PATH = os.getenv("AGENT_TRACE_PATH")
+
+# Headless service (python app/main.py serve)
+SERVICE_HOST = os.getenv("AGENT_SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT = int(os.getenv("AGENT_SERVICE_PORT", "8765"))
+SERVICE_WORKERS = int(os.getenv("AGENT_SERVICE_WORKERS", "2"))
+SERVICE_MAX_JOBS = int(os.getenv("AGENT_SERVICE_MAX_JOBS", "100"))
+# Jobs queued or running at once; further uploads get a 503
+SERVICE_MAX_RUNNING = int(os.getenv("AGENT_SERVICE_MAX_RUNNING", "16"))
+ASPOSE_LICENSE_PATH = os.getenv("ASPOSE_LICENSE_PATH")
+
+# Result cache (set AGENT_RESULT_CACHE=0 to disable)
+RESULT_CACHE = os.getenv("AGENT_RESULT_CACHE", "1") != "0"
+RESULT_CACHE_PATH = os.getenv(
+    "AGENT_RESULT_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "scipy_agent", "results.sqlite")
+)
+RESULT_CACHE_MAX_BYTES = int(os.getenv("AGENT_RESULT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# Planner: "auto" tries the rule router before the LLM, "rules" never
+# calls the LLM, "llm" always does
+PLANNER_MODE = os.getenv("AGENT_PLANNER_MODE", "auto")
+PLAN_CACHE_TTL = float(os.getenv("AGENT_PLAN_CACHE_TTL", "3600"))
+
+# Per-tool row limits overriding the registry defaults, e.g.
+# AGENT_TOOL_ROW_LIMITS="seasonality=1000000,clustering=50000"
+TOOL_ROW_LIMITS = {
+    name.strip(): int(limit)
+    for name, limit in (
+        item.split("=", 1)
+        for item in os.getenv("AGENT_TOOL_ROW_LIMITS", "").split(",")
+        if "=" in item
+    )
+}
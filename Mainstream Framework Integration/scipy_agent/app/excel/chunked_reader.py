@@ -0,0 +1,106 @@
+import aspose.cells as cells
+import numpy as np
+
+
+class _ChunkHandler(cells.LightCellsDataHandler):
+
+    # Receives cells one at a time from Aspose's LightCells loader and
+    # fills a fixed-size float64 window; nothing is kept in the Cells
+    # model, so memory stays bounded by chunk_rows x columns.
+
+    def __init__(self, sheet_index, chunk_rows, on_chunk):
+        super().__init__()
+
+        self.sheet_index = sheet_index
+        self.chunk_rows = chunk_rows
+        self.on_chunk = on_chunk
+
+        self.header = {}
+        self.block = None
+        self.row_ids = None
+        self.filled = 0
+        self.current = -1
+
+    def start_sheet(self, sheet):
+        return sheet.index == self.sheet_index
+
+    def start_row(self, row_index):
+
+        if row_index > 0 and self.block is None:
+            self._allocate()
+
+        if self.block is not None:
+
+            if self.filled == self.chunk_rows:
+                self.flush()
+
+            self.current = self.filled
+            self.row_ids[self.current] = row_index - 1
+            self.filled += 1
+
+        return True
+
+    def process_row(self, row):
+        return True
+
+    def start_cell(self, column_index):
+        return True
+
+    def process_cell(self, cell):
+
+        if cell.row == 0:
+            self.header[cell.column] = cell.string_value
+            return False
+
+        value = cell.value
+
+        if (
+            isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and cell.column < self.block.shape[1]
+        ):
+            self.block[self.current, cell.column] = value
+
+        return False
+
+    def flush(self):
+
+        if self.filled:
+            self.on_chunk(
+                self.block[:self.filled],
+                self.row_ids[:self.filled]
+            )
+
+        if self.block is not None:
+            self.block.fill(np.nan)
+
+        self.filled = 0
+
+    def _allocate(self):
+
+        width = max(self.header) + 1 if self.header else 0
+
+        self.block = np.full((self.chunk_rows, width), np.nan)
+        self.row_ids = np.zeros(self.chunk_rows, dtype=np.int64)
+
+
+class ChunkedSheetReader:
+
+    @staticmethod
+    def read(file_path, on_chunk, sheet_index=0, chunk_rows=50_000):
+
+        # Streams the sheet in row windows. on_chunk(block, row_ids) gets a
+        # (rows x columns) float64 block, NaN for empty or non-numeric
+        # cells, and the 0-based data-row index of every block row. The
+        # block is reused, so callers must copy anything they keep.
+        # Returns the header as {column index: name}.
+        handler = _ChunkHandler(sheet_index, chunk_rows, on_chunk)
+
+        options = cells.LoadOptions()
+        options.light_cells_data_handler = handler
+
+        cells.Workbook(file_path, options)
+
+        handler.flush()
+
+        return handler.header
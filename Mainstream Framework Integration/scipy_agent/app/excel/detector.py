@@ -1,21 +1,163 @@
+import aspose.cells as cells
+import numpy as np
+
+# Column kinds reported by ColumnDetector.detect
+NUMERIC = "numeric"
+DATE = "date"
+CATEGORICAL = "categorical"
+TEXT = "text"
+MIXED = "mixed"
+EMPTY = "empty"
+
+KINDS = {
+    cells.CellValueType.IS_NUMERIC: NUMERIC,
+    cells.CellValueType.IS_DATE_TIME: DATE,
+    cells.CellValueType.IS_STRING: TEXT,
+    cells.CellValueType.IS_BOOL: CATEGORICAL
+}
+
+
 class ColumnDetector:
 
-    def detect_numeric_columns(self, sheet):
-        numeric_columns = []
+    # Classifies columns from a sample of rows instead of every cell:
+    # the first and last rows (where headers, totals and appended data
+    # live) plus a seeded random draw from the middle.
+
+    def __init__(self, head=100, tail=100, random=300, seed=0,
+                 min_share=0.95, max_categories=0.5):
+
+        # min_share: share of sampled values one kind needs to name the
+        #            column; below it the column is mixed
+        # max_categories: largest distinct/sampled ratio for a string
+        #                 column to count as categorical rather than text
+        self.head = head
+        self.tail = tail
+        self.random = random
+        self.seed = seed
+        self.min_share = min_share
+        self.max_categories = max_categories
+
+    def sample_rows(self, max_row, first_row=1):
+
+        rows = np.arange(first_row, max_row + 1)
+
+        if len(rows) <= self.head + self.tail + self.random:
+            return rows
 
-        max_col = sheet.cells.max_data_column
-        max_row = sheet.cells.max_data_row
+        middle = rows[self.head:len(rows) - self.tail]
+
+        picked = np.random.default_rng(self.seed).choice(
+            middle, size=self.random, replace=False
+        )
+
+        return np.unique(np.concatenate([
+            rows[:self.head], picked, rows[len(rows) - self.tail:]
+        ]))
+
+    def detect(self, sheet, header_row=0):
+
+        # Returns {column index: {"name", "kind", "confidence", "filled",
+        # "shares"}}: confidence is the share of sampled values of that
+        # kind, filled the share of sampled rows that aren't empty and
+        # shares the share of every kind seen.
+        # Every sheet.cells access crosses the .NET bridge; fetch it once.
+        # max_column rather than max_data_column, which scans every row
+        # (styled but empty columns simply come out as EMPTY)
+        grid = sheet.cells
+
+        max_col = grid.max_column
+        max_row = grid.max_data_row
+
+        rows = self.sample_rows(max_row, header_row + 1).tolist()
+
+        columns = {}
 
         for col in range(max_col + 1):
-            numeric_count = 0
 
-            for row in range(1, max_row + 1):
-                value = sheet.cells.get(row, col).value
+            header = grid.check_cell(header_row, col)
+
+            kinds = []
+            strings = []
+
+            for row in rows:
+
+                # check_cell doesn't create cells for empty positions
+                cell = grid.check_cell(row, col)
 
-                if isinstance(value, (int, float)):
-                    numeric_count += 1
+                if cell is None:
+                    continue
 
-            if numeric_count > 0:
-                numeric_columns.append(col)
+                kind = KINDS.get(cell.type)
+
+                if kind is None:
+                    continue
+
+                kinds.append(kind)
+
+                if kind == TEXT:
+                    strings.append(cell.string_value)
+
+            columns[col] = {
+                "name": header.string_value if header is not None else str(col),
+                **self._classify(kinds, strings, len(rows))
+            }
+
+        return columns
+
+    def _classify(self, kinds, strings, sampled):
+
+        if not kinds:
+            return {"kind": EMPTY, "confidence": 1.0, "filled": 0.0, "shares": {}}
+
+        names, counts = np.unique(kinds, return_counts=True)
+
+        best = np.argmax(counts)
+        kind = str(names[best])
+        confidence = float(counts[best] / len(kinds))
+
+        if confidence < self.min_share:
+            kind = MIXED
+
+        elif kind == TEXT and len(set(strings)) <= self.max_categories * len(strings):
+            kind = CATEGORICAL
+
+        return {
+            "kind": kind,
+            "confidence": confidence,
+            "filled": len(kinds) / max(sampled, 1),
+            "shares": {
+                str(name): float(count / len(kinds))
+                for name, count in zip(names, counts)
+            }
+        }
+
+    @staticmethod
+    def csv_dtypes(columns):
+
+        # read_csv dtype hints by column position. Columns with any
+        # sampled number are left to the C parser's own inference (a
+        # value the sample missed must not abort the parse, and stray
+        # text in a numeric column is coerced afterwards); the hints stop
+        # string columns from being type-probed and store repeated labels
+        # as categoricals.
+        dtypes = {}
+
+        for col, info in columns.items():
+            kind = info["kind"]
+
+            if kind == CATEGORICAL:
+                dtypes[col] = "category"
+            elif kind == TEXT or (
+                kind == MIXED and info["shares"].get(NUMERIC, 0) == 0
+            ):
+                dtypes[col] = object
+
+        return dtypes
+
+    def detect_numeric_columns(self, sheet):
 
-        return numeric_columns
\ No newline at end of file
+        # Columns with any sampled numeric value, as before sampling
+        return [
+            col for col, info in self.detect(sheet).items()
+            if info["shares"].get(NUMERIC, 0) > 0
+        ]
@@ -1,5 +1,6 @@
 import aspose.cells as cells
 from aspose.pydrawing import Color
+import numpy as np
 
 
 class Formatter:
@@ -11,4 +12,96 @@ class Formatter:
         style.pattern = cells.BackgroundType.SOLID
         style.foreground_color = Color.red
 
-        cell.set_style(style)
\ No newline at end of file
+        cell.set_style(style)
+
+    @staticmethod
+    def header_index(sheet, header_row=0):
+
+        # Header text -> column index, built once per sheet; the first
+        # occurrence of a duplicated header wins, as the linear scan did
+        index = {}
+
+        for c in range(sheet.cells.max_data_column + 1):
+            index.setdefault(sheet.cells.get(header_row, c).string_value, c)
+
+        return index
+
+    @staticmethod
+    def anomaly_style(workbook):
+
+        # Red fill with white bold text. The flag limits what apply_style
+        # touches, so number formats and borders of the cells are kept.
+        style = workbook.create_style()
+        style.pattern = cells.BackgroundType.SOLID
+        style.foreground_color = Color.red
+        style.font.color = Color.white
+        style.font.is_bold = True
+
+        flag = cells.StyleFlag()
+        flag.cell_shading = True
+        flag.font_color = True
+        flag.font_bold = True
+
+        return style, flag
+
+    @staticmethod
+    def row_runs(rows):
+
+        # Sorted unique rows -> (first_row, row_count) for each run of
+        # consecutive rows
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+
+        if not len(rows):
+            return []
+
+        breaks = np.flatnonzero(np.diff(rows) > 1) + 1
+
+        starts = np.concatenate([[0], breaks])
+        ends = np.concatenate([breaks, [len(rows)]])
+
+        return [
+            (int(rows[s]), int(e - s))
+            for s, e in zip(starts, ends)
+        ]
+
+    def highlight_rows(self, sheet, col, rows, style, flag):
+
+        # One Range.apply_style per run of consecutive flagged rows
+        runs = self.row_runs(rows)
+
+        for first_row, row_count in runs:
+            sheet.cells.create_range(
+                first_row, col, row_count, 1
+            ).apply_style(style, flag)
+
+        return len(runs)
+
+    def color_scale(self, sheet, first_row, first_col, last_row, last_col,
+                    low=-1, high=1):
+
+        # Blue-white-red conditional colour scale over a block, anchored
+        # at fixed values so heatmaps are comparable between sheets
+        index = sheet.conditional_formattings.add()
+        conditions = sheet.conditional_formattings[index]
+
+        conditions.add_area(
+            cells.CellArea.create_cell_area(first_row, first_col, last_row, last_col)
+        )
+
+        scale = conditions[
+            conditions.add_condition(cells.FormatConditionType.COLOR_SCALE)
+        ].color_scale
+
+        scale.is_3_color_scale = True
+
+        for cfvo, value in (
+            (scale.min_cfvo, low),
+            (scale.mid_cfvo, (low + high) / 2),
+            (scale.max_cfvo, high)
+        ):
+            cfvo.type = cells.FormatConditionValueType.NUMBER
+            cfvo.value = value
+
+        scale.min_color = Color.blue
+        scale.mid_color = Color.white
+        scale.max_color = Color.red
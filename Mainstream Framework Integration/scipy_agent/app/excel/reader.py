@@ -1,5 +1,15 @@
+import io
+
 import aspose.cells as cells
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from excel.detector import DATE, NUMERIC, ColumnDetector
+
+
+# Excel serial dates count days from 1899-12-30 (the 1900 leap-year bug
+# included), which is what the raw CSV export writes for date cells.
+EXCEL_EPOCH = "1899-12-30"
 
 
 class ExcelReader:
@@ -7,18 +17,88 @@ class ExcelReader:
     @staticmethod
     def load_sheet_as_dataframe(file_path, sheet_index=0):
         workbook = cells.Workbook(file_path)
+
+        return ExcelReader.sheet_to_dataframe(workbook, sheet_index)
+
+    @staticmethod
+    def sheet_to_dataframe(workbook, sheet_index=0):
+        # One bulk export of the used range as raw (unformatted) CSV,
+        # parsed by pandas' C reader. Column kinds come from a row sample
+        # (ColumnDetector): string columns get dtype hints, numeric ones
+        # are inferred by the parser, and date columns are converted back
+        # from Excel serials.
         worksheet = workbook.worksheets[sheet_index]
 
         rows = worksheet.cells.max_data_row + 1
-        cols = worksheet.cells.max_data_column + 1
+        cols = worksheet.cells.max_column + 1
+
+        if rows < 1 or cols < 1:
+            return pd.DataFrame()
+
+        detected = ColumnDetector().detect(worksheet)
+
+        buffer = ExcelReader._export_csv(worksheet)
+
+        return ExcelReader.parse_csv(buffer, rows, detected)
+
+    @staticmethod
+    def parse_csv(buffer, rows, detected):
+        # rows: used-range row count, header row included; detected: the
+        # ColumnDetector kinds of the sheet's columns.
+        # nrows bounds the parse to the used range, so any trailer text the
+        # export adds after the data never becomes a row. Fully empty rows
+        # are exported as blank lines and must be kept, or every later row
+        # would shift up.
+        df = pd.read_csv(
+            buffer,
+            header=0,
+            nrows=rows - 1,
+            skip_blank_lines=False,
+            encoding="utf-8-sig",
+            low_memory=False,
+            dtype=ColumnDetector.csv_dtypes(detected)
+        )
+
+        for c, info in detected.items():
+
+            if c >= len(df.columns):
+                continue
+
+            column = df.columns[c]
+
+            if info["kind"] == DATE:
+                df[column] = pd.to_datetime(
+                    pd.to_numeric(df[column], errors="coerce"),
+                    unit="D",
+                    origin=EXCEL_EPOCH
+                )
+
+            # A few text cells ("-", "n/a", numbers stored as text) in a
+            # numeric column become NaN rather than turning it into strings
+            elif info["kind"] == NUMERIC and not is_numeric_dtype(df[column]):
+                df[column] = pd.to_numeric(df[column], errors="coerce")
+
+        return df
+
+    @staticmethod
+    def _export_csv(worksheet):
+
+        workbook = worksheet.workbook
+
+        options = cells.TxtSaveOptions(cells.SaveFormat.CSV)
+        options.format_strategy = cells.CellValueFormatStrategy.NONE
+        options.trim_leading_blank_row_and_column = False
 
-        data = []
+        # CSV export writes a single sheet. When the target is both the
+        # first and the active sheet it can be saved in place; any other
+        # sheet is copied into a scratch workbook (a native .NET copy) so
+        # the caller's workbook is never modified.
+        if worksheet.index != 0 or workbook.worksheets.active_sheet_index != 0:
+            workbook = cells.Workbook()
+            workbook.worksheets[0].copy(worksheet)
 
-        for r in range(rows):
-            row = []
-            for c in range(cols):
-                row.append(worksheet.cells.get(r, c).value)
-            data.append(row)
+        buffer = io.BytesIO()
+        workbook.save(buffer, options)
+        buffer.seek(0)
 
-        df = pd.DataFrame(data[1:], columns=data[0])
-        return df
\ No newline at end of file
+        return buffer
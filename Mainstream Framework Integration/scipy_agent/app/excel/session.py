@@ -0,0 +1,80 @@
+import os
+import threading
+
+
+class WorkbookSession:
+
+    # One parsed workbook shared by every stage of an ExcelAgent run.
+    # Stages read frames and worksheets from here and mark the session
+    # dirty when they modify it; the agent saves once at the end.
+
+    # Concurrent runs (arun_batch) may target the same file; saves to one
+    # path are serialised so two writers never interleave
+    _save_locks = {}
+    _save_locks_guard = threading.Lock()
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.dirty = False
+
+        self._workbook = None
+        self._frames = {}
+        self._numeric_frames = {}
+
+    @property
+    def workbook(self):
+        if self._workbook is None:
+            # Imported here so constructing an agent doesn't start the
+            # .NET runtime
+            import aspose.cells as cells
+
+            self._workbook = cells.Workbook(self.file_path)
+
+        return self._workbook
+
+    def worksheet(self, sheet_index=0):
+        return self.workbook.worksheets[sheet_index]
+
+    def dataframe(self, sheet_index=0):
+        if sheet_index not in self._frames:
+            from excel.reader import ExcelReader
+
+            self._frames[sheet_index] = ExcelReader.sheet_to_dataframe(
+                self.workbook,
+                sheet_index
+            )
+
+        return self._frames[sheet_index]
+
+    def numeric_frame(self, sheet_index=0):
+
+        # Column profiling: the numeric columns of the sheet
+        if sheet_index not in self._numeric_frames:
+            self._numeric_frames[sheet_index] = (
+                self.dataframe(sheet_index).select_dtypes(include=['number'])
+            )
+
+        return self._numeric_frames[sheet_index]
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def save(self, output_path=None):
+
+        if output_path is None and not self.dirty:
+            return
+
+        path = output_path or self.file_path
+
+        with self.save_lock(path):
+            self.workbook.save(path)
+
+        self.dirty = False
+
+    @classmethod
+    def save_lock(cls, path):
+
+        key = os.path.normcase(os.path.abspath(path))
+
+        with cls._save_locks_guard:
+            return cls._save_locks.setdefault(key, threading.Lock())
@@ -1,18 +1,314 @@
 import aspose.cells as cells
+from aspose.cells.charts import ChartType
+import numpy as np
+
+from excel.formatter import Formatter
+
+# The report is not streamed: the whole Aspose workbook is built in
+# memory and saved once. Only the Python side is bounded, since results
+# reach Aspose in WRITE_CHUNK slices rather than as one list per column.
+# A LightCellsDataProvider save would bound the .NET side too, but it
+# calls back into Python for every cell and the report's charts and
+# conditional formats need the full workbook model, so it isn't used.
+
+# Largest slice handed to Aspose per import call, so a 1M-point result
+# is never converted to one giant Python list
+WRITE_CHUNK = 65_536
+
+# Excel's row limit, minus the header row
+MAX_VALUES = 1_048_575
+
 
 class ExcelWriter:
 
     @staticmethod
-    def write_report(output_path, reports):
+    def write_report(output_path, reports, charts=False):
 
         workbook = cells.Workbook()
-        sheet = workbook.worksheets[0]
+
+        summary = workbook.worksheets[0]
+        summary.name = "Summary"
 
         row = 0
 
+        # -------------------------
+        # Run metadata
+        # -------------------------
         for key, value in reports.items():
-            sheet.cells.get(row, 0).put_value(str(key))
-            sheet.cells.get(row, 1).put_value(str(value))
+
+            if key in ("analysis_results", "telemetry"):
+                continue
+
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(str(v) for v in value)
+
+            summary.cells.get(row, 0).put_value(str(key))
+            summary.cells.get(row, 1).put_value(ExcelWriter._scalar(value))
             row += 1
 
-        workbook.save(output_path)
\ No newline at end of file
+        row += 1
+
+        # -------------------------
+        # One sheet per tool
+        # -------------------------
+        summary.cells.get(row, 0).put_value("tool")
+        summary.cells.get(row, 1).put_value("result")
+        row += 1
+
+        for tool_name, result in reports.get("analysis_results", {}).items():
+
+            summary.cells.get(row, 0).put_value(str(tool_name))
+
+            if isinstance(result, dict) and (
+                set(result) == {"error"} or set(result) == {"skipped"}
+            ):
+                status, message = next(iter(result.items()))
+                summary.cells.get(row, 1).put_value(f"{status}: {message}")
+                row += 1
+                continue
+
+            # Matrix results (correlation) list their strongest pairs on
+            # the tool sheet and the full matrix as a heatmap next to it
+            matrix = labels = None
+
+            if isinstance(result, dict) and "columns" in result and "pairs" in result:
+                matrix, labels = result.get("matrix"), result["columns"]
+                result = result["pairs"]
+
+            table = ExcelWriter.to_columns(result)
+
+            if table is None:
+                # Shape we can't lay out as a table: keep the old behaviour
+                summary.cells.get(row, 1).put_value(str(result))
+                row += 1
+                continue
+
+            sheet = workbook.worksheets.add(str(tool_name)[:31])
+
+            ExcelWriter.write_table(sheet, table)
+
+            if charts:
+                ExcelWriter.add_chart(sheet, tool_name, table)
+
+            if matrix is not None:
+                heatmap = workbook.worksheets.add(f"{str(tool_name)[:24]} matrix")
+                ExcelWriter.write_heatmap(heatmap, labels, matrix)
+
+            summary.cells.get(row, 1).put_value(f"see sheet {sheet.name}")
+            row += 1
+
+        if reports.get("telemetry"):
+            ExcelWriter.write_telemetry(
+                workbook.worksheets.add("Telemetry"),
+                reports["telemetry"]
+            )
+
+        summary.auto_fit_columns()
+
+        workbook.save(output_path)
+
+    @staticmethod
+    def to_columns(result):
+
+        # Lays a tool result out as a list of (header, values) columns,
+        # or returns None when the shape isn't recognised.
+        if not isinstance(result, dict) or not result:
+            return None
+
+        values = list(result.values())
+
+        # {column: [{"index": .., "value": ..}, ...]} -> long table
+        if all(isinstance(v, list) and all(isinstance(r, dict) for r in v) for v in values):
+
+            fields = []
+
+            for records in values:
+                for record in records:
+                    for field in record:
+                        if field not in fields:
+                            fields.append(field)
+
+            table = [("column", [k for k, v in result.items() for _ in v])]
+
+            for field in fields:
+                table.append((
+                    field,
+                    [r.get(field) for v in values for r in v]
+                ))
+
+            return table
+
+        # {column: {metric: scalar}} -> one row per column
+        if all(isinstance(v, dict) and all(np.isscalar(x) or x is None for x in v.values()) for v in values):
+
+            metrics = []
+
+            for v in values:
+                for metric in v:
+                    if metric not in metrics:
+                        metrics.append(metric)
+
+            table = [("column", list(result))]
+
+            for metric in metrics:
+                table.append((metric, [v.get(metric) for v in values]))
+
+            return table
+
+        # {name: sequence} or {column: {part: sequence}} -> wide table;
+        # 2-D arrays become one column per inner index
+        table = []
+
+        for key, value in result.items():
+
+            if isinstance(value, dict):
+                # Scalars next to sequences (e.g. a detected period) get
+                # a one-cell column of their own
+                parts = [
+                    (f"{key}.{part}", [v] if np.isscalar(v) or v is None else v)
+                    for part, v in value.items()
+                ]
+            else:
+                parts = [(str(key), value)]
+
+            for header, sequence in parts:
+
+                if np.isscalar(sequence) or sequence is None:
+                    return None
+
+                array = np.asarray(sequence)
+
+                if array.ndim == 1:
+                    table.append((header, array))
+                elif array.ndim == 2:
+                    for i in range(array.shape[1]):
+                        table.append((f"{header}_{i + 1}", array[:, i]))
+                else:
+                    return None
+
+        return table
+
+    @staticmethod
+    def write_table(sheet, table, first_row=0):
+
+        for c, (header, values) in enumerate(table):
+
+            sheet.cells.get(first_row, c).put_value(str(header))
+
+            count = min(len(values), MAX_VALUES)
+
+            for start in range(0, count, WRITE_CHUNK):
+                chunk = values[start:min(start + WRITE_CHUNK, count)]
+
+                sheet.cells.import_object_array(
+                    ExcelWriter._cell_values(chunk),
+                    first_row + 1 + start,
+                    c,
+                    True
+                )
+
+            if len(values) > MAX_VALUES:
+                sheet.cells.get(first_row, c).put_value(
+                    f"{header} (first {MAX_VALUES} of {len(values)})"
+                )
+
+    @staticmethod
+    def write_telemetry(sheet, telemetry):
+
+        # Run totals, then one table per phase and per tool
+        row = 0
+
+        for key in ("run", "elapsed", "peak_rss_mb"):
+            sheet.cells.get(row, 0).put_value(key)
+            sheet.cells.get(row, 1).put_value(ExcelWriter._scalar(telemetry.get(key)))
+            row += 1
+
+        for section in ("phases", "tools"):
+
+            table = ExcelWriter.to_columns(telemetry.get(section))
+
+            if table is None:
+                continue
+
+            row += 1
+            table[0] = (section[:-1], table[0][1])
+
+            ExcelWriter.write_table(sheet, table, first_row=row)
+            row += len(table[0][1]) + 1
+
+        sheet.auto_fit_columns()
+
+    @staticmethod
+    def write_heatmap(sheet, columns, matrix):
+
+        # Labels along the top row and first column; the matrix itself is
+        # imported one column per call and coloured by a single
+        # conditional-format rule rather than per-cell styles
+        size = len(columns)
+
+        sheet.cells.import_object_array([str(c) for c in columns], 0, 1, False)
+        sheet.cells.import_object_array([str(c) for c in columns], 1, 0, True)
+
+        for c in range(size):
+            sheet.cells.import_object_array(
+                ExcelWriter._cell_values(matrix[:, c]), 1, c + 1, True
+            )
+
+        if size:
+            Formatter().color_scale(sheet, 1, 1, size, size)
+
+    @staticmethod
+    def add_chart(sheet, title, table):
+
+        # Line chart over the numeric columns of a wide table
+        numeric = [
+            c for c, (_, values) in enumerate(table)
+            if isinstance(values, np.ndarray) and values.dtype.kind in "iuf"
+        ]
+
+        if not numeric:
+            return
+
+        rows = min(max(len(table[c][1]) for c in numeric), MAX_VALUES)
+
+        chart = sheet.charts[
+            sheet.charts.add(ChartType.LINE, 1, len(table) + 1, 21, len(table) + 10)
+        ]
+
+        for c in numeric:
+            column = cells.CellsHelper.column_index_to_name(c)
+            index = chart.n_series.add(f"{column}2:{column}{rows + 1}", True)
+            chart.n_series[index].name = f"={column}1"
+
+        chart.title.text = str(title)
+
+    @staticmethod
+    def _cell_values(values):
+
+        array = np.asarray(values)
+
+        if array.dtype.kind in "iuf":
+            # NaN has no Excel equivalent; write empty cells
+            if array.dtype.kind == "f":
+                mask = np.isnan(array)
+                if mask.any():
+                    array = array.astype(object)
+                    array[mask] = None
+
+            return array.tolist()
+
+        return [ExcelWriter._scalar(v) for v in values]
+
+    @staticmethod
+    def _scalar(value):
+
+        if isinstance(value, np.generic):
+            value = value.item()
+
+        if isinstance(value, float) and np.isnan(value):
+            return None
+
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            return str(value)
+
+        return value
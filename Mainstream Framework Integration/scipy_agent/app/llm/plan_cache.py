@@ -0,0 +1,54 @@
+import copy
+import threading
+import time
+
+
+class PlanCache:
+
+    # normalised request -> plan, expiring entries after ttl seconds
+
+    def __init__(self, ttl=3600, max_entries=1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+
+        with self._lock:
+            return self._get(key)
+
+    def put(self, key, plan):
+
+        with self._lock:
+            self._put(key, plan)
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key):
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        stored_at, plan = entry
+
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        return copy.deepcopy(plan)
+
+    def _put(self, key, plan):
+
+        if len(self._entries) >= self.max_entries:
+            # Drop the oldest entry
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+
+        self._entries[key] = (time.monotonic(), copy.deepcopy(plan))
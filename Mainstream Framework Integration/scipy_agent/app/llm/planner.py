@@ -1,21 +1,69 @@
-from openai import OpenAI
-from config import OPENAI_API_KEY, MODEL,OPENAI_BASE_URL
+from config import (
+    OPENAI_API_KEY,
+    MODEL,
+    OPENAI_BASE_URL,
+    PLANNER_MODE,
+    PLAN_CACHE_TTL
+)
 from llm.prompts.tool_selection_prompt import TOOL_SELECTION_PROMPT
+from llm.plan_cache import PlanCache
+from llm.rule_router import RuleRouter, normalize_request
 import json
 
-client = OpenAI(
+_client = None
+
+
+def get_client():
+
+    # Created on first LLM call so rule-routed and cached plans (and
+    # tests) never need an API key or network access
+    global _client
+
+    if _client is None:
+        from openai import OpenAI
+
+        _client = OpenAI(
             api_key=OPENAI_API_KEY,
             base_url=OPENAI_BASE_URL #,
             #timeout = 120
         )
+
+    return _client
+
+
 class Planner:
 
+    def __init__(self, mode=None, cache=None, rules=None):
+        self.mode = mode or PLANNER_MODE
+        self.cache = cache or PlanCache(ttl=PLAN_CACHE_TTL)
+        self.rules = rules or RuleRouter()
+
     def create_plan(self, request: str):
 
-        print(OPENAI_API_KEY)
-        print(OPENAI_BASE_URL)
-        response = client.chat.completions.create(
-            model="gpt-oss",
+        key = normalize_request(request)
+
+        plan = self.cache.get(key)
+
+        if plan is not None:
+            return plan
+
+        if self.mode in ("auto", "rules"):
+            plan = self.rules.route(request)
+
+            if plan is None and self.mode == "rules":
+                raise ValueError(f"No rule matches request: {request}")
+
+        if plan is None:
+            plan = self._plan_with_llm(request)
+
+        self.cache.put(key, plan)
+
+        return plan
+
+    def _plan_with_llm(self, request: str):
+
+        response = get_client().chat.completions.create(
+            model=MODEL,
             messages=[
                 {
                     "role": "system",
@@ -5,7 +5,7 @@ You MUST output valid JSON only.
 
 Schema:
 {
-  "tools": ["anomaly", "regression", "trend", "fft", "statistics", "forecast", "clustering", "seasonality", "correlation", "pca"],
+  "tools": ["anomaly", "outlier", "change_point", "regression", "trend", "smoothing", "fft", "statistics", "distribution", "forecast", "clustering", "multivariate_clustering", "seasonality", "correlation", "pca"],
   "reason": string,
   "confidence": number (0-1)
 }
@@ -0,0 +1,55 @@
+import re
+
+
+# keyword pattern -> tool, checked against the normalised request
+RULES = [
+    (r"\b(anomal\w*|outliers?|spikes?|unusual|abnormal)\b", "anomaly"),
+    (r"\btrends?\b|\btrending\b", "trend"),
+    (r"\b(forecast\w*|predict\w*|projections?)\b", "forecast"),
+    (r"\b(correlat\w*|relationships?)\b", "correlation"),
+    (r"\b(seasonal\w*)\b", "seasonality"),
+    (r"\b(statistics?|summary|summari[sz]e|describe)\b", "statistics"),
+    (r"\b(cluster\w*|segment\w*)\b", "clustering"),
+    (r"\b(pca|principal components?)\b", "pca"),
+    (r"\b(fft|frequency|spectrum|periodic\w*)\b", "fft"),
+    (r"\b(regression|linear fit)\b", "regression"),
+]
+
+
+def normalize_request(request):
+
+    # Case, punctuation and whitespace differences map to one cache key
+    text = re.sub(r"[^\w\s]", " ", request.lower())
+
+    return " ".join(text.split())
+
+
+class RuleRouter:
+
+    # Deterministic keyword router for common requests; returns None
+    # when nothing matches so the caller can fall back to the LLM.
+
+    def __init__(self, rules=None):
+        self.rules = [
+            (re.compile(pattern), tool)
+            for pattern, tool in (rules or RULES)
+        ]
+
+    def route(self, request):
+
+        text = normalize_request(request)
+
+        tools = []
+
+        for pattern, tool in self.rules:
+            if pattern.search(text) and tool not in tools:
+                tools.append(tool)
+
+        if not tools:
+            return None
+
+        return {
+            "tools": tools,
+            "reason": "Matched request keywords (rule-based router)",
+            "confidence": 1.0
+        }
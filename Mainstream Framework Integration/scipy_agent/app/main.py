@@ -1,22 +1,52 @@
+import argparse
+
 from agents.excel_agent import ExcelAgent
 
 
 def main():
-    agent = ExcelAgent()
 
-    input_file = "../samples/sales.xlsx"
-    user_prompt = "Analyze sales trends and detect anomalies"
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="analyse one workbook (default)")
+    run.add_argument("input_file", nargs="?", default="../samples/sales.xlsx")
+    run.add_argument("output_file", nargs="?", default="../output/sales_analysis.xlsx")
+    run.add_argument("--request", default="Analyze sales trends and detect anomalies")
+    run.add_argument("--chunk-rows", type=int)
+
+    serve = commands.add_parser("serve", help="run the headless service")
+    serve.add_argument("--host")
+    serve.add_argument("--port", type=int)
+    serve.add_argument("--socket", help="listen on a Unix socket instead")
+    serve.add_argument("--workers", type=int)
+
+    args = parser.parse_args()
 
-    output_file = "../output/sales_analysis.xlsx"
+    if args.command == "serve":
+        from service.server import serve as start_service
+
+        start_service(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            workers=args.workers
+        )
+        return
+
+    if args.command is None:
+        args = run.parse_args([])
+
+    agent = ExcelAgent()
 
     agent.run(
-        file_path = input_file,
-        output_file=output_file,
-        user_request = user_prompt
+        file_path = args.input_file,
+        output_file=args.output_file,
+        user_request = args.request,
+        chunk_rows=args.chunk_rows
     )
 
     print("Analysis complete")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,27 +1,101 @@
 # app/pipeline/execution_pipeline.py
 
-from excel.reader import ExcelReader
-from registry.tool_registry import TOOL_REGISTRY
-from aspose.cells import Workbook, Style,BackgroundType
-from aspose.pydrawing import Color
-import pandas as pd
-from renderer.chart_renderer import ChartRenderer
+from excel.session import WorkbookSession
+from registry.tool_registry import SERIES, DATAFRAME, cache_params, load_tool
+from pipeline.scheduler import ToolScheduler
+from cache.result_cache import MISS, ResultCache
+from config import (
+    RESULT_CACHE,
+    RESULT_CACHE_PATH,
+    RESULT_CACHE_MAX_BYTES,
+    BATCH_MIN_COLUMNS,
+    TOOL_ROW_LIMITS
+)
+from telemetry.profiler import Profiler
+from functools import partial
+
+# Task key prefix of a tool's column-chunk batch tasks
+BATCH = "__batch__"
 
 class ExecutionPipeline:
 
-    def execute(self, file_path, plan):
+    def __init__(self, max_workers=None, timeout=None, executor=None,
+                 cache=None, row_limits=None):
+        self.scheduler = ToolScheduler(
+            max_workers=max_workers,
+            timeout=timeout,
+            executor=executor
+        )
+
+        # cache: a ResultCache, False to disable, None for the default
+        # (which only touches disk once a tool result is looked up)
+        if cache is None and RESULT_CACHE:
+            cache = ResultCache(
+                RESULT_CACHE_PATH,
+                max_bytes=RESULT_CACHE_MAX_BYTES
+            )
+
+        self.cache = cache or None
+
+        # tool name -> max rows, on top of the registry defaults
+        self.row_limits = {**TOOL_ROW_LIMITS, **(row_limits or {})}
+
+    def batch_chunks(self, deferred):
+
+        # Splits (task key, data, cost) entries, in column order, into
+        # one chunk per worker of roughly equal cost; a chunk has at
+        # least BATCH_MIN_COLUMNS columns so each still gets the
+        # vectorised pass.
+        if not deferred:
+            return []
+
+        total = sum(cost for _, _, cost in deferred)
+        target = total / max(self.scheduler.max_workers, 1)
+
+        chunks = [[]]
+        spent = 0
+
+        for entry in deferred:
+
+            if len(chunks[-1]) >= BATCH_MIN_COLUMNS and spent >= target:
+                chunks.append([])
+                spent = 0
+
+            chunks[-1].append(entry)
+            spent += entry[2]
+
+        return chunks
+
+    def execute(self, file_path=None, plan=None, *, session=None, profiler=None):
+
+        # file_path and plan keep their original positions; session (an
+        # already parsed workbook) replaces file_path when given.
+        # profiler: the run's Profiler when called by the agent; a
+        # standalone call times itself. Its summary is returned under
+        # "telemetry".
+        if plan is None:
+            raise TypeError("execute() requires a plan")
+
+        profiler = profiler or Profiler()
 
         # -------------------------
         # 1. Load dataframe
         # -------------------------
-        df = ExcelReader.load_sheet_as_dataframe(file_path)
+        owns_session = session is None
+
+        if owns_session:
+            session = WorkbookSession(file_path)
+
+        with profiler.span("load"):
+            df = session.dataframe()
 
 
 
         # -------------------------
         # 2. Auto profiling
         # -------------------------
-        numeric_df = df.select_dtypes(include=['number'])
+        with profiler.span("profile"):
+            numeric_df = session.numeric_frame()
 
         numeric_columns = numeric_df.columns.tolist()
 
@@ -35,79 +109,179 @@ class ExecutionPipeline:
         if not isinstance(tools, list):
             tools = [tools]
 
+        with profiler.span("profile"):
+            columns = self.scheduler.prepare_columns(numeric_df, min_size=1)
+
+        row_count = len(numeric_df)
+
+        tasks = []
+        order = []
+        cached = {}
+        cache_keys = {}
+
+        batches = {}
+
+        def schedule(task_key, tool_func, data, cost, params, deferred=None):
+
+            order.append(task_key)
+
+            if self.cache is not None:
+                cache_key = ResultCache.make_key(task_key[0], data, params)
+                hit = self.cache.get(cache_key)
+
+                if hit is not MISS:
+                    cached[task_key] = ("ok", hit)
+                    return
+
+                cache_keys[task_key] = cache_key
+
+            if deferred is not None:
+                deferred.append((task_key, data, cost))
+            else:
+                tasks.append((task_key, tool_func, data, cost))
+
         for tool_name in tools:
 
             print(f"Running tool: {tool_name}")
 
-            tool_entry = TOOL_REGISTRY.get(tool_name)
+            # Imports the tool's backend on first use
+            try:
+                tool_entry = load_tool(tool_name)
+            except ImportError as e:
+                results[tool_name] = {"error": f"could not load tool: {e}"}
+                continue
+
+            if not tool_entry or not tool_entry["func"]:
+                print(f"Tool not found: {tool_name}")
+                continue
 
             tool_func = tool_entry["func"]
             tool_input_type = tool_entry["input"]
+            min_size = tool_entry["min_size"]
+            cost_per_row = tool_entry["cost_per_row"]
 
-            if not tool_func:
-                print(f"Tool not found: {tool_name}")
-                continue
+            # Settings and code fingerprint, part of the result cache key
+            params = cache_params(tool_entry) if self.cache is not None else None
 
-            try:
+            # =====================================
+            # Size limits for expensive tools
+            # =====================================
+            max_rows = self.row_limits.get(tool_name, tool_entry["max_rows"])
+
+            if max_rows is not None and row_count > max_rows:
+                print(f"Skipping {tool_name}: {row_count} rows > {max_rows}")
+                results[tool_name] = {
+                    "skipped": f"{row_count} rows exceeds the {max_rows} row limit"
+                }
+                continue
 
-                # =====================================
-                # Column-based tools
-                # =====================================
-                if tool_name in [
-                    "anomaly",
-                    "trend",
-                    "forecast",
-                    "fft",
-                    "regression",
-                    "statistics",
-                    "seasonality",
-                    "outlier",
-                    "distribution",
-                    "smoothing",
-                    "change_point"
-                ]:
-
-                    tool_results = {}
-
-                    for col in numeric_columns:
-
-                        values = (
-                            numeric_df[col]
-                            .dropna()
-                            .astype(float)
-                            .tolist()
-                        )
-
-                        if len(values) < 3:
-                            continue
-
-                        tool_results[col] = tool_func(values)
-
-                    results[tool_name] = tool_results
-
-                # =====================================
-                # DataFrame-based tools
-                # =====================================
-                elif tool_name in [
-                    "correlation",
-                    "pca",
-                    "clustering"
-                ]:
-
-                    results[tool_name] = tool_func(numeric_df)
-
-                # =====================================
-                # Unknown
-                # =====================================
+            # =====================================
+            # Column-based tools
+            # =====================================
+            if tool_input_type == SERIES:
+
+                results[tool_name] = {}
+
+                batch_func = tool_entry.get("batch")
+                deferred = [] if batch_func else None
+
+                for col, values in columns.items():
+
+                    if len(values) < min_size:
+                        continue
+
+                    schedule(
+                        (tool_name, col),
+                        tool_func,
+                        values,
+                        cost_per_row * len(values),
+                        params,
+                        deferred
+                    )
+
+                # Tools with a batch variant get their uncached columns in
+                # a few column-chunk tasks, so the chunks still run in
+                # parallel and time out independently
+                for i, chunk in enumerate(self.batch_chunks(deferred or [])):
+                    batch_key = (tool_name, f"{BATCH}{i}")
+                    batches[batch_key] = [key for key, _, _ in chunk]
+
+                    tasks.append((
+                        batch_key,
+                        partial(batch_func, cache=self.cache),
+                        {key[1]: data for key, data, _ in chunk},
+                        sum(cost for _, _, cost in chunk)
+                    ))
+
+            # =====================================
+            # DataFrame-based tools
+            # =====================================
+            elif tool_input_type == DATAFRAME:
+
+                if row_count < min_size:
+                    continue
+
+                schedule(
+                    (tool_name, None),
+                    tool_func,
+                    numeric_df,
+                    cost_per_row * row_count * max(len(numeric_columns), 1),
+                    params
+                )
+
+            # =====================================
+            # Unknown
+            # =====================================
+            else:
+
+                print(f"Unsupported tool mode: {tool_name}")
+
+        with profiler.span("tools", tasks=len(tasks), cached=len(cached)):
+            outcomes = self.scheduler.run(tasks, profiler=profiler)
+
+        # Split batch outcomes back into per-column outcomes
+        for batch_key, members in batches.items():
+
+            status, value = outcomes.pop(batch_key)
+
+            for task_key in members:
+                if status != "ok":
+                    outcomes[task_key] = (status, value)
+                elif task_key[1] in value:
+                    outcomes[task_key] = (status, value[task_key[1]])
                 else:
+                    outcomes[task_key] = (
+                        "error",
+                        f"batch result has no column {task_key[1]!r}"
+                    )
 
-                    print(f"Unsupported tool mode: {tool_name}")
+        for task_key, cache_key in cache_keys.items():
 
-            except Exception as e:
+            status, value = outcomes[task_key]
 
-                results[tool_name] = {
-                    "error": str(e)
-                }
+            if status == "ok":
+                self.cache.put(cache_key, task_key[0], value)
+
+        outcomes.update(cached)
+
+        # Reassemble in plan/column order; any failed task reports the
+        # whole tool as failed, as the sequential loop did
+        failed = set()
+
+        for tool_name, col in order:
+
+            if tool_name in failed:
+                continue
+
+            status, value = outcomes[(tool_name, col)]
+
+            if status == "error":
+                failed.add(tool_name)
+                results[tool_name] = {"error": value}
+            elif col is None:
+                results[tool_name] = value
+            else:
+                results[tool_name][col] = value
 
         # -------------------------
         # 4. Metadata
@@ -118,27 +292,52 @@ class ExecutionPipeline:
             "numeric_columns": numeric_columns,
             "analysis_results": results
         }
-        self.apply_highlights(file_path, results)
+
+        with profiler.span("highlight"):
+            self.apply_highlights(session, results)
+
+        # Standalone calls save their own highlights; a shared session
+        # is saved once by its owner
+        if owns_session:
+            with profiler.span("save"):
+                session.save()
+
+        final_result["telemetry"] = profiler.summary()
 
         return final_result
 
 
 
-    def apply_highlights(self, file_path, results):
+    def apply_highlights(self, session, results):
 
         # -------------------------
-        # Load workbook
+        # Shared workbook
         # -------------------------
-        wb = Workbook(file_path)
-
         # First worksheet
-        ws = wb.worksheets[0]
+        ws = session.worksheet(0)
 
         # -------------------------
         # Get anomaly results
         # -------------------------
         anomaly_results = results.get("anomaly", {})
 
+        if not any(
+            isinstance(anomalies, list) and anomalies
+            for anomalies in anomaly_results.values()
+        ):
+            return
+
+        # -------------------------
+        # Built once per run
+        # -------------------------
+        from excel.formatter import Formatter
+
+        formatter = Formatter()
+
+        columns = formatter.header_index(ws)
+
+        style, flag = formatter.anomaly_style(session.workbook)
+
         # -------------------------
         # Loop each column
         # -------------------------
@@ -148,54 +347,13 @@ class ExecutionPipeline:
             if not anomalies:
                 continue
 
-            # -------------------------
-            # Find column index
-            # -------------------------
-            cells = ws.cells
-
-            max_col = cells.max_data_column
-
-            excel_col = -1
-
-            for c in range(max_col + 1):
-
-                header_value = cells.get(0, c).string_value
-
-                if header_value == column_name:
-                    excel_col = c
-                    break
+            excel_col = columns.get(str(column_name))
 
-            if excel_col == -1:
+            if excel_col is None:
                 continue
 
-            # -------------------------
-            # Highlight anomaly cells
-            # -------------------------
-            for item in anomalies:
-                pandas_index = item["index"]
+            # +1 => skip header
+            rows = [item["index"] + 1 for item in anomalies]
 
-                # +2 because:
-                # +1 => skip header
-                # +1 => pandas starts at 0
-                excel_row = pandas_index + 2
-
-                cell = cells.get(excel_row - 1, excel_col)
-
-                style = cell.get_style()
-
-                # Red fill
-                style.foreground_color = Color.red
-                style.pattern = BackgroundType.SOLID
-
-
-                # Optional: white font
-                font = style.font
-                font.color = Color.white
-                font.is_bold = True
-
-                cell.set_style(style)
-
-        # -------------------------
-        # Save workbook
-        # -------------------------
-        wb.save(file_path)
\ No newline at end of file
+            if formatter.highlight_rows(ws, excel_col, rows, style, flag):
+                session.mark_dirty()
@@ -1,13 +1,13 @@
-from excel.writer import ExcelWriter
-
-
 class ReportPipeline:
 
-    def generate(self, results,output_path):
+    def generate(self, results,output_path, charts=False):
+
+        from excel.writer import ExcelWriter
 
         ExcelWriter.write_report(
             output_path=output_path,
-            reports=results
+            reports=results,
+            charts=charts
         )
 
         print("Report generated.")
\ No newline at end of file
@@ -6,5 +6,5 @@ class RoutingPipeline:
     def __init__(self):
         self.planner = Planner()
 
-    def route(self, file_path, request):
+    def route(self, request, session=None):
         return self.planner.create_plan(request)
\ No newline at end of file
@@ -0,0 +1,291 @@
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait
+)
+from functools import partial
+
+import numpy as np
+
+from config import MAX_WORKERS, TASK_TIMEOUT, EXECUTOR
+from telemetry.profiler import input_size, profiled_call
+
+
+# How often pending tasks are checked for having started or overrun
+POLL_INTERVAL = 0.05
+
+
+def _register_worker(pids):
+
+    # Process pool initializer: reports the worker's pid, so workers
+    # stuck in a timed-out task can be terminated without reaching into
+    # the executor's internals
+    pids.put(os.getpid())
+
+
+class DaemonThreadPool:
+
+    # Minimal thread pool whose workers are daemon threads. A Python
+    # thread can't be stopped, so a task that overran its timeout keeps
+    # running; unlike ThreadPoolExecutor's workers, these don't make
+    # shutdown or interpreter exit wait for it.
+
+    def __init__(self, max_workers):
+        self._queue = queue.SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(max_workers)
+        ]
+
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, func, argument):
+
+        future = Future()
+        self._queue.put((future, func, argument))
+
+        return future
+
+    def _work(self):
+
+        while True:
+            item = self._queue.get()
+
+            if item is None:
+                return
+
+            future, func, argument = item
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(func(argument))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if item is not None:
+                    item[0].cancel()
+
+        for _ in self._threads:
+            self._queue.put(None)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+class ToolScheduler:
+
+    def __init__(self, max_workers=None, timeout=None, executor=None):
+
+        # timeout: seconds a task may run, counted from when it starts;
+        # 0 disables the limit
+        self.max_workers = max_workers or MAX_WORKERS
+        self.timeout = TASK_TIMEOUT if timeout is None else timeout
+        self.executor = executor or EXECUTOR
+
+    @staticmethod
+    def prepare_columns(numeric_df, min_size=3):
+
+        # Each column is converted once and shared by every tool, instead
+        # of a fresh dropna/astype/tolist per (tool, column).
+        prepared = {}
+
+        for col in numeric_df.columns:
+
+            values = numeric_df[col].dropna().to_numpy(dtype=np.float64)
+
+            if len(values) < min_size:
+                continue
+
+            prepared[col] = values
+
+        return prepared
+
+    def run(self, tasks, profiler=None):
+
+        # tasks: list of (key, func, argument, estimated_cost)
+        # returns: {key: ("ok", result) | ("error", message)}
+        # With a profiler every task is timed where it runs and recorded
+        # as a "task" span named after the key's tool.
+        if profiler is not None:
+            tasks = [
+                (key, partial(profiled_call, func), argument, cost)
+                for key, func, argument, cost in tasks
+            ]
+
+            sizes = {key: input_size(argument) for key, _, argument, _ in tasks}
+
+        # Inline only when nothing needs a timeout: a call on the
+        # caller's thread can't be interrupted
+        if not tasks or (
+            self.timeout <= 0 and (self.max_workers <= 1 or len(tasks) <= 1)
+        ):
+            outcomes = {
+                key: self._call(func, argument)
+                for key, func, argument, _ in tasks
+            }
+
+            return self._unwrap(outcomes, profiler, sizes) if profiler else outcomes
+
+        # Most expensive first, so long tasks don't start last and leave
+        # the other workers idle at the end
+        tasks = sorted(tasks, key=lambda task: task[3], reverse=True)
+
+        workers = max(min(self.max_workers, len(tasks)), 1)
+        pids = None
+
+        if self.executor == "process":
+            # Spawned rather than forked: a fork of a process running the
+            # .NET runtime (Aspose) can hang in the child
+            context = multiprocessing.get_context("spawn")
+            pids = context.SimpleQueue()
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_register_worker,
+                initargs=(pids,)
+            )
+        else:
+            pool = DaemonThreadPool(workers)
+
+        outcomes = {}
+        timed_out = False
+
+        try:
+
+            pending = {
+                pool.submit(func, argument): key
+                for key, func, argument, _ in tasks
+            }
+
+            outcomes, timed_out = self._collect(pending)
+
+        finally:
+            # Don't block on tasks that timed out
+            if timed_out and pids is not None:
+                self._terminate(pids)
+
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return self._unwrap(outcomes, profiler, sizes) if profiler else outcomes
+
+    def _collect(self, pending):
+
+        # Waits for the futures, failing any that runs longer than the
+        # timeout. A task's clock starts when its future is marked running
+        # (for process pools, when it is handed to the workers), so tasks
+        # queued behind slow ones aren't charged for the wait.
+        outcomes = {}
+        started = {}
+        timed_out = False
+
+        while pending:
+
+            now = time.monotonic()
+
+            for future in pending:
+                if future not in started and future.running():
+                    started[future] = now
+
+            if self.timeout > 0:
+                for future, since in list(started.items()):
+
+                    if future not in pending or now - since < self.timeout:
+                        continue
+
+                    if future.done():
+                        continue
+
+                    future.cancel()
+                    timed_out = True
+                    outcomes[pending.pop(future)] = (
+                        "error",
+                        f"timed out after {self.timeout:g}s"
+                    )
+
+            if not pending:
+                break
+
+            done, _ = wait(
+                pending,
+                timeout=POLL_INTERVAL,
+                return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+
+                key = pending.pop(future)
+
+                try:
+                    outcomes[key] = ("ok", future.result())
+                except Exception as e:
+                    outcomes[key] = ("error", str(e))
+
+        return outcomes, timed_out
+
+    @staticmethod
+    def _terminate(pids):
+
+        # Worker processes stuck in a timed-out task would otherwise keep
+        # running after shutdown
+        while not pids.empty():
+            try:
+                os.kill(pids.get(), signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+    @staticmethod
+    def _unwrap(outcomes, profiler, sizes):
+
+        # Splits profiled results back into plain outcomes, recording a
+        # span per task (failed tasks have no measurements of their own)
+        plain = {}
+
+        for key, (status, value) in outcomes.items():
+
+            name, column = key if isinstance(key, tuple) else (key, None)
+
+            if status == "ok":
+                value, stats = value
+                profiler.record(
+                    name, "task",
+                    column=column, size=sizes[key], status=status,
+                    **stats
+                )
+            else:
+                profiler.record(
+                    name, "task", start=time.time(), wall=0.0,
+                    column=column, size=sizes[key], status=status
+                )
+
+            plain[key] = (status, value)
+
+        return plain
+
+    @staticmethod
+    def _call(func, argument):
+
+        try:
+            return ("ok", func(argument))
+
+        except Exception as e:
+            return ("error", str(e))
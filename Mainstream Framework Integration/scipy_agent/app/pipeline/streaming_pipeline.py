@@ -0,0 +1,178 @@
+# app/pipeline/streaming_pipeline.py
+
+import numpy as np
+
+from analysis.correlation import CorrelationAnalysis
+from analysis.streaming import (
+    QuantileSketch,
+    RunningCovariance,
+    RunningMoments
+)
+from config import (
+    CHUNK_ROWS,
+    CORRELATION_MATRIX_MAX_COLUMNS,
+    CORRELATION_TOP_K
+)
+from excel.chunked_reader import ChunkedSheetReader
+
+
+class StreamingExecutionPipeline:
+
+    # Chunked counterpart of ExecutionPipeline for sheets too large to
+    # hold as a DataFrame. The sheet is streamed in row windows into
+    # mergeable accumulators; anomaly scoring takes a second pass once
+    # the global mean and std are known.
+
+    SUPPORTED_TOOLS = ["statistics", "correlation", "anomaly"]
+
+    def __init__(self, chunk_rows=None, threshold=3):
+        self.chunk_rows = chunk_rows or CHUNK_ROWS
+        self.threshold = threshold
+
+    def execute(self, plan, file_path, sheet_index=0):
+
+        tools = plan.get("tools", [])
+
+        if not isinstance(tools, list):
+            tools = [tools]
+
+        # -------------------------
+        # 1. Accumulate
+        # -------------------------
+        state = {"rows": 0}
+
+        def accumulate(block, row_ids):
+
+            if "moments" not in state:
+                width = block.shape[1]
+                state["moments"] = RunningMoments(width)
+                state["sketch"] = QuantileSketch(width)
+
+                if "correlation" in tools:
+                    state["covariance"] = RunningCovariance(width)
+
+            state["rows"] += len(block)
+            state["moments"].update(block)
+            state["sketch"].update(block)
+
+            if "covariance" in state:
+                state["covariance"].update(block)
+
+        header = ChunkedSheetReader.read(
+            file_path,
+            accumulate,
+            sheet_index=sheet_index,
+            chunk_rows=self.chunk_rows
+        )
+
+        if "moments" not in state:
+            return {
+                "row_count": 0,
+                "column_count": len(header),
+                "numeric_columns": [],
+                "analysis_results": {}
+            }
+
+        moments = state["moments"]
+
+        numeric = [c for c in range(len(moments.count)) if moments.count[c] >= 3]
+        names = {c: header.get(c, c) for c in numeric}
+
+        # -------------------------
+        # 2. Tool results
+        # -------------------------
+        results = {}
+
+        for tool_name in tools:
+
+            print(f"Running tool: {tool_name}")
+
+            if tool_name == "statistics":
+                results[tool_name] = self._statistics(state, numeric, names)
+
+            elif tool_name == "correlation":
+                results[tool_name] = self._correlation(state, numeric, names)
+
+            elif tool_name == "anomaly":
+                results[tool_name] = self._anomalies(
+                    file_path, sheet_index, moments, numeric, names
+                )
+
+            else:
+                results[tool_name] = {
+                    "error": f"{tool_name} is not available in chunked mode"
+                }
+
+        return {
+            "row_count": state["rows"],
+            "column_count": len(header),
+            "numeric_columns": [names[c] for c in numeric],
+            "analysis_results": results
+        }
+
+    @staticmethod
+    def _statistics(state, numeric, names):
+
+        moments = state["moments"]
+        median = state["sketch"].quantile(0.5)
+
+        mean, std, variance = moments.mean, moments.std(), moments.variance()
+        skewness, kurtosis = moments.skewness(), moments.kurtosis()
+
+        return {
+            names[c]: {
+                "mean": float(mean[c]),
+                "median": float(median[c]),
+                "std": float(std[c]),
+                "variance": float(variance[c]),
+                "min": float(moments.min[c]),
+                "max": float(moments.max[c]),
+                "skewness": float(skewness[c]),
+                "kurtosis": float(kurtosis[c])
+            }
+            for c in numeric
+        }
+
+    @staticmethod
+    def _correlation(state, numeric, names):
+
+        covariance = state["covariance"]
+
+        # Same layout as CorrelationAnalysis.correlation_matrix
+        return CorrelationAnalysis.summarize(
+            covariance.correlation()[np.ix_(numeric, numeric)],
+            [str(names[c]) for c in numeric],
+            covariance.n[np.ix_(numeric, numeric)].astype(np.int64),
+            top_k=CORRELATION_TOP_K,
+            dense=len(numeric) <= CORRELATION_MATRIX_MAX_COLUMNS
+        )
+
+    def _anomalies(self, file_path, sheet_index, moments, numeric, names):
+
+        mean, std = moments.mean, moments.std()
+
+        found = {c: [] for c in numeric}
+
+        def score(block, row_ids):
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                z_scores = np.abs((block - mean) / std)
+
+            rows, cols = np.nonzero(z_scores > self.threshold)
+
+            for r, c in zip(rows, cols):
+                if c in found:
+                    found[c].append({
+                        "index": int(row_ids[r]),
+                        "value": float(block[r, c]),
+                        "zscore": float(z_scores[r, c])
+                    })
+
+        ChunkedSheetReader.read(
+            file_path,
+            score,
+            sheet_index=sheet_index,
+            chunk_rows=self.chunk_rows
+        )
+
+        return {names[c]: found[c] for c in numeric}
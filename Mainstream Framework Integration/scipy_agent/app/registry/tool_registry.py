@@ -1,44 +1,241 @@
-"""
-'''from tools.anomaly_tool import run_anomaly
-from tools.regression_tool import run_regression
-from tools.trend_tool import run_trend
-from tools.fft_tool import run_fft
-from tools.statistics_tool import run_statistics
-from tools.forecast_tool import run_forecast
-
-
-TOOL_REGISTRY = {
-    "anomaly": run_anomaly,
-    "regression": run_regression,
-    "trend": run_trend,
-    "fft": run_fft,
-    "statistics": run_statistics,
-    "forecast": run_forecast
-}
-"""
-from tools.anomaly_tool import run_anomaly
-from tools.trend_tool import run_trend
-from tools.correlation_tool import run_correlation
-from tools.pca_tool import run_pca
-
-TOOL_REGISTRY = {
-    "anomaly": {
-        "func": run_anomaly,
-        "input": "series"
-    },
-
-    "trend": {
-        "func": run_trend,
-        "input": "series"
-    },
-
-    "correlation": {
-        "func": run_correlation,
-        "input": "dataframe"
-    },
-
-    "pca": {
-        "func": run_pca,
-        "input": "dataframe"
+import hashlib
+import inspect
+import sys
+from importlib import import_module
+from importlib.metadata import entry_points
+
+# Third-party tools register under this entry point group. An entry point
+# may load to a spec dict (same keys as register_tool) or to a callable,
+# which is registered as a series tool with default settings.
+ENTRY_POINT_GROUP = "scipy_agent.tools"
+
+# Packages whose modules a tool's code fingerprint follows
+FINGERPRINT_PACKAGES = ("analysis", "tools")
+
+# Input kinds the ExecutionPipeline knows how to feed
+SERIES = "series"
+DATAFRAME = "dataframe"
+
+TOOL_REGISTRY = {}
+
+_entry_points_loaded = False
+
+
+def register_tool(
+    name,
+    func,
+    input=SERIES,
+    min_size=3,
+    cost_per_row=1.0,
+    max_rows=None,
+    batch=None,
+    params=None
+):
+
+    # func / batch: a callable, or a "module:attribute" reference that is
+    #               only imported when the tool first runs
+    # min_size: fewest non-empty values a column needs for the tool
+    # cost_per_row: relative cost estimate used to order work
+    # max_rows: default size limit above which the tool is skipped
+    # batch: optional series-tool variant taking {column: values} (and a
+    #        cache keyword) that processes a chunk of columns in one task
+    # params: optional callable (or reference) returning the settings the
+    #         tool's output depends on, e.g. config values; part of its
+    #         result cache key
+    if input not in (SERIES, DATAFRAME):
+        raise ValueError(f"Unknown input kind for tool {name}: {input}")
+
+    TOOL_REGISTRY[name] = {
+        "func": func,
+        "input": input,
+        "min_size": min_size,
+        "cost_per_row": cost_per_row,
+        "max_rows": max_rows,
+        "batch": batch,
+        "params": params
     }
-}
\ No newline at end of file
+
+
+def load_tool(name):
+
+    # Registry entry with func/batch imported, or None for an unknown
+    # tool. Third-party tools are discovered on the first lookup rather
+    # than at import, and may still replace a built-in.
+    global _entry_points_loaded
+
+    if not _entry_points_loaded:
+        _entry_points_loaded = True
+        load_entry_point_tools()
+
+    entry = TOOL_REGISTRY.get(name)
+
+    if entry is None:
+        return None
+
+    for key in ("func", "batch", "params"):
+        if isinstance(entry.get(key), str):
+            entry[key] = _resolve(entry[key])
+
+    return entry
+
+
+def cache_params(entry):
+
+    # What a cached result of a loaded tool depends on besides its input:
+    # its current settings and a fingerprint of its code, so a changed
+    # setting or analysis never serves an old result
+    if "code" not in entry:
+        entry["code"] = code_fingerprint(
+            [entry[key] for key in ("func", "batch") if callable(entry.get(key))]
+        )
+
+    settings = entry["params"]() if callable(entry.get("params")) else {}
+
+    return {"code": entry["code"], **settings}
+
+
+def code_fingerprint(funcs):
+
+    # Hash of the source files of the modules defining funcs and of the
+    # analysis/tools modules they reach through their globals
+    seen = {}
+    stack = [inspect.getmodule(func) for func in funcs]
+
+    while stack:
+
+        module = stack.pop()
+
+        if module is None or module.__name__ in seen:
+            continue
+
+        try:
+            with open(inspect.getfile(module), "rb") as f:
+                seen[module.__name__] = hashlib.sha256(f.read()).hexdigest()
+        except (OSError, TypeError):
+            seen[module.__name__] = ""
+
+        for value in vars(module).values():
+
+            name = getattr(value, "__name__", None) if inspect.ismodule(value) \
+                else getattr(value, "__module__", None)
+
+            if name and name.split(".")[0] in FINGERPRINT_PACKAGES:
+                stack.append(sys.modules.get(name))
+
+    digest = hashlib.sha256()
+
+    for name in sorted(seen):
+        digest.update(f"{name}:{seen[name]};".encode())
+
+    return digest.hexdigest()[:16]
+
+
+def _resolve(reference):
+
+    module_name, _, attribute = reference.partition(":")
+
+    return getattr(import_module(module_name), attribute)
+
+
+def load_entry_point_tools(group=ENTRY_POINT_GROUP):
+
+    for entry_point in entry_points(group=group):
+
+        try:
+            spec = entry_point.load()
+        except Exception as e:
+            print(f"Could not load tool {entry_point.name}: {e}")
+            continue
+
+        if callable(spec):
+            spec = {"func": spec}
+
+        register_tool(entry_point.name, **spec)
+
+
+# -------------------------
+# Built-in tools
+# -------------------------
+register_tool("statistics", "tools.statistics_tool:run_statistics", min_size=3, cost_per_row=0.2)
+
+register_tool(
+    "anomaly",
+    "tools.anomaly_tool:run_anomaly",
+    min_size=3,
+    cost_per_row=0.1,
+    batch="tools.anomaly_tool:run_anomaly_batch"
+)
+
+register_tool(
+    "outlier",
+    "tools.outlier_tool:run_outlier",
+    min_size=4,
+    cost_per_row=0.2,
+    batch="tools.outlier_tool:run_outlier_batch"
+)
+
+register_tool(
+    "change_point",
+    "tools.change_point_tool:run_change_point",
+    min_size=3,
+    cost_per_row=0.1,
+    batch="tools.change_point_tool:run_change_point_batch"
+)
+
+register_tool("trend", "tools.trend_tool:run_trend", min_size=3, cost_per_row=0.2)
+register_tool("smoothing", "tools.smoothing_tool:run_smoothing", min_size=3, cost_per_row=0.2)
+register_tool("regression", "tools.regression_tool:run_regression", min_size=3, cost_per_row=0.2)
+register_tool("fft", "tools.fft_tool:run_fft", min_size=3, cost_per_row=0.5)
+register_tool("distribution", "tools.distribution_tool:run_distribution", min_size=8, cost_per_row=0.5)
+
+register_tool(
+    "forecast",
+    "tools.forecast_tool:run_forecast",
+    min_size=5,
+    cost_per_row=20.0,
+    batch="tools.forecast_tool:run_forecast_batch"
+)
+
+register_tool(
+    "seasonality",
+    "tools.seasonality_tool:run_seasonality",
+    min_size=8,
+    cost_per_row=5.0,
+    max_rows=500_000,
+    batch="tools.seasonality_tool:run_seasonality_batch"
+)
+
+register_tool(
+    "clustering",
+    "tools.clustering_tool:run_clustering",
+    min_size=3,
+    cost_per_row=50.0,
+    params="tools.clustering_tool:clustering_params"
+)
+
+register_tool(
+    "multivariate_clustering",
+    "tools.clustering_tool:run_multivariate_clustering",
+    input=DATAFRAME,
+    min_size=3,
+    cost_per_row=50.0,
+    params="tools.clustering_tool:clustering_params"
+)
+
+register_tool(
+    "correlation",
+    "tools.correlation_tool:run_correlation",
+    input=DATAFRAME,
+    min_size=2,
+    cost_per_row=1.0,
+    params="tools.correlation_tool:correlation_params"
+)
+
+register_tool(
+    "pca",
+    "tools.pca_tool:run_pca",
+    input=DATAFRAME,
+    min_size=2,
+    cost_per_row=5.0,
+    params="tools.pca_tool:pca_params"
+)
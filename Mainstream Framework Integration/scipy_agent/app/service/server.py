@@ -0,0 +1,361 @@
+# Long-running local service for ExcelAgent.
+#
+# Jobs are handed to a pool of worker processes that imported Aspose,
+# SciPy, statsmodels and scikit-learn (and applied the license) when the
+# service started, so a request only pays for its own analysis.
+#
+#   POST /analyze?request=...[&filename=sales.xlsx][&chunk_rows=N]
+#        body: the workbook bytes
+#        reply: JSON lines, {"event": "accepted"} as soon as the job is
+#        queued, then {"event": "result"} or {"event": "error"}; 503
+#        when AGENT_SERVICE_MAX_RUNNING jobs are already queued
+#   GET  /jobs/<id>/report     the generated report workbook
+#   GET  /jobs/<id>/workbook   the analysed workbook (with highlights)
+#   GET  /health
+#
+# Usage (from the scipy_agent folder):
+#     python app/main.py serve --port 8765
+#     python app/main.py serve --socket /tmp/scipy_agent.sock
+#     curl --data-binary @sales.xlsx "localhost:8765/analyze?request=detect+anomalies"
+
+import json
+import math
+import multiprocessing
+import os
+import re
+import shutil
+import socketserver
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from config import (
+    ASPOSE_LICENSE_PATH,
+    SERVICE_HOST,
+    SERVICE_MAX_JOBS,
+    SERVICE_MAX_RUNNING,
+    SERVICE_PORT,
+    SERVICE_WORKERS
+)
+from service import worker
+
+
+def jsonable(value):
+
+    # Analysis results hold NumPy arrays and scalars, NaN and timestamps
+    if isinstance(value, dict):
+        return {str(k): jsonable(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [jsonable(v) for v in value]
+
+    if isinstance(value, np.ndarray):
+        return jsonable(value.tolist())
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+
+    return str(value)
+
+
+# Extensions an upload keeps, so the workbook is saved back in its format
+WORKBOOK_EXTENSIONS = {".xlsx", ".xlsm", ".xlsb", ".xls", ".ods", ".csv"}
+
+
+# Characters a download name keeps; anything else (quotes, CR/LF and
+# other control characters, non-ASCII) is replaced before the name is
+# echoed back in the Content-Disposition header
+UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._ -]")
+
+
+def download_name(filename):
+
+    name = UNSAFE_NAME.sub("_", os.path.basename(filename or "")).strip(" .")
+
+    return name or "workbook.xlsx"
+
+
+class JobStore:
+
+    # Working folders of the most recent jobs; older finished ones are
+    # deleted. Uploads are stored under a fixed name next to the report,
+    # the client's file name is only kept for downloads.
+
+    def __init__(self, root, max_jobs, max_running):
+        self.root = root
+        self.max_jobs = max_jobs
+        self.max_running = max_running
+        self.jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, filename):
+
+        # Returns (job id, paths), or None when max_running jobs are
+        # already queued or running
+        extension = os.path.splitext(filename)[1].lower()
+
+        if extension not in WORKBOOK_EXTENSIONS:
+            extension = ".xlsx"
+
+        job_id = uuid.uuid4().hex
+        folder = os.path.join(self.root, job_id)
+
+        paths = {
+            "workbook": os.path.join(folder, "input" + extension),
+            "report": os.path.join(folder, "report.xlsx")
+        }
+
+        with self._lock:
+            if self.running() >= self.max_running:
+                return None
+
+            os.makedirs(folder)
+
+            self.jobs[job_id] = {
+                "paths": paths,
+                "filename": filename,
+                "running": True
+            }
+
+            self._evict()
+
+        return job_id, paths
+
+    def finish(self, job_id):
+
+        with self._lock:
+            job = self.jobs.get(job_id)
+
+            if job:
+                job["running"] = False
+
+            self._evict()
+
+    def running(self):
+        return sum(job["running"] for job in self.jobs.values())
+
+    def path(self, job_id, kind):
+
+        # (path on disk, download name), or None
+        with self._lock:
+            job = self.jobs.get(job_id)
+
+        if not job or kind not in job["paths"]:
+            return None
+
+        path = job["paths"][kind]
+        name = job["filename"] if kind == "workbook" else os.path.basename(path)
+
+        return path, name
+
+    def _evict(self):
+
+        # Oldest finished jobs first; a running job's folder is in use
+        finished = [
+            job_id for job_id, job in self.jobs.items() if not job["running"]
+        ]
+
+        for job_id in finished[:max(len(self.jobs) - self.max_jobs, 0)]:
+            del self.jobs[job_id]
+            shutil.rmtree(os.path.join(self.root, job_id), ignore_errors=True)
+
+
+class AgentRequestHandler(BaseHTTPRequestHandler):
+
+    def address_string(self):
+
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+
+        return "unix"
+
+    def do_GET(self):
+
+        parts = urlparse(self.path).path.strip("/").split("/")
+
+        if parts == ["health"]:
+            return self._send_json(200, {
+                "status": "ok",
+                "workers": self.server.workers,
+                "jobs": len(self.server.jobs.jobs),
+                "running": self.server.jobs.running()
+            })
+
+        if len(parts) == 3 and parts[0] == "jobs":
+            found = self.server.jobs.path(parts[1], parts[2])
+
+            if found and os.path.exists(found[0]):
+                return self._send_file(*found)
+
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+
+        url = urlparse(self.path)
+
+        if url.path != "/analyze":
+            return self._send_json(404, {"error": "not found"})
+
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        user_request = query.get("request")
+        length = int(self.headers.get("Content-Length") or 0)
+
+        if not user_request or not length:
+            return self._send_json(400, {
+                "error": "POST the workbook as the body with ?request=..."
+            })
+
+        # Download name only; the upload itself is stored as input.<ext>
+        filename = download_name(query.get("filename"))
+
+        chunk_rows = int(query["chunk_rows"]) if query.get("chunk_rows") else None
+
+        job = self.server.jobs.create(filename)
+
+        if job is None:
+            return self._send_json(503, {"error": "too many jobs, retry later"})
+
+        job_id, paths = job
+
+        try:
+            with open(paths["workbook"], "wb") as f:
+                f.write(self.rfile.read(length))
+
+            future = self.server.pool.submit(
+                worker.run_job,
+                paths["workbook"],
+                paths["report"],
+                user_request,
+                chunk_rows
+            )
+        except Exception:
+            self.server.jobs.finish(job_id)
+            raise
+
+        future.add_done_callback(lambda _: self.server.jobs.finish(job_id))
+
+        # Stream: acknowledge now, send the result when the worker is done
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+
+        self._write_line({"event": "accepted", "job": job_id})
+
+        try:
+            results = future.result()
+        except Exception as e:
+            return self._write_line({"event": "error", "job": job_id, "error": str(e)})
+
+        self._write_line({
+            "event": "result",
+            "job": job_id,
+            "report": f"/jobs/{job_id}/report",
+            "workbook": f"/jobs/{job_id}/workbook",
+            "results": jsonable(results)
+        })
+
+    def _write_line(self, payload):
+        self.wfile.write(json.dumps(payload).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, payload):
+
+        body = json.dumps(payload).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_file(self, path, name):
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.send_header(
+            "Content-Disposition",
+            f'attachment; filename="{name}"'
+        )
+        self.end_headers()
+
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+def start_pool(workers, license_path=None):
+
+    # Spawned rather than forked, so no worker inherits a half-started
+    # .NET runtime; one ping per worker makes them all start (and warm
+    # up) before the first request arrives
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=worker.warm_up,
+        initargs=(license_path,)
+    )
+
+    pings = [pool.submit(worker.ping, 0.5) for _ in range(workers)]
+    pids = {ping.result() for ping in pings}
+
+    print(f"{len(pids)} warm worker(s) ready")
+
+    return pool
+
+
+def serve(host=None, port=None, socket_path=None, workers=None, job_dir=None):
+
+    workers = workers or SERVICE_WORKERS
+    job_dir = job_dir or tempfile.mkdtemp(prefix="scipy_agent_jobs_")
+
+    pool = start_pool(workers, ASPOSE_LICENSE_PATH)
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        server = UnixHTTPServer(socket_path, AgentRequestHandler)
+        where = socket_path
+    else:
+        server = ThreadingHTTPServer(
+            (host or SERVICE_HOST, port or SERVICE_PORT),
+            AgentRequestHandler
+        )
+        where = "http://%s:%d" % server.server_address[:2]
+
+    server.pool = pool
+    server.workers = workers
+    server.jobs = JobStore(job_dir, SERVICE_MAX_JOBS, SERVICE_MAX_RUNNING)
+
+    print(f"Serving ExcelAgent on {where}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown(cancel_futures=True)
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
@@ -0,0 +1,63 @@
+# Code that runs inside the service's worker processes. Each worker pays
+# the import and runtime start-up costs once, in warm_up, and then reuses
+# one ExcelAgent (with its plan cache) for every job it is handed.
+
+import io
+import os
+import time
+
+_agent = None
+
+
+def warm_up(license_path=None):
+
+    global _agent
+
+    # Heavy imports: .NET runtime, SciPy, statsmodels and scikit-learn
+    import aspose.cells as cells
+    import scipy.signal  # noqa: F401
+    import sklearn.cluster  # noqa: F401
+    import statsmodels.tsa.holtwinters  # noqa: F401
+
+    from agents.excel_agent import ExcelAgent
+    from registry.tool_registry import TOOL_REGISTRY, load_tool
+
+    # Tool backends are imported lazily; a worker wants them all up front
+    for name in list(TOOL_REGISTRY):
+        load_tool(name)
+
+    if license_path and os.path.exists(license_path):
+        cells.License().set_license(license_path)
+
+    # First workbook and save JIT-compile the common Aspose paths
+    cells.Workbook().save(io.BytesIO(), cells.SaveFormat.XLSX)
+
+    _agent = ExcelAgent()
+
+
+def ping(hold=0.0):
+
+    # Holding the worker briefly lets concurrent pings land on different
+    # workers, so each one is started (and warmed up) by its own ping
+    time.sleep(hold)
+
+    return os.getpid()
+
+
+def run_job(file_path, output_file, user_request, chunk_rows=None):
+
+    start = time.perf_counter()
+
+    results = _agent.run(
+        file_path=file_path,
+        output_file=output_file,
+        user_request=user_request,
+        chunk_rows=chunk_rows
+    )
+
+    results["worker"] = {
+        "pid": os.getpid(),
+        "seconds": time.perf_counter() - start
+    }
+
+    return results
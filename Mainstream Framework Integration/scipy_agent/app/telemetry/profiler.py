@@ -0,0 +1,196 @@
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+
+    # High-water mark of this process's resident set, or None where the
+    # platform doesn't report it
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports KiB, macOS bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+
+    return peak / 1024
+
+
+def input_size(argument):
+
+    # Number of values handed to a tool (arrays and frames have .size)
+    if isinstance(getattr(argument, "size", None), int):
+        return argument.size
+
+    if isinstance(argument, dict):
+        return sum(input_size(v) for v in argument.values())
+
+    try:
+        return len(argument)
+    except TypeError:
+        return None
+
+
+def profiled_call(func, argument):
+
+    # Runs one task and measures it where it runs, so thread-pool tasks
+    # get their own thread's CPU time and process-pool tasks their
+    # worker's peak RSS. Module level so process pools can pickle it.
+    start = time.time()
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+
+    result = func(argument)
+
+    return result, {
+        "start": start,
+        "wall": time.perf_counter() - wall,
+        "cpu": time.thread_time() - cpu,
+        "peak_rss_mb": peak_rss_mb(),
+        "pid": os.getpid(),
+        "thread": threading.get_ident()
+    }
+
+
+class Profiler:
+
+    # Collects timing spans for one agent run: pipeline phases (wall and
+    # process CPU time) and tool tasks (wall and thread CPU time, input
+    # size). Spans can be exported as JSON lines or as a Chrome trace
+    # (chrome://tracing, Perfetto) and are summarised into final_result.
+
+    def __init__(self, run_id=None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.spans = []
+
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    @contextmanager
+    def span(self, name, category="phase", **args):
+
+        start = time.time()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+
+        try:
+            yield
+        finally:
+            self.record(
+                name,
+                category,
+                start=start,
+                wall=time.perf_counter() - wall,
+                cpu=time.process_time() - cpu,
+                peak_rss_mb=peak_rss_mb(),
+                **args
+            )
+
+    def record(self, name, category, start, wall, cpu=None, peak_rss_mb=None,
+               pid=None, thread=None, **args):
+
+        with self._lock:
+            self.spans.append({
+                "run": self.run_id,
+                "name": name,
+                "category": category,
+                "start": start,
+                "wall": wall,
+                "cpu": cpu,
+                "peak_rss_mb": peak_rss_mb,
+                "pid": pid or os.getpid(),
+                "thread": thread or threading.get_ident(),
+                "args": args
+            })
+
+    def summary(self):
+
+        phases = {}
+        tools = {}
+
+        with self._lock:
+            spans = list(self.spans)
+
+        for span in spans:
+
+            if span["category"] == "phase":
+                phase = phases.setdefault(span["name"], {"wall": 0.0, "cpu": 0.0})
+                phase["wall"] += span["wall"]
+                phase["cpu"] += span["cpu"] or 0.0
+
+            elif span["category"] == "task":
+                tool = tools.setdefault(
+                    span["name"],
+                    {"tasks": 0, "wall": 0.0, "cpu": 0.0, "values": 0, "errors": 0}
+                )
+                tool["tasks"] += 1
+                tool["wall"] += span["wall"]
+                tool["cpu"] += span["cpu"] or 0.0
+                tool["values"] += span["args"].get("size") or 0
+                tool["errors"] += span["args"].get("status") == "error"
+
+        peaks = [s["peak_rss_mb"] for s in spans if s["peak_rss_mb"] is not None]
+
+        return {
+            "run": self.run_id,
+            "elapsed": time.time() - self._started,
+            "peak_rss_mb": max(peaks) if peaks else None,
+            "phases": phases,
+            "tools": tools
+        }
+
+    def export(self, path):
+
+        # *.jsonl appends one JSON object per span (several runs can share
+        # a file); anything else is written as a Chrome trace
+        if path.endswith(".jsonl"):
+            self.export_jsonl(path)
+        else:
+            self.export_chrome_trace(path)
+
+    def export_jsonl(self, path):
+
+        with self._lock:
+            spans = list(self.spans)
+
+        with open(path, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span, default=str) + "\n")
+
+    def export_chrome_trace(self, path):
+
+        with self._lock:
+            spans = list(self.spans)
+
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": span["start"] * 1e6,
+                "dur": span["wall"] * 1e6,
+                "pid": span["pid"],
+                "tid": span["thread"],
+                "args": {
+                    "cpu": span["cpu"],
+                    "peak_rss_mb": span["peak_rss_mb"],
+                    **span["args"]
+                }
+            }
+            for span in spans
+        ]
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events}, f, default=str)
@@ -1,5 +1,16 @@
 from analysis.anomaly import AnomalyAnalysis
+from tools.batch import pad_columns
 
 
 def run_anomaly(values):
-    return AnomalyAnalysis.detect_zscore(values)
\ No newline at end of file
+    return AnomalyAnalysis.detect_zscore(values)
+
+
+def run_anomaly_batch(columns, cache=None):
+
+    # columns: {name: 1-D float array}; one masked pass over all columns
+    names, matrix = pad_columns(columns)
+
+    records = AnomalyAnalysis.detect_zscore_batch(matrix, as_records=True)["records"]
+
+    return dict(zip(names, records))
@@ -0,0 +1,18 @@
+import numpy as np
+
+
+def pad_columns(columns):
+
+    # columns: {name: 1-D float array} of possibly different lengths.
+    # Returns (names, matrix): a (longest x columns) float matrix with
+    # each column NaN-padded at the end, the layout every *_batch
+    # analysis takes.
+    names = list(columns)
+
+    length = max((len(v) for v in columns.values()), default=0)
+    matrix = np.full((length, len(names)), np.nan)
+
+    for i, name in enumerate(names):
+        matrix[:len(columns[name]), i] = columns[name]
+
+    return names, matrix
@@ -0,0 +1,16 @@
+from analysis.change_point import ChangePointAnalysis
+from tools.batch import pad_columns
+
+
+def run_change_point(values):
+    return ChangePointAnalysis.detect(values)
+
+
+def run_change_point_batch(columns, cache=None):
+
+    # columns: {name: 1-D float array}; one masked pass over all columns
+    names, matrix = pad_columns(columns)
+
+    records = ChangePointAnalysis.detect_batch(matrix, as_records=True)["records"]
+
+    return dict(zip(names, records))
@@ -0,0 +1,14 @@
+from analysis.clustering import ClusteringAnalysis
+from config import LARGE_FIT_ROWS
+
+
+def clustering_params():
+    return {"large_rows": LARGE_FIT_ROWS}
+
+
+def run_clustering(values):
+    return ClusteringAnalysis.cluster(values, **clustering_params())
+
+
+def run_multivariate_clustering(values):
+    return ClusteringAnalysis.cluster_frame(values, **clustering_params())
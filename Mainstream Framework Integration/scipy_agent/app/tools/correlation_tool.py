@@ -1,5 +1,27 @@
 from analysis.correlation import CorrelationAnalysis
+from config import (
+    CORRELATION_MATRIX_MAX_COLUMNS,
+    CORRELATION_METHOD,
+    CORRELATION_TOP_K
+)
+
+
+def correlation_params():
+    return {
+        "method": CORRELATION_METHOD,
+        "top_k": CORRELATION_TOP_K,
+        "matrix_max_columns": CORRELATION_MATRIX_MAX_COLUMNS
+    }
 
 
 def run_correlation(values):
-    return CorrelationAnalysis.correlation_matrix(values)
\ No newline at end of file
+
+    params = correlation_params()
+    width = values.select_dtypes(include=['number']).shape[1]
+
+    return CorrelationAnalysis.correlation_matrix(
+        values,
+        method=params["method"],
+        top_k=params["top_k"],
+        dense=width <= params["matrix_max_columns"]
+    )
@@ -0,0 +1,5 @@
+from analysis.distribution import DistributionAnalysis
+
+
+def run_distribution(values):
+    return DistributionAnalysis.check_normal_distribution(values)
\ No newline at end of file
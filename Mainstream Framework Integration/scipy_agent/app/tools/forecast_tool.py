@@ -1,5 +1,55 @@
+import numpy as np
+
 from analysis.forecasting import ForecastingAnalysis
+from cache.result_cache import MISS, ResultCache
+from tools.batch import pad_columns
+
+# Leading values of a series that identify it for warm starts
+WARM_START_PREFIX = 32
 
 
 def run_forecast(values):
-    return ForecastingAnalysis.forecast(values)
\ No newline at end of file
+    return ForecastingAnalysis.forecast(values)
+
+
+def run_forecast_batch(columns, cache=None, steps=5, trend=False):
+
+    # columns: {name: 1-D float array}; fits every series in one pass.
+    # Fitted parameters are cached per column name and content of the
+    # series' first WARM_START_PREFIX values, so the next run of a grown
+    # series (e.g. a new month appended) warm-starts from them instead of
+    # repeating the full parameter search, while an unrelated series that
+    # only shares the name does not.
+    names, matrix = pad_columns(columns)
+
+    known = {}
+    keys = {}
+
+    if cache is not None:
+        for i, name in enumerate(names):
+            keys[name] = ResultCache.make_key(
+                "forecast_params",
+                np.asarray(columns[name][:WARM_START_PREFIX], dtype=float),
+                {"column": str(name), "trend": trend}
+            )
+
+            stored = cache.get(keys[name])
+
+            if stored is not MISS:
+                known[i] = stored
+
+    forecasts, params = ForecastingAnalysis.forecast_batch(
+        matrix,
+        steps=steps,
+        trend=trend,
+        known_params=known
+    )
+
+    if cache is not None:
+        for i, name in enumerate(names):
+            cache.put(keys[name], "forecast_params", params[i])
+
+    return {
+        name: forecasts[:, i].tolist()
+        for i, name in enumerate(names)
+    }
@@ -0,0 +1,16 @@
+from analysis.outlier import OutlierAnalysis
+from tools.batch import pad_columns
+
+
+def run_outlier(values):
+    return OutlierAnalysis.iqr_outliers(values)
+
+
+def run_outlier_batch(columns, cache=None):
+
+    # columns: {name: 1-D float array}; one masked pass over all columns
+    names, matrix = pad_columns(columns)
+
+    records = OutlierAnalysis.iqr_outliers_batch(matrix, as_records=True)["records"]
+
+    return dict(zip(names, records))
@@ -1,5 +1,14 @@
 from analysis.pca_analysis import PCAAnalysis
+from config import CHUNK_ROWS, LARGE_FIT_ROWS, PREVIEW_ROWS
+
+
+def pca_params():
+    return {
+        "large_rows": LARGE_FIT_ROWS,
+        "preview_rows": PREVIEW_ROWS,
+        "batch_size": CHUNK_ROWS
+    }
 
 
 def run_pca(values):
-    return PCAAnalysis.analyze(values)
\ No newline at end of file
+    return PCAAnalysis.analyze(values, **pca_params())
@@ -0,0 +1,17 @@
+from analysis.seasonality import SeasonalityAnalysis
+from tools.batch import pad_columns
+
+
+def run_seasonality(values):
+    return SeasonalityAnalysis.analyze(values)
+
+
+def run_seasonality_batch(columns, cache=None):
+
+    # columns: {name: 1-D float array}; one FFT pass detects the period of
+    # every column before any decomposition runs
+    names, matrix = pad_columns(columns)
+
+    results = SeasonalityAnalysis.analyze_batch(matrix)
+
+    return dict(zip(names, results))
@@ -0,0 +1,5 @@
+from analysis.smoothing import SmoothingAnalysis
+
+
+def run_smoothing(values):
+    return SmoothingAnalysis.moving_average(values)
\ No newline at end of file
@@ -0,0 +1,98 @@
+# Cold-start cost of constructing an ExcelAgent.
+#
+# Each sample runs in a fresh interpreter. The script exits non-zero if
+# the median goes over the budget or if construction imports one of the
+# heavy backends, which should only load when a tool or stage uses them.
+#
+# Usage (from the scipy_agent folder):
+#     python benchmarks/bench_import.py
+#     python benchmarks/bench_import.py --budget 0.5 --runs 10
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+# Seconds for a cold `ExcelAgent()`, interpreter start-up excluded
+DEFAULT_BUDGET = 1.0
+
+HEAVY_MODULES = [
+    "aspose.cells",
+    "matplotlib",
+    "openai",
+    "pandas",
+    "scipy",
+    "sklearn",
+    "statsmodels",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from agents.excel_agent import ExcelAgent
+ExcelAgent()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "loaded": [m for m in %r if m in sys.modules]
+}))
+""" % (HEAVY_MODULES,)
+
+
+def measure():
+
+    # Fresh interpreter, so nothing is already imported
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def check(budget=DEFAULT_BUDGET, runs=5):
+
+    # Returns (median seconds, heavy modules loaded, list of failures)
+    samples = [measure() for _ in range(runs)]
+
+    median = statistics.median(s["seconds"] for s in samples)
+    loaded = sorted({m for s in samples for m in s["loaded"]})
+
+    failures = []
+
+    if median > budget:
+        failures.append(f"cold ExcelAgent() took {median:.3f}s (budget {budget:.3f}s)")
+
+    if loaded:
+        failures.append(f"imported at construction: {', '.join(loaded)}")
+
+    return median, loaded, failures
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    median, _, failures = check(args.budget, args.runs)
+
+    print(f"cold ExcelAgent(): median {median:.3f}s over {args.runs} runs")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
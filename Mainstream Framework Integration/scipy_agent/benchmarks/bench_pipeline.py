@@ -0,0 +1,242 @@
+# End-to-end benchmark of the ExecutionPipeline on synthetic workbooks.
+#
+# Each data shape is generated, saved as .xlsx and analysed in a fresh
+# process (so peak RSS is per shape) with a fixed plan instead of the
+# LLM planner. Wall/CPU time and peak RSS are reported per stage and
+# per tool, with throughput in values per second.
+#
+# Usage (from the scipy_agent folder):
+#     python benchmarks/bench_pipeline.py
+#     python benchmarks/bench_pipeline.py --shapes tall seasonal --scale 0.1
+#     python benchmarks/bench_pipeline.py --output baseline.json
+#     python benchmarks/bench_pipeline.py --compare baseline.json
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import aspose.cells as cells
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from excel.session import WorkbookSession
+from pipeline.execution_pipeline import ExecutionPipeline
+from pipeline.report_pipeline import ReportPipeline
+from registry.tool_registry import TOOL_REGISTRY
+from telemetry.profiler import Profiler
+
+
+# name -> (rows, cols) at scale 1.0
+SHAPES = {
+    "tall": (1_000_000, 4),
+    "wide": (5_000, 300),
+    "sparse": (200_000, 10),
+    "anomalies": (200_000, 6),
+    "seasonal": (200_000, 6),
+}
+
+# A stage or tool this much slower than the baseline is a regression
+REGRESSION_RATIO = 1.25
+
+
+def build_frame(shape, rows, cols, seed=0):
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(rows)[:, None]
+
+    data = rng.normal(1000, 50, size=(rows, cols))
+
+    if shape == "sparse":
+        # ~80% of cells empty
+        data[rng.random(data.shape) < 0.8] = np.nan
+
+    elif shape == "anomalies":
+        # ~1% of cells are spikes
+        spikes = rng.random(data.shape) < 0.01
+        data[spikes] += rng.choice([-1, 1], size=spikes.sum()) * 1000
+
+    elif shape == "seasonal":
+        periods = np.array([7, 12, 24, 52, 365, 4])[np.arange(cols) % 6]
+        data += 200 * np.sin(2 * np.pi * t / periods) + 0.01 * t
+
+    return pd.DataFrame(data, columns=[f"col_{c}" for c in range(cols)])
+
+
+def build_workbook(path, frame):
+
+    # Loading a CSV stream is far faster than put_value per cell
+    stream = io.BytesIO(frame.to_csv(index=False).encode("utf-8"))
+
+    workbook = cells.Workbook(stream, cells.LoadOptions(cells.LoadFormat.CSV))
+    workbook.save(path)
+
+
+def run_shape(shape, rows, cols, tools, workers):
+
+    # Runs in a fresh process: generate, load, analyse, report
+    with tempfile.TemporaryDirectory() as folder:
+
+        source = os.path.join(folder, f"{shape}.xlsx")
+        report = os.path.join(folder, f"{shape}_report.xlsx")
+
+        build_workbook(source, build_frame(shape, rows, cols))
+
+        profiler = Profiler()
+
+        session = WorkbookSession(source)
+
+        # The planner is replaced by a fixed plan
+        plan = {"tools": tools}
+
+        results = ExecutionPipeline(max_workers=workers, cache=False).execute(
+            plan=plan,
+            session=session,
+            profiler=profiler
+        )
+
+        with profiler.span("report"):
+            ReportPipeline().generate(results, report)
+
+        with profiler.span("save"):
+            session.save()
+
+    stages = {}
+
+    for span in profiler.spans:
+
+        if span["category"] != "phase":
+            continue
+
+        stage = stages.setdefault(span["name"], {"wall": 0.0, "cpu": 0.0})
+        stage["wall"] += span["wall"]
+        stage["cpu"] += span["cpu"]
+        stage["peak_rss_mb"] = span["peak_rss_mb"]
+
+    tools_summary = profiler.summary()["tools"]
+
+    for summary in tools_summary.values():
+        summary["values_per_s"] = (
+            summary["values"] / summary["wall"] if summary["wall"] else None
+        )
+
+    return {
+        "rows": rows,
+        "cols": cols,
+        "stages": stages,
+        "tools": tools_summary,
+        "errors": {
+            name: result
+            for name, result in results["analysis_results"].items()
+            if isinstance(result, dict) and ("error" in result or "skipped" in result)
+        },
+        "peak_rss_mb": profiler.summary()["peak_rss_mb"]
+    }
+
+
+def print_shape(shape, result):
+
+    print(f"\n== {shape}: {result['rows']} rows x {result['cols']} cols, "
+          f"peak RSS {result['peak_rss_mb'] or 0:.0f} MB")
+
+    print(f"{'stage':<12} {'wall_s':>9} {'cpu_s':>9} {'rss_mb':>9}")
+
+    for name, stage in result["stages"].items():
+        print(f"{name:<12} {stage['wall']:>9.3f} {stage['cpu']:>9.3f} "
+              f"{stage['peak_rss_mb'] or 0:>9.0f}")
+
+    print(f"{'tool':<24} {'tasks':>6} {'wall_s':>9} {'values/s':>12}")
+
+    for name, tool in result["tools"].items():
+        rate = tool["values_per_s"]
+        print(f"{name:<24} {tool['tasks']:>6} {tool['wall']:>9.3f} "
+              f"{rate if rate is not None else float('nan'):>12.3g}")
+
+    for name, problem in result["errors"].items():
+        print(f"{name:<24} {problem}")
+
+
+def compare(results, baseline):
+
+    # Lists stages and tools that got slower than the baseline allows
+    regressions = []
+
+    for shape, result in results.items():
+
+        if shape not in baseline:
+            continue
+
+        for section in ("stages", "tools"):
+            for name, current in result[section].items():
+
+                before = baseline[shape][section].get(name)
+
+                if not before or not before["wall"]:
+                    continue
+
+                ratio = current["wall"] / before["wall"]
+
+                if ratio > REGRESSION_RATIO:
+                    regressions.append(
+                        f"{shape}/{name}: {before['wall']:.3f}s -> "
+                        f"{current['wall']:.3f}s ({ratio:.2f}x)"
+                    )
+
+    return regressions
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES),
+                        default=list(SHAPES))
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplies the row count of every shape")
+    parser.add_argument("--tools", nargs="+", default=list(TOOL_REGISTRY))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="baseline JSON from --output")
+    args = parser.parse_args()
+
+    results = {}
+
+    # Fresh process per shape so peak RSS isn't inherited
+    context = multiprocessing.get_context("spawn")
+
+    for shape in args.shapes:
+
+        rows, cols = SHAPES[shape]
+        rows = max(int(rows * args.scale), 10)
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[shape] = pool.submit(
+                run_shape, shape, rows, cols, args.tools, args.workers
+            ).result()
+
+        print_shape(shape, results[shape])
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, default=str)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+
+        print("\nRegressions:" if regressions else "\nNo regressions.")
+
+        for line in regressions:
+            print(f"  {line}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Compare the bulk columnar ExcelReader against the old per-cell loop.
+#
+# Usage (from the scipy_agent folder):
+#     python benchmarks/bench_reader.py
+#     python benchmarks/bench_reader.py --rows 10000 100000 --cols 8
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import aspose.cells as cells
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from excel.reader import ExcelReader
+
+
+def build_workbook(rows, cols, seed=0):
+
+    rng = np.random.default_rng(seed)
+
+    frame = pd.DataFrame(
+        rng.normal(1000, 250, size=(rows, cols)),
+        columns=[f"col_{c}" for c in range(cols)]
+    )
+
+    # Loading a CSV stream is far faster than put_value per cell,
+    # which keeps the 1M-row case practical to generate.
+    stream = io.BytesIO(frame.to_csv(index=False).encode("utf-8"))
+
+    return cells.Workbook(stream, cells.LoadOptions(cells.LoadFormat.CSV))
+
+
+def read_cellwise(workbook, sheet_index=0):
+
+    # The previous ExcelReader implementation, kept here as the baseline.
+    worksheet = workbook.worksheets[sheet_index]
+
+    rows = worksheet.cells.max_data_row + 1
+    cols = worksheet.cells.max_data_column + 1
+
+    data = []
+
+    for r in range(rows):
+        row = []
+        for c in range(cols):
+            row.append(worksheet.cells.get(r, c).value)
+        data.append(row)
+
+    return pd.DataFrame(data[1:], columns=data[0])
+
+
+def timed(func, *args):
+
+    start = time.perf_counter()
+    result = func(*args)
+
+    return result, time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+",
+                        default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--cols", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'cellwise_s':>12} {'bulk_s':>10} {'speedup':>8}")
+
+    for rows in args.rows:
+
+        workbook = build_workbook(rows, args.cols)
+
+        old_df, old_time = timed(read_cellwise, workbook)
+        new_df, new_time = timed(ExcelReader.sheet_to_dataframe, workbook)
+
+        assert old_df.shape == new_df.shape
+        assert np.allclose(
+            old_df.to_numpy(dtype=float),
+            new_df.to_numpy(dtype=float)
+        )
+
+        print(
+            f"{rows:>10} {old_time:>12.3f} {new_time:>10.3f} "
+            f"{old_time / new_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# Modules under app/ import each other as top-level packages
+# (from config import ..., from analysis.x import ...)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+
+@pytest.fixture(autouse=True)
+def result_cache_path(tmp_path, monkeypatch):
+
+    # Result caches go to the test's tmp_path, never ~/.cache: the
+    # environment reaches subprocesses, the attributes modules that have
+    # already read the setting
+    path = str(tmp_path / "results.sqlite")
+
+    monkeypatch.setenv("AGENT_RESULT_CACHE_PATH", path)
+
+    for name in ("config", "pipeline.execution_pipeline"):
+        module = sys.modules.get(name)
+
+        if module is not None:
+            monkeypatch.setattr(module, "RESULT_CACHE_PATH", path)
+
+    return path
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+
+import agents.excel_agent as excel_agent
+from agents.excel_agent import ExcelAgent
+from excel.session import WorkbookSession
+
+
+class _Tracker:
+
+    # Counts how many calls are inside a block at once
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def hold(self, seconds):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+        time.sleep(seconds)
+
+        with self._lock:
+            self.active -= 1
+
+
+class _Session:
+
+    tracker = None
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def numeric_frame(self):
+        time.sleep(0.2)
+
+    def save(self):
+        pass
+
+
+class _Router:
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def route(self, request, session):
+        self.tracker.hold(0.2)
+        return {"tools": []}
+
+
+class _Stage:
+
+    def execute(self, plan, session, profiler):
+        return {"analysis_results": {}}
+
+    def generate(self, results, output_file):
+        pass
+
+
+def _agent(monkeypatch, tracker):
+
+    monkeypatch.setattr(excel_agent, "WorkbookSession", _Session)
+
+    agent = ExcelAgent.__new__(ExcelAgent)
+    agent.router = _Router(tracker)
+    agent.executor = agent.reporter = _Stage()
+
+    return agent
+
+
+def test_planning_overlaps_loading(monkeypatch):
+
+    agent = _agent(monkeypatch, _Tracker())
+
+    start = time.perf_counter()
+    results = asyncio.run(agent.arun("in.xlsx", "out.xlsx", "trends"))
+
+    # Planning and loading take 0.2s each and run side by side
+    assert time.perf_counter() - start < 0.35
+    assert "telemetry" in results
+
+
+def test_batch_respects_concurrency_limit(monkeypatch):
+
+    tracker = _Tracker()
+    agent = _agent(monkeypatch, tracker)
+
+    jobs = [(f"in{i}.xlsx", f"out{i}.xlsx", "trends") for i in range(6)]
+
+    results = asyncio.run(agent.arun_batch(jobs, concurrency=2))
+
+    assert len(results) == 6
+    assert tracker.peak == 2
+
+
+def test_saves_to_one_path_are_serialised(tmp_path):
+
+    tracker = _Tracker()
+
+    class Workbook:
+        def save(self, path):
+            tracker.hold(0.05)
+
+    sessions = []
+
+    for _ in range(4):
+        session = WorkbookSession(str(tmp_path / "same.xlsx"))
+        session._workbook = Workbook()
+        session.mark_dirty()
+        sessions.append(session)
+
+    threads = [threading.Thread(target=session.save) for session in sessions]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert tracker.peak == 1
+    assert WorkbookSession.save_lock(str(tmp_path / "same.xlsx")) is \
+        WorkbookSession.save_lock(str(tmp_path / "." / "same.xlsx"))
@@ -0,0 +1,128 @@
+import numpy as np
+
+from app.analysis.anomaly import AnomalyAnalysis
+from app.analysis.change_point import ChangePointAnalysis
+from app.analysis.outlier import OutlierAnalysis
+
+
+def _matrix():
+
+    rng = np.random.default_rng(0)
+
+    matrix = rng.normal(100, 5, size=(200, 3))
+    matrix[50, 0] = 1000
+    matrix[120, 2] = -1000
+    matrix[150:, 1] = np.nan
+
+    # Gaps inside the data, before and after the spikes
+    matrix[70, 0] = np.nan
+    matrix[[30, 31, 90], 2] = np.nan
+
+    return matrix
+
+
+def _column(matrix, c):
+
+    values = matrix[:, c]
+
+    return values[~np.isnan(values)]
+
+
+def test_zscore_batch_matches_single_column():
+
+    matrix = _matrix()
+
+    result = AnomalyAnalysis.detect_zscore_batch(matrix, as_records=True)
+
+    for c in range(matrix.shape[1]):
+        expected = AnomalyAnalysis.detect_zscore(_column(matrix, c))
+        records = result["records"][c]
+
+        assert [r["index"] for r in records] == [e["index"] for e in expected]
+        assert np.allclose(
+            [r["zscore"] for r in records],
+            [e["zscore"] for e in expected]
+        )
+
+    # Indices count non-missing values
+    assert (0, 50) in set(zip(result["columns"], result["rows"]))
+    assert (2, 117) in set(zip(result["columns"], result["rows"]))
+
+
+def test_iqr_batch_matches_single_column():
+
+    matrix = _matrix()
+
+    result = OutlierAnalysis.iqr_outliers_batch(matrix, as_records=True)
+
+    for c in range(matrix.shape[1]):
+        assert result["records"][c] == OutlierAnalysis.iqr_outliers(
+            _column(matrix, c)
+        )
+
+
+def test_change_point_batch_matches_single_column():
+
+    matrix = _matrix()
+
+    result = ChangePointAnalysis.detect_batch(matrix, as_records=True)
+
+    for c in range(matrix.shape[1]):
+        assert result["records"][c] == ChangePointAnalysis.detect(
+            _column(matrix, c)
+        )
+
+
+def test_change_point_batch_does_not_diff_across_gaps():
+
+    matrix = np.array([[1.0], [2.0], [np.nan], [3.0], [4.0], [5.0], [50.0]])
+
+    result = ChangePointAnalysis.detect_batch(matrix, as_records=True)
+
+    assert result["records"][0] == ChangePointAnalysis.detect(
+        _column(matrix, 0)
+    )
+    assert [r["position"] for r in result["records"][0]] == [4]
+
+
+def test_registered_batch_tools_match_per_column_tools():
+
+    from registry.tool_registry import load_tool
+
+    matrix = _matrix()
+    columns = {f"col_{c}": _column(matrix, c) for c in range(matrix.shape[1])}
+
+    for name in ("anomaly", "outlier", "change_point"):
+        tool = load_tool(name)
+
+        batched = tool["batch"](columns, cache=None)
+
+        assert list(batched) == list(columns)
+
+        for col, values in columns.items():
+            expected = tool["func"](values)
+
+            assert len(batched[col]) == len(expected)
+
+            for got, want in zip(batched[col], expected):
+                assert got.keys() == want.keys()
+                assert np.allclose(list(got.values()), list(want.values()))
+
+
+def test_batch_columns_are_split_into_cost_sized_chunks():
+
+    from pipeline.execution_pipeline import ExecutionPipeline
+
+    pipeline = ExecutionPipeline(max_workers=4, cache=False)
+
+    deferred = [(("tool", f"c{i}"), None, 10) for i in range(40)]
+
+    chunks = pipeline.batch_chunks(deferred)
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 10, 10]
+    assert [entry for chunk in chunks for entry in chunk] == deferred
+
+    # Few columns stay together; one worker gets a single chunk
+    assert len(pipeline.batch_chunks(deferred[:6])) == 1
+    assert len(ExecutionPipeline(max_workers=1, cache=False).batch_chunks(deferred)) == 1
+    assert pipeline.batch_chunks([]) == []
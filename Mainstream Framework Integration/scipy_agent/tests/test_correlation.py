@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+from app.analysis.correlation import CorrelationAnalysis
+
+
+def _frame():
+
+    rng = np.random.default_rng(0)
+
+    df = pd.DataFrame(rng.normal(size=(500, 12)), columns=[f"c{i}" for i in range(12)])
+    df["c1"] = 0.9 * df["c0"] + 0.1 * rng.normal(size=500)
+    df["c5"] = -df["c3"] + 0.2 * rng.normal(size=500)
+
+    return df.mask(rng.random(df.shape) < 0.1)
+
+
+def test_blocked_pearson_matches_pandas_pairwise():
+
+    df = _frame()
+
+    result = CorrelationAnalysis.correlation_matrix(df, top_k=2, block_size=5)
+
+    assert np.allclose(result["matrix"], df.corr().to_numpy(), equal_nan=True)
+
+    pairs = result["pairs"]
+
+    assert list(zip(pairs["x"], pairs["y"])) == [("c0", "c1"), ("c3", "c5")]
+    assert pairs["correlation"][1] < 0
+    assert pairs["observations"][0] == (df["c0"].notna() & df["c1"].notna()).sum()
+
+
+def test_rank_methods_and_sparse_output():
+
+    df = _frame()
+
+    kendall = CorrelationAnalysis.correlation_matrix(df, method="kendall")
+    assert np.allclose(kendall["matrix"], df.corr(method="kendall").to_numpy())
+
+    spearman = CorrelationAnalysis.correlation_matrix(df, method="spearman", dense=False)
+    assert "matrix" not in spearman
+    assert spearman["pairs"]["x"][0] == "c0"
+
+
+def test_spearman_with_gaps_uses_column_ranks():
+
+    rng = np.random.default_rng(1)
+
+    df = pd.DataFrame(rng.normal(size=(300, 9)))
+    df[1] = df[0] ** 3 + 0.2 * rng.normal(size=300)
+    df = df.mask(rng.random(df.shape) < 0.3)
+    df[8] = rng.normal(size=300)
+
+    result = CorrelationAnalysis.correlation_matrix(
+        df, method="spearman", block_size=4
+    )
+
+    # Pearson over each column's own ranks, on pairwise-complete rows
+    assert np.allclose(
+        result["matrix"], df.rank().corr().to_numpy(), equal_nan=True
+    )
+
+    # Close to pandas, which re-ranks every pair on its shared rows
+    assert np.allclose(
+        result["matrix"], df.corr(method="spearman").to_numpy(),
+        atol=0.05, equal_nan=True
+    )
+
+
+def test_kendall_matrix_matches_the_pairwise_path(monkeypatch):
+
+    rng = np.random.default_rng(2)
+
+    # Integer values so both columns of a pair have ties
+    df = pd.DataFrame(rng.integers(0, 6, size=(120, 7)).astype(float))
+    df = df.mask(rng.random(df.shape) < 0.2)
+    df[6] = 1.0
+
+    matrix = CorrelationAnalysis.correlation_matrix(
+        df, method="kendall"
+    )["matrix"]
+
+    monkeypatch.setattr("app.analysis.correlation.KENDALL_MATRIX_ROWS", 0)
+
+    pairwise = CorrelationAnalysis.correlation_matrix(
+        df, method="kendall"
+    )["matrix"]
+
+    assert np.allclose(matrix, pairwise, equal_nan=True)
+    assert np.allclose(
+        matrix, df.corr(method="kendall").to_numpy(), equal_nan=True
+    )
+
+
+def test_sparse_output_keeps_the_dense_top_pairs():
+
+    df = _frame()
+
+    for method in ("pearson", "spearman"):
+        dense = CorrelationAnalysis.correlation_matrix(
+            df, method=method, top_k=5, block_size=5
+        )
+        sparse = CorrelationAnalysis.correlation_matrix(
+            df, method=method, top_k=5, block_size=5, dense=False
+        )
+
+        for key in ("x", "y", "observations"):
+            assert list(sparse["pairs"][key]) == list(dense["pairs"][key])
+
+        assert np.allclose(
+            sparse["pairs"]["correlation"], dense["pairs"]["correlation"]
+        )
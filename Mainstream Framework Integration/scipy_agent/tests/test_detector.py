@@ -0,0 +1,44 @@
+import numpy as np
+
+from app.excel.detector import ColumnDetector
+
+
+def test_sample_rows_covers_head_tail_and_middle():
+
+    rows = ColumnDetector(head=10, tail=10, random=20).sample_rows(10_000)
+
+    assert len(rows) == 40
+    assert rows[0] == 1 and rows[-1] == 10_000
+    assert np.all(np.diff(rows) > 0)
+
+    assert len(ColumnDetector().sample_rows(50)) == 50
+
+
+def test_classify_kinds_and_dtype_hints():
+
+    detector = ColumnDetector()
+
+    regions = ["north", "south"] * 50
+    notes = [f"note {i}" for i in range(100)]
+
+    detected = {
+        0: detector._classify(["numeric"] * 100, [], 100),
+        1: detector._classify(["text"] * 100, regions, 100),
+        2: detector._classify(["text"] * 100, notes, 100),
+        3: detector._classify(["numeric"] * 80 + ["text"] * 20, ["n/a"] * 20, 100),
+        4: detector._classify(["date"] * 50, [], 100),
+        5: detector._classify([], [], 100),
+        6: detector._classify(["numeric"] * 97 + ["text"] * 3, ["-"] * 3, 100),
+        7: detector._classify(["text"] * 60 + ["date"] * 40, notes[:60], 100)
+    }
+
+    assert [d["kind"] for d in detected.values()] == [
+        "numeric", "categorical", "text", "mixed", "date", "empty", "numeric",
+        "mixed"
+    ]
+
+    assert detected[3]["confidence"] == 0.8
+    assert detected[4]["filled"] == 0.5
+
+    # Columns holding numbers are never forced to strings
+    assert ColumnDetector.csv_dtypes(detected) == {1: "category", 2: object, 7: object}
@@ -0,0 +1,88 @@
+import warnings
+
+import numpy as np
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from app.analysis.forecasting import ForecastingAnalysis
+
+
+def test_batch_forecast_matches_statsmodels_fit():
+
+    rng = np.random.default_rng(0)
+
+    matrix = np.cumsum(rng.normal(size=(120, 4)), axis=0) + 100
+    matrix[100:, 3] = np.nan
+
+    forecasts, params = ForecastingAnalysis.forecast_batch(matrix, steps=3)
+
+    assert forecasts.shape == (3, 4)
+
+    for c in range(4):
+        values = matrix[:, c][~np.isnan(matrix[:, c])]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fit = ExponentialSmoothing(values).fit()
+
+        # Grid search is at least as good as the local optimiser
+        assert params[c]["sse"] <= fit.sse * 1.001
+        assert np.allclose(forecasts[:, c], fit.forecast(3), rtol=1e-3)
+
+
+def test_warm_started_columns_skip_the_coarse_search(monkeypatch):
+
+    rng = np.random.default_rng(1)
+
+    matrix = np.cumsum(rng.normal(size=(80, 3)), axis=0)
+
+    _, params = ForecastingAnalysis.forecast_batch(matrix, steps=2)
+
+    fit_grid = ForecastingAnalysis._fit_grid
+    searched = []
+
+    def recording_fit_grid(y, alpha, beta, trend):
+        searched.append(y.shape[1])
+        return fit_grid(y, alpha, beta, trend)
+
+    monkeypatch.setattr(
+        ForecastingAnalysis, "_fit_grid", staticmethod(recording_fit_grid)
+    )
+
+    known = {0: params[0], 2: params[2]}
+    _, warm = ForecastingAnalysis.forecast_batch(
+        matrix, steps=2, known_params=known
+    )
+
+    # Coarse pass over the one cold column, fine pass over all three,
+    # then the check of the two warm starts
+    assert searched == [1, 3, 2]
+
+    for c in range(3):
+        assert warm[c]["sse"] <= params[c]["sse"] * 1.001
+
+    searched.clear()
+    ForecastingAnalysis.forecast_batch(
+        matrix, steps=2, known_params=dict(enumerate(params))
+    )
+
+    assert searched == [3, 3]
+
+
+def test_stale_warm_start_falls_back_to_the_full_search():
+
+    rng = np.random.default_rng(2)
+
+    matrix = np.cumsum(rng.normal(size=(80, 2)), axis=0)
+
+    cold, params = ForecastingAnalysis.forecast_batch(matrix, steps=2)
+
+    # Parameters from an unrelated series: the fine search around them
+    # cannot reach the real optimum
+    stale = {0: {"alpha": 0.02, "beta": 0.0}, 1: params[1]}
+
+    warm, warm_params = ForecastingAnalysis.forecast_batch(
+        matrix, steps=2, known_params=stale
+    )
+
+    assert warm_params[0] == params[0]
+    np.testing.assert_allclose(warm, cold)
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+from app.excel.formatter import Formatter
+
+
+class _Cells:
+
+    # Stand-in for sheet.cells: header strings and recorded ranges
+    def __init__(self, headers):
+        self.headers = headers
+        self.max_data_column = len(headers) - 1
+        self.ranges = []
+
+    def get(self, row, col):
+        return SimpleNamespace(string_value=self.headers[col])
+
+    def create_range(self, first_row, first_col, row_count, col_count):
+        area = (first_row, first_col, row_count, col_count)
+        return SimpleNamespace(apply_style=lambda style, flag: self.ranges.append(area))
+
+
+def test_row_runs_edge_cases():
+
+    assert Formatter.row_runs([]) == []
+    assert Formatter.row_runs([7]) == [(7, 1)]
+    assert Formatter.row_runs([3, 4, 5]) == [(3, 3)]
+
+    # Unsorted with duplicates and gaps
+    assert Formatter.row_runs([9, 1, 2, 2, 5, 10, 11]) == [(1, 2), (5, 1), (9, 3)]
+
+
+def test_header_index_keeps_first_duplicate():
+
+    sheet = SimpleNamespace(cells=_Cells(["date", "sales", "cost", "sales"]))
+
+    assert Formatter.header_index(sheet) == {"date": 0, "sales": 1, "cost": 2}
+
+
+def test_highlight_rows_styles_one_range_per_run():
+
+    sheet = SimpleNamespace(cells=_Cells(["a", "b"]))
+
+    count = Formatter().highlight_rows(sheet, 1, [4, 2, 3, 8], None, None)
+
+    assert count == 2
+    assert sheet.cells.ranges == [(2, 1, 3, 1), (8, 1, 1, 1)]
+    assert Formatter().highlight_rows(sheet, 1, [], None, None) == 0
@@ -0,0 +1,32 @@
+import json
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(__file__), "..", "app")
+
+HEAVY_MODULES = ["aspose", "matplotlib", "openai", "pandas", "scipy", "sklearn", "statsmodels"]
+
+# Timing lives in benchmarks/bench_import.py; this only checks laziness
+PROBE = """
+import json, sys
+import main
+main.ExcelAgent()
+print(json.dumps(sorted(
+    m for m in %r if any(n == m or n.startswith(m + ".") for n in sys.modules)
+)))
+""" % (HEAVY_MODULES,)
+
+
+def test_agent_construction_does_not_import_heavy_backends():
+
+    # Fresh interpreter, so nothing is already imported
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+
+    assert json.loads(output.strip().splitlines()[-1]) == []
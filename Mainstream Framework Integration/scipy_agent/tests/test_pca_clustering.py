@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from app.analysis.clustering import ClusteringAnalysis
+from app.analysis.pca_analysis import PCAAnalysis
+
+
+def _frame(rows=3000):
+
+    rng = np.random.default_rng(0)
+
+    centers = np.array([[0, 0, 0], [10, 10, 0], [0, 10, 10]])
+    labels = rng.integers(0, 3, size=rows)
+
+    return pd.DataFrame(
+        centers[labels] + rng.normal(size=(rows, 3)),
+        columns=["a", "b", "c"]
+    )
+
+
+def test_incremental_pca_matches_exact_and_previews():
+
+    df = _frame()
+
+    exact = PCAAnalysis.analyze(df, preview_rows=100)
+    large = PCAAnalysis.analyze(df, large_rows=1000, preview_rows=100,
+                                batch_size=500)
+
+    assert exact["components"].shape == (100, 2)
+    assert len(exact["rows"]) == 100
+    assert np.allclose(
+        exact["explained_variance"], large["explained_variance"], atol=1e-3
+    )
+
+
+def test_multivariate_clustering_small_and_mini_batch():
+
+    df = _frame()
+    df.iloc[5, 1] = np.nan
+
+    for large_rows in (None, 1000):
+
+        result = ClusteringAnalysis.cluster_frame(df, k=3, large_rows=large_rows)
+
+        assert result["labels"][5] == -1
+        assert result["sizes"].sum() == len(df) - 1
+
+        # Centers come back in original units
+        centers = np.round(result["centers"][np.argsort(result["centers"][:, 1])])
+        assert np.allclose(centers[0], [0, 0, 0], atol=1)
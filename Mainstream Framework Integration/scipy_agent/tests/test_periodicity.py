@@ -0,0 +1,45 @@
+import numpy as np
+
+from app.analysis.periodicity import PeriodicityAnalysis
+from app.analysis.seasonality import SeasonalityAnalysis
+
+
+def _matrix():
+
+    rng = np.random.default_rng(0)
+    t = np.arange(240)
+
+    return np.stack([
+        5 * np.sin(2 * np.pi * t / 12) + 0.3 * t + rng.normal(size=240),
+        rng.normal(size=240),
+        3 * np.sin(2 * np.pi * t / 7) + rng.normal(size=240),
+        np.r_[3 * np.sin(2 * np.pi * t[:180] / 4), [np.nan] * 60]
+    ], axis=1)
+
+
+def test_detects_dominant_period_per_column():
+
+    result = PeriodicityAnalysis.detect(_matrix(), top_k=3)
+
+    assert result["periods"].shape == (4, 3)
+    assert list(result["significant"]) == [True, False, True, True]
+    assert np.round(result["periods"][[0, 2, 3], 0]).tolist() == [12, 7, 4]
+
+
+def test_batch_decomposes_only_seasonal_columns():
+
+    matrix = _matrix()
+
+    results = SeasonalityAnalysis.analyze_batch(matrix)
+
+    assert results[1]["period"] is None
+    assert "trend" not in results[1]
+
+    assert results[0]["period"] == 12
+    assert len(results[0]["seasonal"]) == 12
+    assert len(results[3]["trend"]) == 180
+
+    single = SeasonalityAnalysis.analyze(matrix[:, 0])
+
+    assert single["period"] == 12
+    assert np.allclose(single["seasonal"], results[0]["seasonal"])
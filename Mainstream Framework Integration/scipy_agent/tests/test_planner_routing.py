@@ -0,0 +1,26 @@
+from app.llm.plan_cache import PlanCache
+from app.llm.rule_router import RuleRouter, normalize_request
+
+
+def test_rule_router_answers_common_requests():
+
+    plan = RuleRouter().route("Analyze sales trends and detect anomalies")
+
+    assert plan["tools"] == ["anomaly", "trend"]
+
+
+def test_rule_router_misses_fall_through():
+
+    assert RuleRouter().route("Tell me something interesting") is None
+
+
+def test_plan_cache_expires_entries():
+
+    cache = PlanCache(ttl=0)
+
+    key = normalize_request("Forecast  next quarter!")
+
+    cache.put(key, {"tools": ["forecast"]})
+
+    assert key == normalize_request("forecast next QUARTER")
+    assert cache.get(key) is None
@@ -0,0 +1,58 @@
+import json
+
+import numpy as np
+
+from app.telemetry.profiler import Profiler, input_size, profiled_call
+
+
+def test_summary_groups_phases_and_tasks():
+
+    profiler = Profiler()
+
+    with profiler.span("load"):
+        pass
+
+    with profiler.span("load"):
+        pass
+
+    result, stats = profiled_call(np.sum, np.ones(100))
+
+    assert result == 100
+    assert stats["wall"] >= 0 and stats["cpu"] >= 0
+
+    profiler.record("trend", "task", column="a", size=100, status="ok", **stats)
+    profiler.record("trend", "task", start=0.0, wall=0.0, column="b", size=50,
+                    status="error")
+
+    summary = profiler.summary()
+
+    assert list(summary["phases"]) == ["load"]
+    assert summary["tools"]["trend"]["tasks"] == 2
+    assert summary["tools"]["trend"]["values"] == 150
+    assert summary["tools"]["trend"]["errors"] == 1
+
+
+def test_exports(tmp_path):
+
+    profiler = Profiler()
+
+    with profiler.span("tools", tasks=1):
+        pass
+
+    trace = tmp_path / "run.json"
+    lines = tmp_path / "runs.jsonl"
+
+    profiler.export(str(trace))
+    profiler.export(str(lines))
+    profiler.export(str(lines))
+
+    events = json.loads(trace.read_text())["traceEvents"]
+
+    assert events[0]["ph"] == "X" and events[0]["args"]["tasks"] == 1
+    assert len(lines.read_text().splitlines()) == 2
+
+
+def test_input_size():
+
+    assert input_size(np.ones((10, 3))) == 30
+    assert input_size({"a": np.ones(4), "b": np.ones(6)}) == 10
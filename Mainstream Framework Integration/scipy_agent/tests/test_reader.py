@@ -0,0 +1,42 @@
+import io
+
+from app.excel.detector import ColumnDetector
+from app.excel.reader import ExcelReader
+
+
+def test_numeric_columns_with_stray_text_stay_numeric():
+
+    detector = ColumnDetector()
+
+    detected = {
+        0: {"name": "amount", **detector._classify(["numeric"] * 97 + ["text"] * 3, ["-"] * 3, 100)},
+        1: {"name": "label", **detector._classify(["text"] * 4, ["a", "b", "c", "d"], 4)}
+    }
+
+    csv = "amount,label\n1.5,a\n-,b\nn/a,c\n'7,d\n"
+
+    df = ExcelReader.parse_csv(io.BytesIO(csv.encode()), 5, detected)
+
+    assert df["amount"].dtype == "float64"
+    assert df["amount"].tolist()[0] == 1.5
+    assert df["amount"].isna().sum() == 3
+    assert df["label"].tolist() == ["a", "b", "c", "d"]
+
+
+def test_blank_rows_keep_later_rows_in_place():
+
+    detector = ColumnDetector()
+
+    detected = {
+        0: {"name": "a", **detector._classify(["numeric"] * 3, [], 3)},
+        1: {"name": "b", **detector._classify(["numeric"] * 3, [], 3)}
+    }
+
+    # Fully empty sheet rows are exported as blank lines
+    csv = "a,b\n1,2\n\n\n3,4\n5,6\n"
+
+    df = ExcelReader.parse_csv(io.BytesIO(csv.encode()), 6, detected)
+
+    assert len(df) == 5
+    assert df["a"].tolist()[3:] == [3.0, 5.0]
+    assert df.iloc[1:3].isna().all().all()
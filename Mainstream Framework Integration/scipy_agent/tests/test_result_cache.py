@@ -0,0 +1,112 @@
+import numpy as np
+
+import os
+
+from app.cache.result_cache import MISS, ResultCache
+
+
+def test_key_depends_on_tool_params_and_content():
+
+    values = np.array([1.0, 2.0, 3.0])
+
+    key = ResultCache.make_key("trend", values)
+
+    assert key == ResultCache.make_key("trend", values.copy())
+    assert key != ResultCache.make_key("anomaly", values)
+    assert key != ResultCache.make_key("trend", values, {"window": 5})
+    assert key != ResultCache.make_key("trend", values + 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+
+    cache = ResultCache(str(tmp_path / "results.sqlite"), max_bytes=150)
+
+    cache.put("a", "trend", list(range(20)))
+    cache.put("b", "trend", list(range(20)))
+
+    assert cache.get("a") == list(range(20))
+
+    cache.put("c", "trend", list(range(20)))
+
+    assert cache.get("b") is MISS
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_none_results_are_hits_and_misses_are_sentinels(tmp_path):
+
+    cache = ResultCache(str(tmp_path / "results.sqlite"))
+
+    assert cache.get("missing") is MISS
+
+    cache.put("empty", "trend", None)
+
+    assert cache.get("empty") is None
+
+
+def test_database_is_created_on_first_use(tmp_path):
+
+    path = tmp_path / "nested" / "results.sqlite"
+
+    cache = ResultCache(str(path))
+
+    assert not os.path.exists(path.parent)
+
+    cache.get("anything")
+
+    assert os.path.exists(path)
+
+
+def test_default_pipeline_cache_uses_configured_path(result_cache_path):
+
+    from pipeline.execution_pipeline import ExecutionPipeline
+
+    pipeline = ExecutionPipeline()
+
+    assert pipeline.cache.path == result_cache_path
+    assert not os.path.exists(result_cache_path)
+
+
+def test_hits_do_not_write_until_the_next_put(tmp_path):
+
+    cache = ResultCache(str(tmp_path / "results.sqlite"))
+
+    cache.put("a", "trend", 1)
+
+    changes = cache._db.total_changes
+
+    for _ in range(10):
+        assert cache.get("a") == 1
+
+    assert cache._db.total_changes == changes
+
+    cache.put("b", "trend", 2)
+
+    # The batched access time and the new row
+    assert cache._db.total_changes == changes + 2
+
+
+def test_cache_params_follow_tool_settings_and_code(monkeypatch):
+
+    import tools.correlation_tool as correlation_tool
+    from registry.tool_registry import cache_params, load_tool
+
+    entry = load_tool("correlation")
+
+    params = cache_params(entry)
+
+    assert params["method"] == correlation_tool.CORRELATION_METHOD
+    assert len(params["code"]) == 16
+
+    monkeypatch.setattr(correlation_tool, "CORRELATION_METHOD", "spearman")
+
+    changed = cache_params(entry)
+
+    assert changed["method"] == "spearman"
+
+    frame = np.zeros((3, 2))
+    assert ResultCache.make_key("correlation", frame, params) != \
+        ResultCache.make_key("correlation", frame, changed)
+
+    # Plain series tools still get a code fingerprint
+    assert set(cache_params(load_tool("anomaly"))) == {"code"}
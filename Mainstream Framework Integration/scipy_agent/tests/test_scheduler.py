@@ -0,0 +1,71 @@
+import time
+
+from pipeline.scheduler import ToolScheduler
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_timeout_counts_from_task_start():
+
+    # Two workers, six 0.3s tasks: the last ones start after ~0.6s but
+    # each runs well within its own 0.5s budget
+    scheduler = ToolScheduler(max_workers=2, timeout=0.5, executor="thread")
+
+    tasks = [(i, _sleep, 0.3, 1) for i in range(6)]
+
+    outcomes = scheduler.run(tasks)
+
+    assert all(status == "ok" for status, _ in outcomes.values())
+
+
+def test_overrunning_task_times_out_without_blocking_others():
+
+    scheduler = ToolScheduler(max_workers=2, timeout=0.2, executor="thread")
+
+    start = time.perf_counter()
+
+    outcomes = scheduler.run([("slow", _sleep, 2.0, 2), ("fast", _sleep, 0.01, 1)])
+
+    assert outcomes["fast"] == ("ok", 0.01)
+    assert outcomes["slow"][0] == "error"
+    assert "timed out" in outcomes["slow"][1]
+    assert time.perf_counter() - start < 1.0
+
+
+def test_zero_timeout_disables_the_limit():
+
+    scheduler = ToolScheduler(max_workers=2, timeout=0, executor="thread")
+
+    assert scheduler.timeout == 0
+
+    outcomes = scheduler.run([(i, _sleep, 0.05, 1) for i in range(3)])
+
+    assert all(status == "ok" for status, _ in outcomes.values())
+
+
+def test_single_task_still_times_out():
+
+    for workers in (1, 4):
+        scheduler = ToolScheduler(max_workers=workers, timeout=0.2, executor="thread")
+
+        start = time.perf_counter()
+
+        outcomes = scheduler.run([("slow", _sleep, 2.0, 1)])
+
+        assert outcomes["slow"][0] == "error"
+        assert time.perf_counter() - start < 1.0
+
+
+def test_timed_out_worker_processes_are_terminated():
+
+    scheduler = ToolScheduler(max_workers=1, timeout=0.3, executor="process")
+
+    start = time.perf_counter()
+
+    outcomes = scheduler.run([("slow", _sleep, 5.0, 1)])
+
+    assert "timed out" in outcomes["slow"][1]
+    assert time.perf_counter() - start < 3.0
@@ -0,0 +1,48 @@
+import os
+
+from app.service.server import JobStore, download_name
+
+
+def test_uploads_never_collide_with_the_report(tmp_path):
+
+    jobs = JobStore(str(tmp_path), max_jobs=10, max_running=10)
+
+    for filename in ("report.xlsx", "..", "sales.xlsm"):
+        job_id, paths = jobs.create(filename)
+
+        assert paths["workbook"] != paths["report"]
+        assert os.path.dirname(paths["workbook"]) == str(tmp_path / job_id)
+        assert jobs.path(job_id, "workbook") == (paths["workbook"], filename)
+
+    assert paths["workbook"].endswith("input.xlsm")
+
+
+def test_running_jobs_are_not_evicted_and_are_bounded(tmp_path):
+
+    jobs = JobStore(str(tmp_path), max_jobs=1, max_running=2)
+
+    first, _ = jobs.create("a.xlsx")
+    second, _ = jobs.create("b.xlsx")
+
+    assert jobs.create("c.xlsx") is None
+    assert (tmp_path / first).is_dir() and (tmp_path / second).is_dir()
+
+    jobs.finish(first)
+
+    # Over max_jobs: the finished job goes, the running one stays
+    assert not (tmp_path / first).exists()
+    assert list(jobs.jobs) == [second]
+
+    third, _ = jobs.create("c.xlsx")
+    jobs.finish(second)
+
+    assert list(jobs.jobs) == [third]
+
+
+def test_download_names_cannot_inject_headers():
+
+    assert download_name("sales 2024.xlsx") == "sales 2024.xlsx"
+    assert download_name("../../etc/report.xlsm") == "report.xlsm"
+    assert download_name('a"b\r\nSet-Cookie: x=1.xlsx') == "a_b__Set-Cookie_ x_1.xlsx"
+    assert download_name("..") == "workbook.xlsx"
+    assert download_name(None) == "workbook.xlsx"
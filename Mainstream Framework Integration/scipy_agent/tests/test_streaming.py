@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import kurtosis, skew
+
+from app.analysis.streaming import (
+    QuantileSketch,
+    RunningCovariance,
+    RunningMoments
+)
+
+
+def _data():
+
+    rng = np.random.default_rng(1)
+
+    data = rng.normal(5, 2, size=(20000, 3))
+    data[:, 1] = data[:, 0] * 2 + rng.normal(size=20000)
+    data[rng.random(data.shape) < 0.05] = np.nan
+
+    return data
+
+
+def _accumulate(accumulator, data, chunk):
+
+    for start in range(0, len(data), chunk):
+        accumulator.update(data[start:start + chunk])
+
+    return accumulator
+
+
+def test_running_moments_merge_matches_full_data():
+
+    data = _data()
+
+    moments = _accumulate(RunningMoments(3), data[:9000], 1000)
+    moments.merge(_accumulate(RunningMoments(3), data[9000:], 3000))
+
+    for c in range(3):
+        values = data[:, c][~np.isnan(data[:, c])]
+
+        assert moments.count[c] == len(values)
+        assert np.isclose(moments.mean[c], values.mean())
+        assert np.isclose(moments.std()[c], values.std())
+        assert np.isclose(moments.skewness()[c], skew(values))
+        assert np.isclose(moments.kurtosis()[c], kurtosis(values))
+
+
+def test_quantile_sketch_median():
+
+    data = _data()
+
+    sketch = _accumulate(QuantileSketch(3), data, 1000)
+
+    assert np.allclose(
+        sketch.quantile(0.5),
+        np.nanmedian(data, axis=0),
+        atol=0.1
+    )
+
+
+def test_running_covariance_matches_pairwise_corr():
+
+    data = _data()
+
+    covariance = _accumulate(RunningCovariance(3), data[:5000], 700)
+    covariance.merge(_accumulate(RunningCovariance(3), data[5000:] + 1, 2000))
+
+    shifted = data.copy()
+    shifted[5000:] += 1
+
+    assert np.allclose(
+        covariance.correlation(),
+        pd.DataFrame(shifted).corr().to_numpy()
+    )
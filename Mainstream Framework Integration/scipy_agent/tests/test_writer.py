@@ -0,0 +1,133 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import excel.writer as writer
+from excel.writer import ExcelWriter
+
+
+class _Cells:
+
+    # Stand-in for sheet.cells recording what would be written
+    def __init__(self):
+        self.values = {}
+        self.imports = []
+
+    def get(self, row, col):
+        return SimpleNamespace(
+            put_value=lambda value: self.values.__setitem__((row, col), value)
+        )
+
+    def import_object_array(self, values, row, col, vertical):
+        self.imports.append((list(values), row, col, vertical))
+
+
+class _Series(list):
+
+    # Stand-in for chart.n_series
+    def add(self, reference, vertical):
+        self.append(SimpleNamespace(reference=reference, name=None))
+        return len(self) - 1
+
+
+class _Charts(list):
+
+    def add(self, chart_type, *area):
+        self.append(SimpleNamespace(n_series=_Series(), title=SimpleNamespace(text=None)))
+        return len(self) - 1
+
+
+def _sheet():
+    return SimpleNamespace(cells=_Cells(), charts=_Charts())
+
+
+def test_to_columns_lays_out_each_result_shape():
+
+    records = ExcelWriter.to_columns({
+        "a": [{"index": 3, "value": 9.0}],
+        "b": [{"index": 1, "value": 2.0, "score": 4.5}]
+    })
+
+    assert [header for header, _ in records] == ["column", "index", "value", "score"]
+    assert records[0][1] == ["a", "b"]
+    assert records[3][1] == [None, 4.5]
+
+    metrics = ExcelWriter.to_columns({"a": {"mean": 1.0}, "b": {"mean": 2.0, "std": 0.5}})
+
+    assert metrics == [("column", ["a", "b"]), ("mean", [1.0, 2.0]), ("std", [None, 0.5])]
+
+    wide = ExcelWriter.to_columns({
+        "components": np.arange(6.0).reshape(3, 2),
+        "sales": {"trend": [1.0, 2.0], "period": 12}
+    })
+
+    assert [header for header, _ in wide] == [
+        "components_1", "components_2", "sales.trend", "sales.period"
+    ]
+    assert list(wide[1][1]) == [1.0, 3.0, 5.0]
+
+    assert ExcelWriter.to_columns({"r2": 0.9}) is None
+    assert ExcelWriter.to_columns([]) is None
+
+
+def test_write_table_imports_typed_slices_and_truncates(monkeypatch):
+
+    monkeypatch.setattr(writer, "WRITE_CHUNK", 2)
+    monkeypatch.setattr(writer, "MAX_VALUES", 4)
+
+    sheet = _sheet()
+
+    ExcelWriter.write_table(sheet, [
+        ("value", np.array([1.0, np.nan, 3.0, 4.0, 5.0])),
+        ("label", ["x", np.int64(2)])
+    ])
+
+    assert sheet.cells.imports == [
+        ([1.0, None], 1, 0, True),
+        ([3.0, 4.0], 3, 0, True),
+        (["x", 2], 1, 1, True)
+    ]
+    assert sheet.cells.values[(0, 0)] == "value (first 4 of 5)"
+    assert sheet.cells.values[(0, 1)] == "label"
+
+
+def test_heatmap_writes_labels_matrix_and_one_colour_scale(monkeypatch):
+
+    scales = []
+    monkeypatch.setattr(
+        writer.Formatter, "color_scale", lambda self, sheet, *area: scales.append(area)
+    )
+
+    sheet = _sheet()
+    matrix = np.array([[1.0, 0.5], [0.5, 1.0]])
+
+    ExcelWriter.write_heatmap(sheet, ["a", "b"], matrix)
+
+    assert sheet.cells.imports[:2] == [(["a", "b"], 0, 1, False), (["a", "b"], 1, 0, True)]
+    assert sheet.cells.imports[2:] == [([1.0, 0.5], 1, 1, True), ([0.5, 1.0], 1, 2, True)]
+    assert scales == [(1, 1, 2, 2)]
+
+
+def test_chart_covers_numeric_columns_only():
+
+    sheet = _sheet()
+
+    table = [
+        ("column", ["a", "b", "c"]),
+        ("trend", np.array([1.0, 2.0, 3.0])),
+        ("count", np.array([1, 2]))
+    ]
+
+    ExcelWriter.add_chart(sheet, "trend", table)
+
+    series = sheet.charts[0].n_series
+
+    assert [s.reference for s in series] == ["B2:B4", "C2:C4"]
+    assert [s.name for s in series] == ["=B1", "=C1"]
+    assert sheet.charts[0].title.text == "trend"
+
+    text_only = _sheet()
+    ExcelWriter.add_chart(text_only, "x", [("column", ["a"])])
+
+    assert not text_only.charts
+
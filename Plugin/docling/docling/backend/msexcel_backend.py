@@ -1,7 +1,11 @@
 import logging
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Union, cast
+from typing import Any, NamedTuple, Optional, Union, cast
 import os
 
 from docling_core.types.doc import (
@@ -17,10 +21,11 @@ from docling_core.types.doc import (
     TableCell,
     TableData,
 )
-from aspose.cells import Workbook, WorksheetCollection, Worksheet
+import numpy as np
+from aspose.cells import LoadOptions, Workbook, WorksheetCollection, Worksheet
 from aspose.cells.drawing import Picture
 from PIL import Image as PILImage
-from pydantic import BaseModel, NonNegativeInt, PositiveInt
+from pydantic import PositiveInt
 from typing_extensions import override
 
 from docling.backend.abstract_backend import (
@@ -29,6 +34,7 @@ from docling.backend.abstract_backend import (
 )
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import settings
 
 _log = logging.getLogger(__name__)
 
@@ -50,9 +56,13 @@ class LicenseManager:
             logging.warning("=====> No valid Aspose license found. Running in free mode. Please set the ASPOSE_LICENSE_PATH environment variable!! <=====")
 
 
-class ExcelCell(BaseModel):
+class ExcelCell(NamedTuple):
     """Represents an Excel cell.
 
+    A plain tuple rather than a pydantic model: one is created per table cell,
+    and the values come straight from the worksheet, so there is nothing to
+    validate before the cell is turned into a TableCell.
+
     Attributes:
         row: The row number of the cell.
         col: The column number of the cell.
@@ -68,7 +78,88 @@ class ExcelCell(BaseModel):
     col_span: int
 
 
-class ExcelTable(BaseModel):
+class MergedAreaIndex:
+    """Index of the merged areas of a worksheet, built once per sheet.
+
+    Merged areas are stored as plain ``(start_row, start_col, end_row, end_col)``
+    tuples (0-based, inclusive) and bucketed by blocks of ``block_rows`` rows: an
+    area is listed in every block its rows touch, so a lookup only inspects the
+    areas that reach the queried row's block, however tall other areas are,
+    instead of expanding every area into per-cell entries.
+    """
+
+    block_rows: int = 16
+
+    def __init__(self, areas: list[tuple[int, int, int, int]]) -> None:
+        self.areas = sorted(areas)
+        self.buckets: dict[int, list[tuple[int, int, int, int]]] = {}
+        for area in self.areas:
+            for block in range(
+                area[0] // self.block_rows, area[2] // self.block_rows + 1
+            ):
+                self.buckets.setdefault(block, []).append(area)
+
+    @classmethod
+    def from_sheet(cls, sheet: Worksheet) -> "MergedAreaIndex":
+        """Read the merged areas of a worksheet into an index.
+
+        Args:
+            sheet: The Excel worksheet.
+
+        Returns:
+            The index of the merged areas of the worksheet.
+        """
+        areas = sheet.cells.get_merged_areas() or []
+        return cls(
+            [(a.start_row, a.start_column, a.end_row, a.end_column) for a in areas]
+        )
+
+    def find(self, row: int, col: int) -> Optional[tuple[int, int, int, int]]:
+        """Find the merged area covering a cell.
+
+        Args:
+            row: The row index of the cell (0-based).
+            col: The column index of the cell (0-based).
+
+        Returns:
+            The covering area as ``(start_row, start_col, end_row, end_col)``, or
+            None if the cell is not merged.
+        """
+        for area in self.buckets.get(row // self.block_rows, ()):
+            if area[0] <= row <= area[2] and area[1] <= col <= area[3]:
+                return area
+
+        return None
+
+
+@dataclass
+class _SheetData:
+    """Raw content of a worksheet, read from the workbook before parsing.
+
+    Holds plain Python values only, so the sheet can be parsed away from the
+    Aspose objects (and concurrently with other sheets).
+    """
+
+    name: str
+    index: int
+    texts: dict[tuple[int, int], str]
+    merged_areas: list[tuple[int, int, int, int]]
+    pictures: list[tuple[bytes, tuple[int, int, int, int]]] = field(
+        default_factory=list
+    )
+
+
+@dataclass
+class _ParsedSheet:
+    """Tables and images of a worksheet, ready to be added to a DoclingDocument."""
+
+    name: str
+    page_no: int
+    tables: list[tuple[TableData, tuple[int, int, int, int]]]
+    images: list[tuple[PILImage.Image, tuple[int, int, int, int]]]
+
+
+class ExcelTable(NamedTuple):
     """Represents an Excel table on a worksheet.
 
     Attributes:
@@ -79,11 +170,44 @@ class ExcelTable(BaseModel):
         data: The data in the table, represented as a list of ExcelCell objects.
     """
 
-    anchor: tuple[NonNegativeInt, NonNegativeInt]
+    anchor: tuple[int, int]
     num_rows: int
     num_cols: int
     data: list[ExcelCell]
 
+    def to_table_data(self, header: bool = True) -> TableData:
+        """Convert the table into a docling TableData.
+
+        Args:
+            header: Whether the first row of the table is a column header.
+
+        Returns:
+            The table data.
+        """
+        table_cells = [
+            TableCell(
+                text=text,
+                row_span=row_span,
+                col_span=col_span,
+                start_row_offset_idx=row,
+                end_row_offset_idx=row + row_span,
+                start_col_offset_idx=col,
+                end_col_offset_idx=col + col_span,
+                column_header=header and row == 0,
+                row_header=False,
+            )
+            for row, col, text, row_span, col_span in self.data
+        ]
+
+        return TableData(
+            num_rows=self.num_rows, num_cols=self.num_cols, table_cells=table_cells
+        )
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """The (left, top, right, bottom) cell bounds of the table on its sheet."""
+        col, row = self.anchor
+        return (col, row, col + self.num_cols, row + self.num_rows)
+
 
 class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBackend):
     """Backend for parsing Excel workbooks.
@@ -126,12 +250,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         self.workbook = None
         try:
             LicenseManager().apply_license()
-            if isinstance(self.path_or_stream, BytesIO):
-                self.workbook = Workbook(self.path_or_stream)
-
-            elif isinstance(self.path_or_stream, Path):
-                self.workbook = Workbook(str(self.path_or_stream))
-            
+            self.workbook = self._load_workbook()
             self.valid = self.workbook is not None
         except Exception as e:
             self.valid = False
@@ -139,6 +258,30 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
                 f"MsExcelDocumentBackend could not load document with hash {self.document_hash}"
             ) from e
 
+    def _load_workbook(
+        self, options: Optional[LoadOptions] = None
+    ) -> Optional[Workbook]:
+        """Load the workbook from the backend's path or stream.
+
+        Args:
+            options: The Aspose load options, if any.
+
+        Returns:
+            The workbook, or None if the source is neither a path nor a stream.
+        """
+        if isinstance(self.path_or_stream, BytesIO):
+            self.path_or_stream.seek(0)
+            if options is None:
+                return Workbook(self.path_or_stream)
+            return Workbook(self.path_or_stream, options)
+
+        elif isinstance(self.path_or_stream, Path):
+            if options is None:
+                return Workbook(str(self.path_or_stream))
+            return Workbook(str(self.path_or_stream), options)
+
+        return None
+
     @override
     def is_valid(self) -> bool:
         _log.debug(f"valid: {self.valid}")
@@ -193,206 +336,398 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
     def _convert_workbook(self, doc: DoclingDocument) -> DoclingDocument:
         """Parse the Excel workbook and attach its structure to a DoclingDocument.
 
+        The sheets are read from the workbook one by one. With
+        ``settings.perf.sheet_concurrency`` above 1 they are then parsed (table
+        detection, table cells and image decoding) in a thread pool, and added to
+        the document in sheet order. At most that many sheets are read ahead of
+        the one being added, so memory stays bounded by a window of sheets rather
+        than the whole workbook.
+
         Args:
             doc: A DoclingDocument object.
 
         Returns:
             A DoclingDocument object with the parsed items.
         """
- 
+
         if self.workbook is not None:
-            # Iterate over all sheets
-            for ws in self.workbook.worksheets:
-                sheet_name = ws.name
-                _log.info(f"Processing sheet: {sheet_name}")
-
-                page_no = ws.index + 1
-                page = doc.add_page(page_no=page_no, size=Size(width=0, height=0))
-
-                self.parents[0] = doc.add_group(
-                    parent=None,
-                    label=GroupLabel.SECTION,
-                    name=f"sheet: {sheet_name}",
+            workers = settings.perf.sheet_concurrency
+
+            parsed: Iterable[_ParsedSheet]
+            if workers > 1 and len(self.workbook.worksheets) > 1:
+                parsed = self._parse_concurrently(self.workbook.worksheets, workers)
+            else:
+                parsed = (
+                    self._parse_sheet(self._read_sheet(ws))
+                    for ws in self.workbook.worksheets
                 )
-                doc = self._convert_sheet(doc, ws)
-                width, height = self._find_page_size(doc, page_no)
-                page.size = Size(width=width, height=height)
+
+            for sheet in parsed:
+                doc = self._add_sheet(doc, sheet)
         else:
             _log.error("Workbook is not initialized.")
 
         return doc
 
-    def _convert_sheet(self, doc: DoclingDocument, sheet: Worksheet) -> DoclingDocument:
-        """Parse an Excel worksheet and attach its structure to a DoclingDocument.
+    def _parse_concurrently(
+        self, worksheets: WorksheetCollection, workers: int
+    ) -> Iterator[_ParsedSheet]:
+        """Parse worksheets in a thread pool, yielding them in sheet order.
+
+        Aspose objects are only touched on the calling thread, which reads the
+        next sheet while the pool parses the previous ones. A sheet is only read
+        once fewer than ``workers`` sheets are pending.
 
         Args:
-            doc: The DoclingDocument to be updated.
-            sheet: The Excel worksheet to be parsed.
+            worksheets: The worksheets of the workbook.
+            workers: The number of parsing threads.
 
         Returns:
-            The updated DoclingDocument.
+            The parsed worksheets, in sheet order.
         """
-        doc = self._find_tables_in_sheet(doc, sheet)
-        doc = self._find_images_in_sheet(doc, sheet)
-        return doc
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: deque[Future[_ParsedSheet]] = deque()
+            for ws in worksheets:
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(self._parse_sheet, self._read_sheet(ws)))
+
+            while pending:
+                yield pending.popleft().result()
 
-    def _find_tables_in_sheet(
-        self, doc: DoclingDocument, sheet: Worksheet
-    ) -> DoclingDocument:
-        """Find all tables in an Excel sheet and attach them to a DoclingDocument.
+    def _read_sheet(self, sheet: Worksheet) -> _SheetData:
+        """Read the cell texts, merged areas and pictures of a worksheet.
 
         Args:
-            doc: The DoclingDocument to be updated.
-            sheet: The Excel worksheet to be parsed.
+            sheet: The Excel worksheet.
 
         Returns:
-            The updated DoclingDocument.
+            The raw content of the worksheet.
         """
+        _log.info(f"Processing sheet: {sheet.name}")
 
-        if self.workbook is not None:
-            tables = self._find_data_tables(sheet)
-
-            for excel_table in tables:
-                origin_col = excel_table.anchor[0]
-                origin_row = excel_table.anchor[1]
-                num_rows = excel_table.num_rows
-                num_cols = excel_table.num_cols
-
-                table_data = TableData(
-                    num_rows=num_rows,
-                    num_cols=num_cols,
-                    table_cells=[],
-                )
+        texts = self._read_cell_texts(sheet)
+        merged = MergedAreaIndex.from_sheet(sheet)
 
-                for excel_cell in excel_table.data:
-                    cell = TableCell(
-                        text=excel_cell.text,
-                        row_span=excel_cell.row_span,
-                        col_span=excel_cell.col_span,
-                        start_row_offset_idx=excel_cell.row,
-                        end_row_offset_idx=excel_cell.row + excel_cell.row_span,
-                        start_col_offset_idx=excel_cell.col,
-                        end_col_offset_idx=excel_cell.col + excel_cell.col_span,
-                        column_header=excel_cell.row == 0,
-                        row_header=False,
-                    )
-                    table_data.table_cells.append(cell)
-
-                page_no = sheet.index + 1
-                doc.add_table(
-                    data=table_data,
-                    parent=self.parents[0],
-                    prov=ProvenanceItem(
-                        page_no=page_no,
-                        charspan=(0, 0),
-                        bbox=BoundingBox.from_tuple(
-                            (
-                                origin_col,
-                                origin_row,
-                                origin_col + num_cols,
-                                origin_row + num_rows,
-                            ),
-                            origin=CoordOrigin.TOPLEFT,
-                        ),
-                    ),
-                )
+        return _SheetData(
+            name=sheet.name,
+            index=sheet.index,
+            texts=texts,
+            merged_areas=merged.areas,
+            pictures=self._read_pictures(sheet),
+        )
 
-        return doc
+    @staticmethod
+    def _read_pictures(
+        sheet: Worksheet,
+    ) -> list[tuple[bytes, tuple[int, int, int, int]]]:
+        """Read the image bytes and cell anchors of the pictures of a worksheet.
 
-    def _build_merged_lookup(self, areas):
+        Args:
+            sheet: The Excel worksheet.
+
+        Returns:
+            The image bytes and (left, top, right, bottom) cell bounds of each
+            picture.
         """
-        areas: iterable of CellArea (from sheet.cells.get_merged_areas())  
-        return: dict[(r,c)] -> CellArea
+        pictures = []
+        try:
+            for pic in sheet.pictures:  # type: Picture
+                anchor = (
+                    pic.upper_left_column,
+                    pic.upper_left_row,
+                    pic.lower_right_column + 1,
+                    pic.lower_right_row + 1,
+                )
+                pictures.append((bytes(pic.data), anchor))
+        except Exception as e:
+            _log.error(f"could not extract the image from excel sheets: {e}")
+
+        return pictures
+
+    @staticmethod
+    def _decode_images(
+        pictures: list[tuple[bytes, tuple[int, int, int, int]]],
+    ) -> list[tuple[PILImage.Image, tuple[int, int, int, int]]]:
+        """Decode picture bytes into PIL images, skipping unreadable ones.
+
+        Args:
+            pictures: The image bytes and cell bounds of each picture.
+
+        Returns:
+            The decoded image and cell bounds of each readable picture.
         """
-        lookup = {}
-        for a in areas:
-            for r in range(a.start_row, a.end_row + 1):
-                for c in range(a.start_column, a.end_column + 1):
-                    lookup[(r, c)] = a
-        return lookup
+        images = []
+        for img_bytes, anchor in pictures:
+            try:
+                pil_image = PILImage.open(BytesIO(img_bytes))
+                pil_image.load()
+            except Exception as e:
+                _log.error(f"could not extract the image from excel sheets: {e}")
+                continue
+            images.append((pil_image, anchor))
 
-    def _get_bounds_from_area(self, area):
-        """Compute (row_span, col_span) and (end_row, end_col) for a CellArea"""
-        row_span = area.end_row - area.start_row + 1
-        col_span = area.end_column - area.start_column + 1
-        return row_span, col_span, area.end_row, area.end_column
+        return images
+
+    def _parse_sheet(self, sheet: _SheetData) -> _ParsedSheet:
+        """Find the tables and decode the images of a worksheet.
+
+        Works on the raw sheet content only, so several sheets can be parsed
+        concurrently.
+
+        Args:
+            sheet: The raw content of the worksheet.
 
-    # -------------------- 1) Find table bottom --------------------
-    def _find_table_bottom(self, sheet: Worksheet, start_row: int, start_col: int) -> int:
+        Returns:
+            The tables and images of the worksheet.
         """
-        Equivalent to _find_table_bottom in openpyxl version:
-        Starting from the row after (start_row, start_col), scan downward. 
-        Stop when an empty cell (not in a merged area) is found.
-        If inside a merged area, extend the bottom to the merged area's end_row.
-        Note: Aspose uses 0-based indices.
+        merged = MergedAreaIndex(sheet.merged_areas)
+
+        tables = [
+            (excel_table.to_table_data(), excel_table.bounds())
+            for excel_table in self._find_data_tables(sheet.texts, merged)
+        ]
+
+        return _ParsedSheet(
+            name=sheet.name,
+            page_no=sheet.index + 1,
+            tables=tables,
+            images=self._decode_images(sheet.pictures),
+        )
+
+    def _add_sheet(self, doc: DoclingDocument, sheet: _ParsedSheet) -> DoclingDocument:
+        """Attach a parsed worksheet to a DoclingDocument as a page.
+
+        Args:
+            doc: The DoclingDocument to be updated.
+            sheet: The parsed worksheet.
+
+        Returns:
+            The updated DoclingDocument.
         """
-        max_row = start_row
+        page_no = sheet.page_no
+        page = doc.add_page(page_no=page_no, size=Size(width=0, height=0))
 
-        cells = sheet.cells
-        last_row = cells.max_data_row if hasattr(cells, "max_data_row") else cells.max_row
+        self.parents[0] = doc.add_group(
+            parent=None,
+            label=GroupLabel.SECTION,
+            name=f"sheet: {sheet.name}",
+        )
 
-        areas = list(cells.get_merged_areas() or [])
-        merged_lookup = self._build_merged_lookup(areas)
+        for table_data, bounds in sheet.tables:
+            doc.add_table(
+                data=table_data,
+                parent=self.parents[0],
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    charspan=(0, 0),
+                    bbox=BoundingBox.from_tuple(bounds, origin=CoordOrigin.TOPLEFT),
+                ),
+            )
 
-        for ri in range(start_row + 1, last_row + 1):
-            cell = cells.get(ri, start_col)
-            area = merged_lookup.get((ri, start_col))
+        for pil_image, anchor in sheet.images:
+            doc.add_picture(
+                parent=self.parents[0],
+                image=ImageRef.from_pil(image=pil_image, dpi=72),
+                caption=None,
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    charspan=(0, 0),
+                    bbox=BoundingBox.from_tuple(anchor, origin=CoordOrigin.TOPLEFT),
+                ),
+            )
 
-            if (cell is None or cell.value is None) and area is None:
-                break
+        width, height = self._find_page_size(doc, page_no)
+        page.size = Size(width=width, height=height)
 
-            if area is not None:
-                _, _, end_r, _ = self._get_bounds_from_area(area)
-                max_row = max(max_row, end_r)
-            else:
-                max_row = ri
+        return doc
 
-        return max_row
+    def _get_bounds_from_area(self, area):
+        """Compute (row_span, col_span) and (end_row, end_col) for a merged area"""
+        start_row, start_col, end_row, end_col = area
+        row_span = end_row - start_row + 1
+        col_span = end_col - start_col + 1
+        return row_span, col_span, end_row, end_col
 
-    # -------------------- 2) Find table right --------------------
-    def _find_table_right(self, sheet: Worksheet, start_row: int, start_col: int) -> int:
-        """
-        Equivalent to _find_table_right in openpyxl version:
-        Scan to the right from the starting column. 
-        Stop when an empty cell (not in a merged area) is found.
-        If inside a merged area, extend to the merged area's end_column.
-        """
-        max_col = start_col
+    def _read_cell_texts(self, sheet: Worksheet) -> dict[tuple[int, int], str]:
+        """Read the text of every non-empty cell of a worksheet in one pass.
 
-        cells = sheet.cells
-        last_col = cells.max_data_column if hasattr(cells, "max_data_column") else cells.max_column
+        The cells enumerator only visits cells that exist in the worksheet, so the
+        cost follows the populated cells rather than the sheet's bounding box.
 
-        areas = list(cells.get_merged_areas() or [])
-        merged_lookup = self._build_merged_lookup(areas)
+        Args:
+            sheet: The Excel worksheet.
 
-        for cj in range(start_col + 1, last_col + 1):
-            cell = cells.get(start_row, cj)
-            area = merged_lookup.get((start_row, cj))
+        Returns:
+            A mapping of (row, col) (0-based) to the cell text.
+        """
+        texts: dict[tuple[int, int], str] = {}
+        for cell in sheet.cells:
+            value = cell.value
+            if value is not None:
+                texts[(cell.row, cell.column)] = str(value)
 
-            if (cell is None or cell.value is None) and area is None:
-                break
+        return texts
 
-            if area is not None:
-                _, _, _, end_c = self._get_bounds_from_area(area)
-                max_col = max(max_col, end_c)
-            else:
-                max_col = cj
+    @staticmethod
+    def _label_tables(
+        coords: np.ndarray, merged: MergedAreaIndex
+    ) -> list[tuple[int, int, int, int]]:
+        """Group occupied cells into tables by connected-component labelling.
 
-        return max_col
+        Cells are connected to their non-empty neighbours above, below, left and
+        right. A merged area counts as occupied and connects every cell inside or
+        next to it. Only the occupied cells are labelled, so the work does not
+        depend on how far apart they are on the sheet.
 
-    # -------------------- 3) Collect data + spans --------------------
-    def _find_table_bounds(self, sheet: Worksheet, start_row: int, start_col: int):
+        Args:
+            coords: The (row, col) of every non-empty cell, shape (n, 2).
+            merged: The merged areas of the worksheet.
+
+        Returns:
+            The bounds (start_row, start_col, end_row, end_col) of each table,
+            inclusive, in row-major order of their upper-left corner.
         """
-        Returns: (ExcelTable, visited_cells)
-        Keeps the same structure as your existing version:
-        Calculates (num_rows, num_cols) and each cell's row_span/col_span.
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        n = len(coords)
+        if n == 0:
+            return []
+
+        areas = np.array(merged.areas, dtype=np.int64).reshape(-1, 4)
+
+        # Row-major keys with a spare column, so col + 1 never wraps to a new row
+        width = int(max(coords[:, 1].max(), areas[:, 3].max(initial=0))) + 2
+        keys = coords[:, 0] * width + coords[:, 1]
+        order = np.argsort(keys)
+        keys = keys[order]
+
+        def neighbours(offset: int) -> tuple[np.ndarray, np.ndarray]:
+            pos = np.minimum(np.searchsorted(keys, keys + offset), n - 1)
+            found = keys[pos] == keys + offset
+            return order[found], order[pos[found]]
+
+        sources = []
+        targets = []
+        for offset in (1, width):
+            src, dst = neighbours(offset)
+            sources.append(src)
+            targets.append(dst)
+
+        # Merged areas are extra nodes n, n + 1, ... joined to the cells they
+        # contain or touch
+        for j, (r0, c0, r1, c1) in enumerate(areas.tolist()):
+            spans = [(r, c0 - 1, c1 + 1) for r in range(r0, r1 + 1)]
+            spans += [(r0 - 1, c0, c1), (r1 + 1, c0, c1)]
+            for r, lo, hi in spans:
+                start = np.searchsorted(keys, r * width + lo)
+                stop = np.searchsorted(keys, r * width + hi, side="right")
+                sources.append(order[start:stop])
+                targets.append(np.full(stop - start, n + j))
+
+        src = np.concatenate(sources)
+        dst = np.concatenate(targets)
+        size = n + len(areas)
+        graph = coo_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), (size, size))
+        _, labels = connected_components(graph, directed=False)
+
+        # Bounds of each component over its cells and merged areas
+        count = labels.max() + 1
+        top = np.full(count, np.iinfo(np.int64).max)
+        left = np.full(count, np.iinfo(np.int64).max)
+        bottom = np.full(count, -1)
+        right = np.full(count, -1)
+
+        cell_labels = labels[:n]
+        np.minimum.at(top, cell_labels, coords[:, 0])
+        np.minimum.at(left, cell_labels, coords[:, 1])
+        np.maximum.at(bottom, cell_labels, coords[:, 0])
+        np.maximum.at(right, cell_labels, coords[:, 1])
+
+        # Merged areas without any cell (empty merges) do not make a table
+        has_cells = bottom >= 0
+
+        area_labels = labels[n:]
+        np.minimum.at(top, area_labels, areas[:, 0])
+        np.minimum.at(left, area_labels, areas[:, 1])
+        np.maximum.at(bottom, area_labels, areas[:, 2])
+        np.maximum.at(right, area_labels, areas[:, 3])
+
+        bounds = np.stack([top, left, bottom, right], axis=1)[has_cells]
+
+        return MsExcelDocumentBackend._merge_overlapping(
+            [tuple(b) for b in bounds.tolist()]
+        )
+
+    @staticmethod
+    def _merge_overlapping(
+        bounds: list[tuple[int, int, int, int]],
+    ) -> list[tuple[int, int, int, int]]:
+        """Merge table bounds whose rectangles intersect.
+
+        A component that lies inside the bounding rectangle of another one (such
+        as a cell in the hollow of an L-shaped block) would otherwise become its
+        own table and also appear in the larger one. Rectangles are swept in row
+        order, and the sweep is repeated until no two of them intersect, since a
+        merge can widen a rectangle into one that was already passed.
+
+        Args:
+            bounds: The bounds (start_row, start_col, end_row, end_col) of each
+                component, inclusive.
+
+        Returns:
+            The merged bounds, in row-major order of their upper-left corner.
         """
-        max_row = self._find_table_bottom(sheet, start_row, start_col)
-        max_col = self._find_table_right(sheet, start_row, start_col)
+        boxes = sorted(bounds)
+        while True:
+            done: list[tuple[int, int, int, int]] = []
+            active: list[tuple[int, int, int, int]] = []
+            for box in boxes:
+                # Active boxes ending above this one cannot meet any later box
+                done += [a for a in active if a[2] < box[0]]
+                active = [a for a in active if a[2] >= box[0]]
+
+                hit = True
+                while hit:
+                    hit = False
+                    for i, a in enumerate(active):
+                        if a[1] <= box[3] and box[1] <= a[3] and a[0] <= box[2]:
+                            box = (
+                                min(a[0], box[0]),
+                                min(a[1], box[1]),
+                                max(a[2], box[2]),
+                                max(a[3], box[3]),
+                            )
+                            del active[i]
+                            hit = True
+                            break
+
+                active.append(box)
+
+            merged = sorted(done + active)
+            if len(merged) == len(boxes):
+                return merged
+
+            boxes = merged
+
+    def _find_table_bounds(
+        self,
+        texts: dict[tuple[int, int], str],
+        merged: MergedAreaIndex,
+        bounds: tuple[int, int, int, int],
+    ) -> ExcelTable:
+        """Collect the cells of a table and their spans.
 
-        cells = sheet.cells
-        areas = list(cells.get_merged_areas() or [])
-        merged_lookup = self._build_merged_lookup(areas)
+        Args:
+            texts: The text of the non-empty cells of the worksheet.
+            merged: The merged areas of the worksheet.
+            bounds: The table bounds (start_row, start_col, end_row, end_col).
+
+        Returns:
+            The table, with one ExcelCell per unmerged cell or merged area.
+        """
+        start_row, start_col, max_row, max_col = bounds
 
         visited_cells = set()
         data = []
@@ -402,8 +737,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
                 if (ri, cj) in visited_cells:
                     continue
 
-                cell = cells.get(ri, cj)
-                area = merged_lookup.get((ri, cj))
+                area = merged.find(ri, cj)
                 if area is not None:
                     row_span, col_span, _, _ = self._get_bounds_from_area(area)
                 else:
@@ -411,83 +745,48 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
                 data.append(
                     ExcelCell(
-                        row=ri - start_row,
-                        col=cj - start_col,
-                        text="" if (cell is None or cell.value is None) else str(cell.value),
-                        row_span=row_span,
-                        col_span=col_span,
+                        ri - start_row,
+                        cj - start_col,
+                        texts.get((ri, cj), ""),
+                        row_span,
+                        col_span,
                     )
                 )
 
-                for r in range(ri, ri + row_span):
-                    for c in range(cj, cj + col_span):
-                        visited_cells.add((r, c))
+                if row_span > 1 or col_span > 1:
+                    for r in range(ri, ri + row_span):
+                        for c in range(cj, cj + col_span):
+                            visited_cells.add((r, c))
 
-        table = ExcelTable(
+        return ExcelTable(
             anchor=(start_col, start_row),
             num_rows=max_row - start_row + 1,
             num_cols=max_col - start_col + 1,
             data=data,
         )
-        return table, visited_cells
-
-    def _find_data_tables(self, sheet: Worksheet) -> list:
-        tables = []
-        visited = set()
-
-        cells = sheet.cells
-        last_row = cells.max_data_row if hasattr(cells, "max_data_row") else cells.max_row
-        last_col = cells.max_data_column if hasattr(cells, "max_data_column") else cells.max_column
 
-        for ri in range(0, last_row + 1):
-            for cj in range(0, last_col + 1):
-                if (ri, cj) in visited:
-                    continue
-                cell = cells.get(ri, cj)
-                if cell is None or cell.value is None:
-                    continue
+    def _find_data_tables(
+        self, texts: dict[tuple[int, int], str], merged: MergedAreaIndex
+    ) -> list[ExcelTable]:
+        """Find the tables of a worksheet.
 
-                table, used = self._find_table_bounds(sheet, ri, cj)
-                visited.update(used)
-                tables.append(table)
+        A table is a group of non-empty (or merged) cells connected through their
+        edges, spanning the bounding rectangle of the group. Groups whose
+        rectangles intersect form one table.
 
-        return tables
-
-    def _find_images_in_sheet(self, doc: DoclingDocument, sheet) -> DoclingDocument:
-        """Find images in the Excel sheet and attach them to the DoclingDocument."""
-
-        if self.workbook is not None:
-            try:
-                pictures = sheet.pictures
-                page_no = sheet.index + 1
-
-                for pic in pictures:  # type: Picture
-                    img_bytes = pic.data
-                    pil_image = PILImage.open(BytesIO(img_bytes))
-
-                    anchor = (
-                        pic.upper_left_column,
-                        pic.upper_left_row,
-                        pic.lower_right_column + 1,
-                        pic.lower_right_row + 1,
-                    )
+        Args:
+            texts: The text of the non-empty cells of the worksheet.
+            merged: The merged areas of the worksheet.
 
-                    doc.add_picture(
-                        parent=self.parents[0],
-                        image=ImageRef.from_pil(image=pil_image, dpi=72),
-                        caption=None,
-                        prov=ProvenanceItem(
-                            page_no=page_no,
-                            charspan=(0, 0),
-                            bbox=BoundingBox.from_tuple(
-                                anchor, origin=CoordOrigin.TOPLEFT
-                            ),
-                        ),
-                    )
-            except Exception as e:
-                _log.error(f"could not extract the image from excel sheets: {e}")
+        Returns:
+            The tables, in row-major order of their upper-left cell.
+        """
+        coords = np.array(list(texts), dtype=np.int64).reshape(-1, 2)
 
-        return doc
+        return [
+            self._find_table_bounds(texts, merged, bounds)
+            for bounds in self._label_tables(coords, merged)
+        ]
 
     @staticmethod
     def _find_page_size(
@@ -0,0 +1,334 @@
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from aspose.cells import (
+    Cell,
+    LightCellsDataHandler,
+    LoadDataFilterOptions,
+    LoadFilter,
+    LoadOptions,
+    Row,
+    Workbook,
+    Worksheet,
+)
+from docling_core.types.doc import (
+    BoundingBox,
+    CoordOrigin,
+    DoclingDocument,
+    GroupLabel,
+    ImageRef,
+    ProvenanceItem,
+    Size,
+)
+from typing_extensions import override
+
+from docling.backend.msexcel_backend import (
+    ExcelCell,
+    ExcelTable,
+    MergedAreaIndex,
+    MsExcelDocumentBackend,
+)
+from docling.datamodel.document import InputDocument
+
+_log = logging.getLogger(__name__)
+
+
+class _StreamingTableHandler(LightCellsDataHandler):
+    """Turn the cells streamed by an Aspose light-cells load into tables.
+
+    Cells are handed over one by one in row order and are not kept by Aspose. A
+    table is a run of consecutive rows holding values (or covered by a merged area
+    anchored in the table), across the columns those rows use. Only the rows of
+    the current chunk are held; a chunk is added to the document as soon as it
+    reaches ``max_rows`` rows or its table ends.
+    """
+
+    def __init__(
+        self,
+        doc: DoclingDocument,
+        merged: dict[int, MergedAreaIndex],
+        max_rows: int,
+        max_chunks: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        self.doc = doc
+        self.merged = merged
+        self.max_rows = max_rows
+        self.max_chunks = max_chunks
+
+        # Section group of every sheet seen, by sheet index
+        self.groups: dict[int, Any] = {}
+
+        self._sheet: Optional[int] = None
+        self._sheet_merged = MergedAreaIndex([])
+
+        # Current row and the rows of the current chunk
+        self._row = -1
+        self._values: dict[int, str] = {}
+        self._chunk: list[tuple[int, dict[int, str]]] = []
+
+        # Current table
+        self._last_row = -1
+        self._merge_end = -1
+        self._chunk_no = 0
+        self._dropped_rows = 0
+
+    @override
+    def start_sheet(self, sheet: Worksheet) -> bool:
+        self.finish()
+
+        self._sheet = sheet.index
+        self._sheet_merged = self.merged.get(sheet.index, MergedAreaIndex([]))
+
+        _log.info(f"Processing sheet: {sheet.name}")
+        self.doc.add_page(page_no=sheet.index + 1, size=Size(width=0, height=0))
+        self.groups[sheet.index] = self.doc.add_group(
+            parent=None,
+            label=GroupLabel.SECTION,
+            name=f"sheet: {sheet.name}",
+        )
+        return True
+
+    @override
+    def start_row(self, row_index: int) -> bool:
+        return True
+
+    @override
+    def process_row(self, row: Row) -> bool:
+        return True
+
+    @override
+    def start_cell(self, column_index: int) -> bool:
+        return True
+
+    @override
+    def process_cell(self, cell: Cell) -> bool:
+        value = cell.value
+        if value is not None:
+            row = cell.row
+            if row != self._row:
+                self._end_row()
+                self._row = row
+            self._values[cell.column] = str(value)
+
+        # Do not keep the cell in the worksheet
+        return False
+
+    def finish(self) -> None:
+        """Add the pending rows of the current sheet to the document."""
+        self._end_row()
+        self._end_table()
+        self._row = -1
+
+    def _end_row(self) -> None:
+        if not self._values:
+            return
+
+        row = self._row
+        if self._chunk_no or self._chunk:
+            if row > max(self._last_row, self._merge_end) + 1:
+                self._end_table()
+
+        for col in self._values:
+            area = self._sheet_merged.find(row, col)
+            if area is not None and area[0] == row and area[1] == col:
+                self._merge_end = max(self._merge_end, area[2])
+
+        self._chunk.append((row, self._values))
+        self._values = {}
+        self._last_row = row
+
+        if len(self._chunk) >= self.max_rows:
+            self._flush_chunk(last_row=row)
+
+    def _end_table(self) -> None:
+        if self._chunk:
+            self._flush_chunk(last_row=max(self._last_row, self._merge_end))
+
+        if self._dropped_rows:
+            _log.warning(
+                f"Truncated a table of sheet {self._sheet} after "
+                f"{self.max_chunks} chunks of {self.max_rows} rows, "
+                f"dropping {self._dropped_rows} rows"
+            )
+
+        self._last_row = -1
+        self._merge_end = -1
+        self._chunk_no = 0
+        self._dropped_rows = 0
+
+    def _flush_chunk(self, last_row: int) -> None:
+        chunk = self._chunk
+        self._chunk = []
+
+        if self.max_chunks is not None and self._chunk_no >= self.max_chunks:
+            self._dropped_rows += len(chunk)
+            return
+
+        # Anchor cells in sheet coordinates; cells covered by a merged area are
+        # skipped
+        anchors = []
+        for row, values in chunk:
+            for col in sorted(values):
+                area = self._sheet_merged.find(row, col)
+                if area is None:
+                    anchors.append(ExcelCell(row, col, values[col], 1, 1))
+                elif area[0] == row and area[1] == col:
+                    row_span = min(area[2], last_row) - row + 1
+                    col_span = area[3] - col + 1
+                    anchors.append(ExcelCell(row, col, values[col], row_span, col_span))
+
+        # Only values in cells covered by merged areas anchored elsewhere
+        if not anchors:
+            return
+
+        first_row = chunk[0][0]
+        header = self._chunk_no == 0
+        self._chunk_no += 1
+
+        first_col = min(cell.col for cell in anchors)
+        last_col = max(cell.col + cell.col_span - 1 for cell in anchors)
+
+        table = ExcelTable(
+            anchor=(first_col, first_row),
+            num_rows=last_row - first_row + 1,
+            num_cols=last_col - first_col + 1,
+            data=[
+                cell._replace(row=cell.row - first_row, col=cell.col - first_col)
+                for cell in anchors
+            ],
+        )
+
+        self.doc.add_table(
+            data=table.to_table_data(header=header),
+            parent=self.groups[self._sheet],
+            prov=ProvenanceItem(
+                page_no=self._sheet + 1,
+                charspan=(0, 0),
+                bbox=BoundingBox.from_tuple(table.bounds(), origin=CoordOrigin.TOPLEFT),
+            ),
+        )
+
+
+class MsExcelStreamingDocumentBackend(MsExcelDocumentBackend):
+    """Backend for parsing large Excel workbooks with bounded memory.
+
+    Unlike MsExcelDocumentBackend, the cell grid is never loaded: the workbook
+    structure (sheets and merged areas) is loaded first, then the cells are
+    streamed through an Aspose light-cells load and turned into tables on the fly.
+
+    Tables are runs of consecutive non-empty rows, across the columns they use
+    (side-by-side blocks separated only by empty columns form one table). Tables
+    longer than ``max_table_rows`` are split into chunks of at most that many rows,
+    each added as its own table whose provenance bounding box is the chunk's cell
+    range on the sheet; only the first chunk has a column header. When
+    ``max_table_chunks`` is set, the rows after that many chunks are dropped and a
+    warning is logged. Both limits can be passed to the constructor or set on a
+    subclass. Empty cells are not added as table cells.
+    """
+
+    max_table_rows: int = 10_000
+    max_table_chunks: Optional[int] = None
+
+    @override
+    def __init__(
+        self,
+        in_doc: "InputDocument",
+        path_or_stream: Union[BytesIO, Path],
+        max_table_rows: Optional[int] = None,
+        max_table_chunks: Optional[int] = None,
+    ) -> None:
+        """Initialize the MsExcelStreamingDocumentBackend object.
+
+        Parameters:
+            in_doc: The input document object.
+            path_or_stream: The path or stream to the Excel file.
+            max_table_rows: The most rows of a table chunk; None keeps the class
+                default.
+            max_table_chunks: The most chunks kept per table; None keeps the class
+                default.
+
+        Raises:
+            ValueError: max_table_rows is below 1.
+            RuntimeError: An error occurred parsing the file.
+        """
+        if max_table_rows is not None:
+            if max_table_rows < 1:
+                raise ValueError("max_table_rows must be at least 1")
+            self.max_table_rows = max_table_rows
+        if max_table_chunks is not None:
+            self.max_table_chunks = max_table_chunks
+
+        super().__init__(in_doc, path_or_stream)
+
+    @override
+    def _load_workbook(
+        self, options: Optional[LoadOptions] = None
+    ) -> Optional[Workbook]:
+        if options is None:
+            # Sheets and merged areas only; the cells are streamed in convert
+            options = LoadOptions()
+            options.load_filter = LoadFilter(LoadDataFilterOptions.MERGED_AREA)
+
+        return super()._load_workbook(options)
+
+    @override
+    def _convert_workbook(self, doc: DoclingDocument) -> DoclingDocument:
+        """Stream the Excel workbook and attach its structure to a DoclingDocument.
+
+        Args:
+            doc: A DoclingDocument object.
+
+        Returns:
+            A DoclingDocument object with the parsed items.
+        """
+        if self.workbook is None:
+            _log.error("Workbook is not initialized.")
+            return doc
+
+        merged = {
+            ws.index: MergedAreaIndex.from_sheet(ws) for ws in self.workbook.worksheets
+        }
+
+        handler = _StreamingTableHandler(
+            doc, merged, self.max_table_rows, self.max_table_chunks
+        )
+        options = LoadOptions()
+        options.light_cells_data_handler = handler
+
+        # Cells are not kept, so this workbook only holds the pictures
+        workbook = self._load_workbook(options)
+        handler.finish()
+
+        for ws in workbook.worksheets:
+            page_no = ws.index + 1
+            if ws.index not in handler.groups:
+                # A sheet the handler was not called for
+                doc.add_page(page_no=page_no, size=Size(width=0, height=0))
+                handler.groups[ws.index] = doc.add_group(
+                    parent=None,
+                    label=GroupLabel.SECTION,
+                    name=f"sheet: {ws.name}",
+                )
+
+            images = self._decode_images(self._read_pictures(ws))
+            for pil_image, anchor in images:
+                doc.add_picture(
+                    parent=handler.groups[ws.index],
+                    image=ImageRef.from_pil(image=pil_image, dpi=72),
+                    caption=None,
+                    prov=ProvenanceItem(
+                        page_no=page_no,
+                        charspan=(0, 0),
+                        bbox=BoundingBox.from_tuple(anchor, origin=CoordOrigin.TOPLEFT),
+                    ),
+                )
+
+        for page_no, page in doc.pages.items():
+            width, height = self._find_page_size(doc, page_no)
+            page.size = Size(width=width, height=height)
+
+        return doc
@@ -30,6 +30,7 @@ class BatchConcurrencySettings(BaseModel):
     doc_batch_concurrency: int = 1  # Number of parallel threads processing documents. Warning: Experimental! No benefit expected without free-threaded python.
     page_batch_size: int = 4  # Number of pages processed in one batch.
     page_batch_concurrency: int = 1  # Currently unused.
+    sheet_concurrency: int = 1  # Number of parallel threads parsing the sheets of one spreadsheet (MS Excel backend). Warning: No benefit measured without free-threaded python, see docs/examples/msexcel_sheet_concurrency_benchmark.py.
     elements_batch_size: int = (
         16  # Number of elements processed in one batch, in enrichment models.
     )
@@ -0,0 +1,121 @@
+from io import BytesIO
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from aspose.cells import SaveFormat, Workbook
+from docling_core.types.doc import DoclingDocument
+from PIL import Image as PILImage
+
+from docling.backend.msexcel_backend import MergedAreaIndex, MsExcelDocumentBackend
+from docling.datamodel.settings import settings
+
+
+def _tables(cells, areas=()):
+    coords = np.array(cells, dtype=np.int64).reshape(-1, 2)
+    return MsExcelDocumentBackend._label_tables(coords, MergedAreaIndex(list(areas)))
+
+
+def test_merged_area_index_find():
+    index = MergedAreaIndex(
+        [
+            (0, 0, 0, 1),  # header spanning two columns
+            (2, 3, 5, 3),  # short vertical merge
+            (0, 5, 9_999, 5),  # full-height sidebar
+        ]
+    )
+
+    assert index.find(0, 1) == (0, 0, 0, 1)
+    assert index.find(0, 2) is None
+    assert index.find(5, 3) == (2, 3, 5, 3)
+    assert index.find(6, 3) is None
+    assert index.find(9_999, 5) == (0, 5, 9_999, 5)
+    assert MergedAreaIndex([]).find(0, 0) is None
+
+    # The tall area does not widen the lookups of other rows
+    assert index.buckets[9_999 // index.block_rows] == [(0, 5, 9_999, 5)]
+
+
+def test_label_tables_separates_disconnected_blocks():
+    cells = [(0, 0), (0, 1), (1, 0), (1, 1), (0, 4), (5, 0), (5, 1)]
+
+    assert _tables(cells) == [(0, 0, 1, 1), (0, 4, 0, 4), (5, 0, 5, 1)]
+
+    # A merged area bridges the gap between two blocks
+    assert _tables(cells, [(2, 0, 4, 0)]) == [(0, 0, 5, 1), (0, 4, 0, 4)]
+
+
+def test_label_tables_merges_components_inside_another_table():
+    # L-shaped block with a detached cell in its bounding box
+    cells = [(0, 0), (0, 1), (0, 2), (1, 0), (2, 0), (2, 2)]
+
+    assert _tables(cells) == [(0, 0, 2, 2)]
+
+    # The inner block sticks out, and the widened table then overlaps a cell
+    # above it that the row sweep had already passed
+    cells = [(0, 0), (0, 1), (0, 2), (1, 0), (2, 0)]
+    cells += [(2, 2), (3, 2), (3, 3), (3, 4), (0, 4), (0, 7)]
+
+    assert _tables(cells) == [(0, 0, 3, 4), (0, 7, 0, 7)]
+
+
+def _workbook(sheets: int) -> bytes:
+    """An in-memory workbook with a few tables, a merged header and a picture
+    on each sheet."""
+    wb = Workbook()
+    for s in range(sheets):
+        ws = wb.worksheets[0] if s == 0 else wb.worksheets[wb.worksheets.add()]
+        ws.name = f"Sheet{s}"
+        cells = ws.cells
+        for r in range(20 + s):
+            for c in range(4):
+                cells.get(r, c).put_value(f"{s}:{r}:{c}")
+        cells.merge(0, 0, 1, 2)
+        cells.get(25, 6).put_value(f"note {s}")
+
+        png = BytesIO()
+        PILImage.new("RGB", (8 + s, 8), (s * 40, 0, 0)).save(png, "PNG")
+        ws.pictures.add(30, 1, BytesIO(png.getvalue()))
+
+    out = BytesIO()
+    wb.save(out, SaveFormat.XLSX)
+    return out.getvalue()
+
+
+def _convert(data: bytes) -> DoclingDocument:
+    in_doc = mock.Mock()
+    in_doc.file = Path("test.xlsx")
+    backend = MsExcelDocumentBackend(in_doc, BytesIO(data))
+    return backend._convert_workbook(DoclingDocument(name="test"))
+
+
+def test_concurrent_sheets_match_the_serial_document(monkeypatch):
+    data = _workbook(sheets=5)
+
+    serial = _convert(data)
+
+    added = []
+    read = []
+    add_sheet = MsExcelDocumentBackend._add_sheet
+    read_sheet = MsExcelDocumentBackend._read_sheet
+
+    def recording_read(self, sheet):
+        read.append(sheet.name)
+        return read_sheet(self, sheet)
+
+    def recording_add(self, doc, sheet):
+        # Sheets read but not yet added when this one is added
+        added.append(len(read) - len(added))
+        return add_sheet(self, doc, sheet)
+
+    monkeypatch.setattr(settings.perf, "sheet_concurrency", 2)
+    monkeypatch.setattr(MsExcelDocumentBackend, "_read_sheet", recording_read)
+    monkeypatch.setattr(MsExcelDocumentBackend, "_add_sheet", recording_add)
+
+    concurrent = _convert(data)
+
+    assert len(serial.tables) >= 10 and len(serial.pictures) == 5
+    assert concurrent.export_to_dict() == serial.export_to_dict()
+
+    # The read-ahead is bounded by the number of workers
+    assert max(added) <= 2
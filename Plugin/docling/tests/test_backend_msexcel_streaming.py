@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from docling_core.types.doc import DoclingDocument
+
+from docling.backend.msexcel_backend import MergedAreaIndex
+from docling.backend.msexcel_streaming_backend import _StreamingTableHandler
+
+
+def _stream(rows, merged=(), max_rows=10_000, max_chunks=None):
+    """Feed {row: {col: value}} to a handler as one sheet, in row order."""
+    doc = DoclingDocument(name="test")
+    handler = _StreamingTableHandler(
+        doc, {0: MergedAreaIndex(list(merged))}, max_rows, max_chunks
+    )
+
+    handler.start_sheet(SimpleNamespace(index=0, name="Sheet1"))
+    for row in sorted(rows):
+        for col, value in sorted(rows[row].items()):
+            handler.process_cell(SimpleNamespace(row=row, column=col, value=value))
+    handler.finish()
+
+    return doc
+
+
+def _bounds(doc):
+    return [table.prov[0].bbox.as_tuple() for table in doc.tables]
+
+
+def test_long_tables_are_split_into_chunks():
+    rows = {r: {0: f"a{r}", 1: f"b{r}"} for r in range(5)}
+    rows[8] = {3: "other"}
+
+    doc = _stream(rows, max_rows=2)
+
+    assert _bounds(doc) == [
+        (0, 0, 2, 2),
+        (0, 2, 2, 4),
+        (0, 4, 2, 5),
+        (3, 8, 4, 9),
+    ]
+    assert [table.data.num_rows for table in doc.tables] == [2, 2, 1, 1]
+
+    # Only the first chunk of a table has a column header
+    headers = [
+        any(cell.column_header for cell in table.data.table_cells)
+        for table in doc.tables
+    ]
+    assert headers == [True, False, False, True]
+
+
+def test_tables_are_truncated_after_max_chunks(caplog):
+    rows = {r: {0: str(r)} for r in range(7)}
+
+    doc = _stream(rows, max_rows=2, max_chunks=2)
+
+    assert _bounds(doc) == [(0, 0, 1, 2), (0, 2, 1, 4)]
+    assert "dropping 3 rows" in caplog.text
+
+
+def test_chunk_of_merged_cells_only_is_skipped():
+    # The second chunk only holds a value inside the merged area anchored in the
+    # first one
+    rows = {0: {0: "head", 1: "x"}, 1: {1: "y"}, 2: {0: "inner"}}
+
+    doc = _stream(rows, merged=[(0, 0, 2, 0)], max_rows=2)
+
+    assert _bounds(doc) == [(0, 0, 2, 2)]
+    assert doc.tables[0].data.table_cells[0].row_span == 2